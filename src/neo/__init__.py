@@ -1,6 +1,8 @@
 """Neo - A self-improving code reasoning engine with persistent semantic memory."""
 
-from neo.cli import CodeSuggestion, PlanStep, SimulationTrace, StaticCheckResult
+# Imported from neo.models, not neo.cli (which re-exports them): `import neo.adapters`
+# would otherwise load the whole CLI, engine and subcommand graph first.
+from neo.models import CodeSuggestion, PlanStep, SimulationTrace, StaticCheckResult
 
 __version__ = "0.43.0"
 
@@ -2,6 +2,8 @@
 LM Adapter implementations for OpenAI, Anthropic, and local models.
 """
 
+import asyncio
+import contextlib
 import os
 import json
 import logging
@@ -11,7 +13,7 @@ import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # Load environment variables from .env file
 try:
@@ -20,7 +22,9 @@ try:
 except ImportError:
     pass
 
+from neo import fastjson
 from neo.models import LMAdapter
+from neo.retry import call_with_retry, status_of
 
 logger = logging.getLogger(__name__)
 
@@ -150,6 +154,18 @@ class _ModelParamCompat:
 _PARAM_COMPAT = _ModelParamCompat()
 
 
+# Connection-pool sizing for the adapters that speak raw HTTP (the OpenAI
+# /v1/responses branch, Ollama). Neo's own fan-out is single digits
+# (`generate_batch` caps at 8 in flight), so 16 idle keep-alive sockets per
+# host covers it with headroom; the hard cap only bounds a runaway caller.
+_HTTP_POOL_KEEPALIVE = 16
+_HTTP_POOL_MAX = 32
+_HTTP_KEEPALIVE_EXPIRY_S = 60.0
+
+# A prewarm that can't connect this fast is not saving the first call anything.
+_PREWARM_TIMEOUT_S = 5.0
+
+
 def _chat_completion_resilient(client, kwargs: dict, provider: str):
     """Call ``client.chat.completions.create(**kwargs)``, recovering from the
     reasoning-model parameter rejections described above.
@@ -215,6 +231,42 @@ def _chat_completion_resilient(client, kwargs: dict, provider: str):
             raise
 
 
+def _iter_chat_deltas(stream, on_usage=None) -> Iterator[str]:
+    """Text deltas from a ``stream=True`` chat-completions response.
+
+    Chunks with no choices (the trailing usage-only chunk sent under
+    ``stream_options={"include_usage": True}``) or an empty delta (the role
+    preamble, the finish chunk) carry no text and are skipped. ``on_usage``,
+    when given, receives any ``usage`` a chunk carries.
+    """
+    for chunk in stream:
+        usage = getattr(chunk, "usage", None)
+        if usage is not None and on_usage is not None:
+            on_usage(usage)
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content:
+            yield content
+
+
+def _iter_sse_events(lines) -> Iterator[dict]:
+    """Decode the ``data:`` frames of a server-sent-event stream as JSON.
+
+    ``event:`` and comment lines are ignored — the /v1/responses payload
+    repeats the event name in its own ``type`` field — and ``[DONE]`` ends
+    the stream.
+    """
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return
+        if data:
+            yield fastjson.loads(data)
+
+
 # ============================================================================
 # OpenAI Adapter
 # ============================================================================
@@ -244,6 +296,77 @@ class OpenAIAdapter(LMAdapter):
         except ImportError:
             raise ImportError("openai package required: pip install openai")
 
+        # gpt-5* and codex models are served by /v1/responses, everything else
+        # by chat completions. Fixed for the adapter's lifetime, so decide once.
+        lowered = model.lower()
+        self._uses_responses = "codex" in lowered or "gpt-5" in lowered
+
+        # Built on first /v1/responses call, then reused (see _responses_http).
+        self._http = None
+        self._http_lock = threading.Lock()
+
+    def _responses_http(self):
+        """Pooled client for the raw /v1/responses calls.
+
+        A bare ``httpx.post`` opens and tears down its own connection, so every
+        gpt-5*/codex call paid a fresh TCP + TLS handshake to the same host. One
+        long-lived client keeps the connection alive between calls. Built
+        lazily so chat-completions models (served by the SDK client, which
+        pools on its own) never construct it; the lock keeps concurrent first
+        calls from `agenerate` threads from each building one.
+        """
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    import httpx
+                    self._http = httpx.Client(
+                        base_url=self.base_url or "https://api.openai.com",
+                        headers={
+                            "Authorization": f"Bearer {self.api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        # 10 minutes for complex queries, but fail fast on an
+                        # unreachable host rather than holding the full budget.
+                        timeout=httpx.Timeout(600.0, connect=10.0),
+                        limits=httpx.Limits(
+                            max_keepalive_connections=_HTTP_POOL_KEEPALIVE,
+                            max_connections=_HTTP_POOL_MAX,
+                            keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY_S,
+                        ),
+                    )
+        return self._http
+
+    def prewarm(self) -> None:
+        if self._uses_responses:
+            self._responses_http().head("/v1/models", timeout=_PREWARM_TIMEOUT_S)
+        else:
+            self.client.with_options(timeout=_PREWARM_TIMEOUT_S, max_retries=0).models.list()
+
+    def close(self) -> None:
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
+        self.client.close()
+
+    def _responses_payload(
+        self,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        reasoning_effort: Optional[str],
+    ) -> dict:
+        payload: dict = {
+            "model": self.model,
+            "input": messages,
+            "max_output_tokens": max_tokens,
+        }
+        # gpt-5* and codex models reject `temperature` on /v1/responses
+        # with a 400 ("Unsupported parameter"). Their reasoning behavior
+        # is steered by `reasoning.effort` instead. Don't include it.
+        if reasoning_effort is not None:
+            payload["reasoning"] = {"effort": reasoning_effort}
+        return payload
+
     def generate(
         self,
         messages: list[dict[str, str]],
@@ -261,30 +384,16 @@ class OpenAIAdapter(LMAdapter):
             reasoning_effort=reasoning_effort,
         ):
             # gpt-5* and codex models use /v1/responses endpoint
-            if "codex" in self.model.lower() or "gpt-5" in self.model.lower():
-                import httpx
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                base_url = self.base_url or "https://api.openai.com"
-                url = f"{base_url}/v1/responses"
-
-                payload: dict = {
-                    "model": self.model,
-                    "input": messages,
-                    "max_output_tokens": max_tokens,
-                }
-                # gpt-5* and codex models reject `temperature` on /v1/responses
-                # with a 400 ("Unsupported parameter"). Their reasoning behavior
-                # is steered by `reasoning.effort` instead. Don't include it.
-                if reasoning_effort is not None:
-                    payload["reasoning"] = {"effort": reasoning_effort}
-
-                response = httpx.post(url, headers=headers, json=payload, timeout=600.0)  # 10 minutes for complex queries
+            if self._uses_responses:
+                payload = self._responses_payload(messages, max_tokens, reasoning_effort)
+                response = call_with_retry(
+                    lambda: self._responses_http().post(
+                        "/v1/responses", content=fastjson.dumps(payload),
+                    )
+                )
                 if response.status_code != 200:
                     raise ValueError(f"API error {response.status_code}: {response.text}")
-                data = response.json()
+                data = fastjson.loads(response.content)
                 self._emit_usage_metric(data.get("usage", {}))
 
                 # Extract text from output array
@@ -312,6 +421,55 @@ class OpenAIAdapter(LMAdapter):
                 self._emit_usage_metric(getattr(response, "usage", None))
                 return response.choices[0].message.content
 
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Stream the response from the OpenAI API as text deltas."""
+        from neo.memory.metrics import capture_lm_call_failure
+        with capture_lm_call_failure(
+            provider="openai",
+            model=self.model,
+            max_tokens=max_tokens,
+            reasoning_effort=reasoning_effort,
+        ):
+            if self._uses_responses:
+                payload = self._responses_payload(messages, max_tokens, reasoning_effort)
+                payload["stream"] = True
+                with self._responses_http().stream(
+                    "POST", "/v1/responses", content=fastjson.dumps(payload),
+                ) as response:
+                    if response.status_code != 200:
+                        response.read()
+                        raise ValueError(f"API error {response.status_code}: {response.text}")
+                    for event in _iter_sse_events(response.iter_lines()):
+                        kind = event.get("type")
+                        if kind == "response.output_text.delta":
+                            yield event.get("delta", "")
+                        elif kind == "response.completed":
+                            self._emit_usage_metric(
+                                (event.get("response") or {}).get("usage", {})
+                            )
+                        elif kind in ("response.failed", "response.incomplete", "error"):
+                            raise ValueError(f"Streaming response failed: {event}")
+            else:
+                stream = _chat_completion_resilient(self.client, {
+                    "model": self.model,
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "stop": stop,
+                    "stream": True,
+                    # Without this a stream reports no token counts, and
+                    # streamed calls would vanish from metrics.jsonl.
+                    "stream_options": {"include_usage": True},
+                }, provider="openai")
+                yield from _iter_chat_deltas(stream, on_usage=self._emit_usage_metric)
+
     def _emit_usage_metric(self, usage: object) -> None:
         """Record per-call token usage to metrics.jsonl.
 
@@ -407,28 +565,25 @@ class AnthropicAdapter(LMAdapter):
             self.client = anthropic.Anthropic(api_key=self.api_key)
         except ImportError:
             raise ImportError("anthropic package required: pip install anthropic")
+        # Resolved once here rather than by an `import` on every call.
+        self._bad_request_error = anthropic.BadRequestError
 
-    def generate(
+    def _request_kwargs(
         self,
         messages: list[dict[str, str]],
-        stop: Optional[list[str]] = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
-    ) -> str:
-        """Generate response using Anthropic API."""
-        # Convert messages format if needed
-        system_message = None
-        formatted_messages = []
-
-        for msg in messages:
-            if msg["role"] == "system":
-                system_message = msg["content"]
-            else:
-                formatted_messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"],
-                })
+        stop: Optional[list[str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> dict:
+        # The API takes the system prompt as a separate field; if several
+        # system messages are present the last one wins.
+        system_messages = [msg["content"] for msg in messages if msg["role"] == "system"]
+        system_message = system_messages[-1] if system_messages else None
+        formatted_messages = [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in messages
+            if msg["role"] != "system"
+        ]
 
         kwargs = {
             "model": self.model,
@@ -436,8 +591,8 @@ class AnthropicAdapter(LMAdapter):
             "max_tokens": max_tokens,
         }
         # Only send `temperature` to models not already known to reject it
-        # (Opus 4.7+, Sonnet 5, Fable 5). The learn-and-retry below records
-        # rejections into the persistent `_PARAM_COMPAT` store.
+        # (Opus 4.7+, Sonnet 5, Fable 5). The learn-and-retry in the callers
+        # records rejections into the persistent `_PARAM_COMPAT` store.
         if not _PARAM_COMPAT.has("anthropic", self.model, _ADAPT_DROP_TEMPERATURE):
             kwargs["temperature"] = temperature
 
@@ -446,8 +601,33 @@ class AnthropicAdapter(LMAdapter):
 
         if stop:
             kwargs["stop_sequences"] = stop
+        return kwargs
+
+    def _drop_rejected_temperature(self, kwargs: dict, error: Exception) -> bool:
+        """Newer Claude models reject `temperature` with a 400. Learn the
+        model and drop the param so the caller can retry once. Returns False
+        for a 400 about anything else, which the caller re-raises untouched."""
+        if "temperature" not in kwargs or "temperature" not in str(error).lower():
+            return False
+        _PARAM_COMPAT.learn("anthropic", self.model, _ADAPT_DROP_TEMPERATURE)
+        kwargs.pop("temperature", None)
+        logger.debug(
+            "Anthropic model %s rejected `temperature`; dropped it "
+            "and retrying", self.model,
+        )
+        return True
+
+    def generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> str:
+        """Generate response using Anthropic API."""
+        kwargs = self._request_kwargs(messages, stop, max_tokens, temperature)
 
-        import anthropic
         from neo.memory.metrics import capture_lm_call_failure
         with capture_lm_call_failure(
             provider="anthropic",
@@ -457,22 +637,43 @@ class AnthropicAdapter(LMAdapter):
         ):
             try:
                 response = self.client.messages.create(**kwargs)
-            except anthropic.BadRequestError as e:
-                # Newer Claude models reject `temperature` with a 400. Learn
-                # the model, drop the param, and retry once so the call still
-                # succeeds. A 400 for any other reason re-raises untouched.
-                if "temperature" not in kwargs or "temperature" not in str(e).lower():
+            except self._bad_request_error as e:
+                if not self._drop_rejected_temperature(kwargs, e):
                     raise
-                _PARAM_COMPAT.learn("anthropic", self.model, _ADAPT_DROP_TEMPERATURE)
-                kwargs.pop("temperature", None)
-                logger.debug(
-                    "Anthropic model %s rejected `temperature`; dropped it "
-                    "and retrying", self.model,
-                )
                 response = self.client.messages.create(**kwargs)
             self._emit_usage_metric(response)
             return response.content[0].text
 
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> Iterator[str]:
+        """Stream the response from the Anthropic API as text deltas."""
+        kwargs = self._request_kwargs(messages, stop, max_tokens, temperature)
+
+        from neo.memory.metrics import capture_lm_call_failure
+        with capture_lm_call_failure(
+            provider="anthropic",
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        ):
+            with contextlib.ExitStack() as stack:
+                # The parameter 400 is raised when the stream opens, before any
+                # text is yielded, so the single retry can't duplicate output.
+                try:
+                    stream = stack.enter_context(self.client.messages.stream(**kwargs))
+                except self._bad_request_error as e:
+                    if not self._drop_rejected_temperature(kwargs, e):
+                        raise
+                    stream = stack.enter_context(self.client.messages.stream(**kwargs))
+                yield from stream.text_stream
+                self._emit_usage_metric(stream.get_final_message())
+
     def _emit_usage_metric(self, response: object) -> None:
         """Record per-call token usage to metrics.jsonl.
 
@@ -510,6 +711,9 @@ class AnthropicAdapter(LMAdapter):
             # Metrics are never load-bearing.
             pass
 
+    def prewarm(self) -> None:
+        self.client.with_options(timeout=_PREWARM_TIMEOUT_S, max_retries=0).models.list()
+
     def name(self) -> str:
         return f"anthropic/{self.model}"
 
@@ -518,6 +722,14 @@ class AnthropicAdapter(LMAdapter):
 # Google Adapter
 # ============================================================================
 
+_GOOGLE_STATUS_LABELS = {
+    401: "Invalid API key",
+    403: "Invalid API key",
+    404: "Invalid model '{model}'",
+    429: "Rate limit exceeded",
+}
+
+
 class GoogleAdapter(LMAdapter):
     """Adapter for Google models (Gemini) using google-genai SDK."""
 
@@ -529,12 +741,15 @@ class GoogleAdapter(LMAdapter):
 
         try:
             from google import genai
+            from google.genai import types
             # Create client with API key
             self.client = genai.Client(api_key=self.api_key)
         except ImportError:
             raise ImportError(
                 "google-genai package required: pip install google-genai"
             )
+        # Resolved once here rather than by an `import` on every call.
+        self._types = types
 
     def generate(
         self,
@@ -545,34 +760,15 @@ class GoogleAdapter(LMAdapter):
         reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
     ) -> str:
         """Generate response using Google Generative AI SDK."""
-        from google.genai import types
-
-        # Convert messages to new SDK format
-        # Messages use "user" or "model" roles, with content in "parts" array
-        # Note: Google SDK requires "system" messages be mapped to "user" role
-        # This is a known SDK limitation - system prompts are merged with user context
-        formatted_messages = []
-        for msg in messages:
-            role = "user" if msg["role"] in ["user", "system"] else "model"
-            formatted_messages.append({
-                "role": role,
-                "parts": [msg["content"]],
-            })
-
-        # Create generation config using types
-        config = types.GenerateContentConfig(
-            temperature=temperature,
-            max_output_tokens=max_tokens,
-            stop_sequences=stop,
-        )
+        formatted_messages, config = self._request(messages, stop, max_tokens, temperature)
 
         try:
             # Generate content using new SDK interface
-            response = self.client.models.generate_content(
+            response = call_with_retry(lambda: self.client.models.generate_content(
                 model=self.model,
                 contents=formatted_messages,
                 config=config,
-            )
+            ))
 
             # Handle missing or None response text
             if not hasattr(response, 'text') or response.text is None:
@@ -581,20 +777,92 @@ class GoogleAdapter(LMAdapter):
             return response.text
 
         except Exception as e:
-            error_msg = str(e).lower()
-
-            # Handle common API errors with clear messages
-            if "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg:
-                raise ValueError(f"Invalid API key: {e}")
-            elif "429" in error_msg or "rate limit" in error_msg:
-                raise ValueError(f"Rate limit exceeded: {e}")
-            elif "404" in error_msg or "not found" in error_msg:
-                raise ValueError(f"Invalid model '{self.model}': {e}")
-            elif "network" in error_msg or "connection" in error_msg:
-                raise ValueError(f"Network error: {e}")
-            else:
-                # Re-raise with original error for unexpected cases
-                raise
+            self._raise_classified(e)
+            raise
+
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> Iterator[str]:
+        """Stream the response from the Google Generative AI SDK as text deltas."""
+        formatted_messages, config = self._request(messages, stop, max_tokens, temperature)
+
+        try:
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model,
+                contents=formatted_messages,
+                config=config,
+            ):
+                # Chunks carrying only safety/usage metadata have no text.
+                text = getattr(chunk, "text", None)
+                if text:
+                    yield text
+        except Exception as e:
+            self._raise_classified(e)
+            raise
+
+    def _request(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]],
+        max_tokens: int,
+        temperature: float,
+    ) -> tuple[list[dict], object]:
+        """Build the ``(contents, config)`` pair both call paths send."""
+        # Convert messages to new SDK format
+        # Messages use "user" or "model" roles, with content in "parts" array
+        # Note: Google SDK requires "system" messages be mapped to "user" role
+        # This is a known SDK limitation - system prompts are merged with user context
+        formatted_messages = [
+            {
+                "role": "user" if msg["role"] in ("user", "system") else "model",
+                "parts": [msg["content"]],
+            }
+            for msg in messages
+        ]
+
+        # Create generation config using types
+        config = self._types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            stop_sequences=stop,
+        )
+        return formatted_messages, config
+
+    def _raise_classified(self, e: Exception) -> None:
+        """Re-raise common API errors as a ValueError with a clear message.
+
+        Returns for anything unrecognized; the caller re-raises the original.
+        google-genai errors carry the HTTP status as ``code``; that is used
+        when present, and the message text is only scanned for errors
+        without one (transport failures, older SDKs).
+        """
+        label = _GOOGLE_STATUS_LABELS.get(status_of(e))
+        if label is not None:
+            raise ValueError(f"{label.format(model=self.model)}: {e}")
+
+        error_msg = str(e).lower()
+
+        # Handle common API errors with clear messages
+        if "401" in error_msg or "403" in error_msg or "unauthorized" in error_msg:
+            raise ValueError(f"Invalid API key: {e}")
+        elif "429" in error_msg or "rate limit" in error_msg:
+            raise ValueError(f"Rate limit exceeded: {e}")
+        elif "404" in error_msg or "not found" in error_msg:
+            raise ValueError(f"Invalid model '{self.model}': {e}")
+        elif "network" in error_msg or "connection" in error_msg:
+            raise ValueError(f"Network error: {e}")
+
+    def prewarm(self) -> None:
+        # google-genai takes its per-request timeout in milliseconds.
+        self.client.models.list(config={
+            "page_size": 1,
+            "http_options": {"timeout": int(_PREWARM_TIMEOUT_S * 1000)},
+        })
 
     def name(self) -> str:
         return f"google/{self.model}"
@@ -647,6 +915,28 @@ class LocalAdapter(LMAdapter):
         }, provider="local")
         return response.choices[0].message.content
 
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> Iterator[str]:
+        """Stream the response from the local API as text deltas."""
+        stream = _chat_completion_resilient(self.client, {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stop": stop,
+            "stream": True,
+        }, provider="local")
+        yield from _iter_chat_deltas(stream)
+
+    def prewarm(self) -> None:
+        self.client.with_options(timeout=_PREWARM_TIMEOUT_S, max_retries=0).models.list()
+
     def name(self) -> str:
         return f"local/{self.model}"
 
@@ -655,6 +945,13 @@ class LocalAdapter(LMAdapter):
 # Ollama Adapter
 # ============================================================================
 
+_OLLAMA_ROLE_TMPL = {
+    "system": "<|system|>\n{}\n",
+    "user": "<|user|>\n{}\n",
+    "assistant": "<|assistant|>\n{}\n",
+}
+
+
 class OllamaAdapter(LMAdapter):
     """Adapter for Ollama-hosted models."""
 
@@ -668,10 +965,26 @@ class OllamaAdapter(LMAdapter):
 
         try:
             import requests
-            self.requests = requests
+            from requests.adapters import HTTPAdapter
         except ImportError:
             raise ImportError("requests package required: pip install requests")
 
+        # One pooled session for the adapter's lifetime: a bare
+        # ``requests.post`` opens a new connection per call.
+        self._session = requests.Session()
+        # Bodies are pre-encoded with `fastjson`, so set the type requests
+        # would have added for ``json=``.
+        self._session.headers["Content-Type"] = "application/json"
+        pool = HTTPAdapter(pool_connections=_HTTP_POOL_KEEPALIVE, pool_maxsize=_HTTP_POOL_MAX)
+        self._session.mount("http://", pool)
+        self._session.mount("https://", pool)
+
+    def prewarm(self) -> None:
+        self._session.get(f"{self.base_url}/api/tags", timeout=_PREWARM_TIMEOUT_S)
+
+    def close(self) -> None:
+        self._session.close()
+
     def generate(
         self,
         messages: list[dict[str, str]],
@@ -680,40 +993,69 @@ class OllamaAdapter(LMAdapter):
         temperature: float = 0.7,
         reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
     ) -> str:
-        """Generate response using Ollama API."""
-        # Convert messages to prompt
-        prompt_parts = []
-        for msg in messages:
-            role = msg["role"]
-            content = msg["content"]
-            if role == "system":
-                prompt_parts.append(f"<|system|>\n{content}\n")
-            elif role == "user":
-                prompt_parts.append(f"<|user|>\n{content}\n")
-            elif role == "assistant":
-                prompt_parts.append(f"<|assistant|>\n{content}\n")
-
-        prompt = "".join(prompt_parts) + "<|assistant|>\n"
-
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+        """Generate response using Ollama API.
 
-        if stop:
-            payload["options"]["stop"] = stop
+        Consumes the NDJSON stream rather than asking for one buffered body:
+        the server starts sending as soon as the first token is ready, so a
+        long local generation never sits idle on the socket until it is done.
+        """
+        return "".join(self.stream_generate(
+            messages, stop=stop, max_tokens=max_tokens, temperature=temperature,
+        ))
+
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> Iterator[str]:
+        """Stream the response from the Ollama API as text deltas.
 
-        response = self.requests.post(
+        Ollama streams one JSON object per line, each carrying the next
+        ``response`` fragment, until one arrives with ``done`` set.
+        """
+        payload = self._payload(messages, stop, max_tokens, temperature, stream=True)
+        # Retrying is safe up to here: nothing has been yielded until the
+        # status is known.
+        response = call_with_retry(lambda: self._session.post(
             f"{self.base_url}/api/generate",
-            json=payload,
-        )
-        response.raise_for_status()
-        return response.json()["response"]
+            data=fastjson.dumps(payload),
+            stream=True,
+        ))
+        with response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = fastjson.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                if chunk.get("response"):
+                    yield chunk["response"]
+                if chunk.get("done"):
+                    break
+
+    def _payload(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]],
+        max_tokens: int,
+        temperature: float,
+        stream: bool,
+    ) -> dict:
+        # Convert messages to prompt; messages with any other role are dropped.
+        prompt = "".join([
+            _OLLAMA_ROLE_TMPL[msg["role"]].format(msg["content"])
+            for msg in messages
+            if msg["role"] in _OLLAMA_ROLE_TMPL
+        ]) + "<|assistant|>\n"
+
+        options = {"temperature": temperature, "num_predict": max_tokens}
+        if stop:
+            options["stop"] = stop
+        return {"model": self.model, "prompt": prompt, "stream": stream, "options": options}
 
     def name(self) -> str:
         return f"ollama/{self.model}"
@@ -775,6 +1117,28 @@ class AzureOpenAIAdapter(LMAdapter):
         }, provider="azure")
         return response.choices[0].message.content
 
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,  # not supported; accepted for ABC compat
+    ) -> Iterator[str]:
+        """Stream the response from the Azure OpenAI API as text deltas."""
+        stream = _chat_completion_resilient(self.client, {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stop": stop,
+            "stream": True,
+        }, provider="azure")
+        yield from _iter_chat_deltas(stream)
+
+    def prewarm(self) -> None:
+        self.client.with_options(timeout=_PREWARM_TIMEOUT_S, max_retries=0).models.list()
+
     def name(self) -> str:
         return f"azure/{self.model}"
 
@@ -783,6 +1147,23 @@ class AzureOpenAIAdapter(LMAdapter):
 # Claude Code Adapter
 # ============================================================================
 
+#: Pipe buffer for the claude CLI's stdout. stream-json lines for a long
+#: answer run to tens of KiB; 64 KiB lets most arrive in a single read.
+_CLI_PIPE_BUFSIZE = 1 << 16
+
+#: Longest system prompt (UTF-8 bytes) passed inline as ``--system-prompt``.
+#: Linux caps a single argv entry at 128 KiB and Windows a whole command line
+#: at 32K characters; past this the prompt goes through a temp file instead.
+_CLI_INLINE_PROMPT_MAX = 30_000 if os.name == "nt" else 120_000
+
+
+def _drain_pipe(pipe, sink: list[bytes]) -> None:
+    """Read ``pipe`` to EOF into ``sink`` (run on a daemon thread)."""
+    for block in iter(lambda: pipe.read1(_CLI_PIPE_BUFSIZE), b""):
+        sink.append(block)
+    pipe.close()
+
+
 class ClaudeCodeAdapter(LMAdapter):
     """
     Adapter that uses Claude Code CLI instead of direct Anthropic API.
@@ -794,6 +1175,11 @@ class ClaudeCodeAdapter(LMAdapter):
     - Claude Code CLI installed (`npm install -g @anthropic-ai/claude-code`)
     - User authenticated via `claude auth login`
     - ANTHROPIC_API_KEY should NOT be set (to force subscription auth)
+
+    By default the CLI reports events as stream-json, which surfaces API
+    errors as structured events. ``stream_json=False`` asks for plain text
+    instead and takes stdout as the answer — no per-line JSON parsing, for
+    short one-shot calls where that overhead dominates.
     """
 
     def __init__(
@@ -803,10 +1189,12 @@ class ClaudeCodeAdapter(LMAdapter):
         timeout: int = 600,
         api_key: Optional[str] = None,  # Accepted for compatibility, but not used
         base_url: Optional[str] = None,  # Accepted for compatibility, but not used
+        stream_json: bool = True,
     ):
         self.model = model
         self.cli_path = cli_path
         self.timeout = timeout
+        self.stream_json = stream_json
 
         # Verify Claude Code CLI is available
         try:
@@ -847,24 +1235,31 @@ class ClaudeCodeAdapter(LMAdapter):
                     "content": msg["content"],
                 })
 
-        # Write system prompt to temp file
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.txt',
-            delete=False
-        ) as f:
-            f.write(system_prompt)
-            system_prompt_file = f.name
+        # Pass the system prompt inline; only one too long for the command
+        # line costs a temp file write and delete.
+        system_prompt_file = None
+        if len(system_prompt.encode("utf-8")) <= _CLI_INLINE_PROMPT_MAX:
+            prompt_args = ["--system-prompt", system_prompt]
+        else:
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                suffix='.txt',
+                delete=False
+            ) as f:
+                f.write(system_prompt)
+                system_prompt_file = f.name
+            prompt_args = ["--system-prompt-file", system_prompt_file]
 
         try:
             # Build Claude Code CLI arguments
             args = [
                 self.cli_path,
-                "--system-prompt-file", system_prompt_file,
-                "--output-format", "stream-json",
+                *prompt_args,
+                "--output-format", "stream-json" if self.stream_json else "text",
                 "--model", self.model,
                 "--max-turns", "1",
-                "--verbose",
+                # stream-json requires --verbose in print mode
+                *(["--verbose"] if self.stream_json else []),
                 "-p",
             ]
 
@@ -876,61 +1271,105 @@ class ClaudeCodeAdapter(LMAdapter):
             }
             env.pop("ANTHROPIC_API_KEY", None)
 
-            # Run Claude Code CLI
+            stdin_payload = json.dumps(conversation_messages).encode("utf-8")
+            if not self.stream_json:
+                return self._generate_text(args, env, stdin_payload)
+
+            # Run Claude Code CLI. Binary pipes with a 64 KiB buffer: stdout is
+            # read a buffer at a time and each NDJSON line decoded once, rather
+            # than through a text wrapper's incremental decoder.
             process = subprocess.Popen(
                 args,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 env=env,
-                text=True,
+                bufsize=_CLI_PIPE_BUFSIZE,
             )
 
+            # Drain stderr concurrently. Left unread, a CLI that logs more
+            # than the OS pipe buffer blocks on stderr while we block on its
+            # stdout; reading it only on error would then never happen.
+            stderr_chunks: list[bytes] = []
+            stderr_drain = threading.Thread(
+                target=_drain_pipe, args=(process.stderr, stderr_chunks), daemon=True
+            )
+            stderr_drain.start()
+
+            def stderr_text() -> str:
+                stderr_drain.join(timeout=self.timeout)
+                return b"".join(stderr_chunks).decode("utf-8", "replace")
+
             # Write messages to stdin
-            process.stdin.write(json.dumps(conversation_messages))
+            process.stdin.write(stdin_payload)
             process.stdin.close()
 
             # Parse streaming JSON output
-            response_text = ""
+            response_parts = []
             for line in process.stdout:
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    chunk = json.loads(line)
-
-                    if chunk.get("type") == "assistant":
-                        message = chunk.get("message", {})
-                        for content in message.get("content", []):
-                            if content.get("type") == "text":
-                                response_text += content.get("text", "")
-
-                    if chunk.get("type") == "assistant":
-                        message = chunk.get("message", {})
-                        if message.get("stop_reason"):
-                            content = message.get("content", [{}])[0]
-                            if content.get("text", "").startswith("API Error"):
-                                stderr = process.stderr.read()
-                                raise RuntimeError(
-                                    f"Claude Code error: {content['text']}\n{stderr}"
-                                )
-
+                    chunk = fastjson.loads(line)
                 except json.JSONDecodeError:
                     continue
 
+                if chunk.get("type") != "assistant":
+                    continue
+                message = chunk.get("message", {})
+                contents = message.get("content", [])
+                for content in contents:
+                    if content.get("type") == "text":
+                        response_parts.append(content.get("text", ""))
+
+                if message.get("stop_reason"):
+                    first = contents[0] if contents else {}
+                    if first.get("text", "").startswith("API Error"):
+                        raise RuntimeError(
+                            f"Claude Code error: {first['text']}\n{stderr_text()}"
+                        )
+
             return_code = process.wait(timeout=self.timeout)
 
             if return_code != 0:
-                stderr = process.stderr.read()
                 raise RuntimeError(
-                    f"Claude Code exited with code {return_code}: {stderr}"
+                    f"Claude Code exited with code {return_code}: {stderr_text()}"
                 )
 
-            return response_text.strip()
+            return "".join(response_parts).strip()
 
         finally:
-            Path(system_prompt_file).unlink(missing_ok=True)
+            if system_prompt_file is not None:
+                Path(system_prompt_file).unlink(missing_ok=True)
+
+    def _generate_text(self, args: list[str], env: dict[str, str], stdin_payload: bytes) -> str:
+        """Run the CLI with ``--output-format text``; stdout is the answer."""
+        process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        try:
+            out, err = process.communicate(stdin_payload, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
+        stderr = err.decode("utf-8", "replace")
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                f"Claude Code exited with code {process.returncode}: {stderr}"
+            )
+        text = out.decode("utf-8", "replace").strip()
+        # Without stream-json events, an API failure is only visible as text
+        if text.startswith("API Error"):
+            raise RuntimeError(f"Claude Code error: {text}\n{stderr}")
+        return text
 
     def name(self) -> str:
         return f"claude-code/{self.model}"
@@ -1195,9 +1634,23 @@ class CarAdapter(LMAdapter):
         return f"car/{self.model or 'router'}"
 
 
+_ADAPTER_CACHE: dict[tuple, LMAdapter] = {}
+_ADAPTER_CACHE_LOCK = threading.Lock()
+
+
+def clear_adapter_cache() -> None:
+    """Close and forget every adapter built with ``create_adapter(shared=True)``."""
+    with _ADAPTER_CACHE_LOCK:
+        adapters = list(_ADAPTER_CACHE.values())
+        _ADAPTER_CACHE.clear()
+    for adapter in adapters:
+        adapter.close()
+
+
 def create_adapter(
     provider: str,
     model: Optional[str] = None,
+    shared: bool = False,
     **kwargs,
 ) -> LMAdapter:
     """
@@ -1207,38 +1660,131 @@ def create_adapter(
         provider: One of "openai", "anthropic", "google", "azure", "local",
                   "ollama", "claude-code", "car"
         model: Model name (optional, uses provider default)
+        shared: Return one process-wide adapter per (provider, model, kwargs)
+                instead of a new one, so repeat callers share its client and
+                connection pool. A shared adapter must not be closed by its
+                users; `clear_adapter_cache` closes them.
         **kwargs: Additional provider-specific arguments
 
     Returns:
         LMAdapter instance
     """
+    if not shared:
+        return _build_adapter(provider, model, **kwargs)
+
+    key = (provider.lower(), model, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # dict/list values (headers, extra config) aren't hashable; key on a
+        # canonical rendering of the kwargs instead.
+        key = (provider.lower(), model, json.dumps(kwargs, sort_keys=True, default=repr))
+    with _ADAPTER_CACHE_LOCK:
+        adapter = _ADAPTER_CACHE.get(key)
+        if adapter is None:
+            # Built under the lock: construction is cheap (clients connect
+            # lazily), and two racing callers must not each get their own.
+            adapter = _ADAPTER_CACHE[key] = _build_adapter(provider, model, **kwargs)
+    return adapter
+
+
+#: provider -> (adapter class, default model). Insertion order is the order
+#: listed in the unknown-provider error.
+_PROVIDERS: dict[str, tuple[type, Optional[str]]] = {
+    "openai": (OpenAIAdapter, "gpt-4"),
+    "anthropic": (AnthropicAdapter, "claude-sonnet-4-5-20250929"),
+    "google": (GoogleAdapter, "gemini-2.0-flash"),
+    "azure": (AzureOpenAIAdapter, "gpt-4"),
+    "local": (LocalAdapter, "local-model"),
+    "ollama": (OllamaAdapter, "llama2"),
+    "claude-code": (ClaudeCodeAdapter, "claude-sonnet-4-5-20250929"),
+    # No default: CAR's router picks the model when none is given.
+    "car": (CarAdapter, None),
+}
+
+
+def _build_adapter(provider: str, model: Optional[str], **kwargs) -> LMAdapter:
     provider = provider.lower()
 
-    if provider == "openai":
-        return OpenAIAdapter(model=model or "gpt-4", **kwargs)
-    elif provider == "anthropic":
-        return AnthropicAdapter(model=model or "claude-sonnet-4-5-20250929", **kwargs)
-    elif provider == "google":
-        return GoogleAdapter(model=model or "gemini-2.0-flash", **kwargs)
-    elif provider == "azure":
-        return AzureOpenAIAdapter(model=model or "gpt-4", **kwargs)
-    elif provider == "local":
-        return LocalAdapter(model=model or "local-model", **kwargs)
-    elif provider == "ollama":
-        return OllamaAdapter(model=model or "llama2", **kwargs)
-    elif provider == "claude-code":
-        return ClaudeCodeAdapter(model=model or "claude-sonnet-4-5-20250929", **kwargs)
-    elif provider == "car":
+    try:
+        adapter_cls, default_model = _PROVIDERS[provider]
+    except KeyError:
+        raise ValueError(
+            f"Unknown provider: {provider}. "
+            f"Supported: {', '.join(_PROVIDERS)}"
+        ) from None
+
+    if adapter_cls is CarAdapter:
         # CarAdapter ignores api_key/base_url — CAR's router owns provider
         # selection. Strip them so callers can pass NeoConfig values uniformly.
         kwargs.pop("api_key", None)
         kwargs.pop("base_url", None)
-        return CarAdapter(model=model, **kwargs)
-    else:
-        raise ValueError(
-            f"Unknown provider: {provider}. "
-            f"Supported: openai, anthropic, google, azure, local, ollama, claude-code, car"
-        )
+    return adapter_cls(model=model or default_model, **kwargs)
+
+
+# ============================================================================
+# Concurrent generation
+# ============================================================================
+
+#: Default cap on in-flight calls for `generate_batch`. High enough to overlap
+#: the round-trips of a typical fan-out (k plans, a panel of critics), low
+#: enough that a large batch doesn't trip the provider's per-key rate limit.
+_BATCH_MAX_CONCURRENCY = 8
+
+
+async def agenerate_batch(
+    adapter: LMAdapter,
+    batch: list[list[dict[str, str]]],
+    max_concurrency: int = _BATCH_MAX_CONCURRENCY,
+    **params,
+) -> list[str]:
+    """Run ``adapter.agenerate`` over every message list in ``batch`` concurrently.
+
+    Results come back in ``batch`` order. ``params`` (``stop``, ``max_tokens``,
+    ``temperature``, ``reasoning_effort``) apply to every call; at
+    ``temperature=0`` duplicate message lists are sent once. The first
+    failure propagates, as it would from a sequential loop; calls already in
+    flight are left to finish on their worker threads.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(messages: list[dict[str, str]]) -> str:
+        async with semaphore:
+            return await adapter.agenerate(messages, **params)
+
+    # A deterministic request repeated within the batch has one answer; send
+    # it once and fan the result back out. Sampled requests are all sent —
+    # callers batch those precisely to get different completions.
+    if params.get("temperature", 0.7) == 0:
+        slots: dict[str, int] = {}
+        unique: list[list[dict[str, str]]] = []
+        order = []
+        for messages in batch:
+            key = json.dumps(messages, sort_keys=True)
+            if key not in slots:
+                slots[key] = len(unique)
+                unique.append(messages)
+            order.append(slots[key])
+        results = await asyncio.gather(*(_one(m) for m in unique))
+        return [results[i] for i in order]
+
+    return list(await asyncio.gather(*(_one(m) for m in batch)))
+
+
+def generate_batch(
+    adapter: LMAdapter,
+    batch: list[list[dict[str, str]]],
+    max_concurrency: int = _BATCH_MAX_CONCURRENCY,
+    **params,
+) -> list[str]:
+    """Synchronous entry point for `agenerate_batch`.
+
+    Starts its own event loop, so it must not be called from inside one —
+    async callers await `agenerate_batch` directly.
+    """
+    return asyncio.run(
+        agenerate_batch(adapter, batch, max_concurrency=max_concurrency, **params)
+    )
 
 
 #: Seconds the breaker stays open after a CAR failure before half-opening to
@@ -1298,13 +1844,20 @@ class AutoAdapter(LMAdapter):
         self._car = car
         self._make_fallback = fallback_factory
         self._fallback: Optional[LMAdapter] = None
+        self._fallback_lock = threading.Lock()
         self._retry_cooldown = retry_cooldown
         self._car_timeout = car_timeout if car_timeout is not None else _car_call_timeout()
         self._disabled_until = 0.0  # monotonic deadline; <= now => CAR eligible
 
     def _fallback_adapter(self) -> LMAdapter:
+        # Double-checked: `generate_batch` fans several worker threads into one
+        # AutoAdapter, and after a CAR failure they all reach this at once —
+        # without the lock each would build (and pool connections for) its own
+        # fallback. Unlike the breaker float, a duplicate here is not idempotent.
         if self._fallback is None:
-            self._fallback = self._make_fallback()
+            with self._fallback_lock:
+                if self._fallback is None:
+                    self._fallback = self._make_fallback()
         return self._fallback
 
     def _car_generate_bounded(self, messages, stop, max_tokens,
@@ -1360,10 +1913,179 @@ class AutoAdapter(LMAdapter):
             temperature=temperature, reasoning_effort=reasoning_effort,
         )
 
+    def close(self) -> None:
+        self._car.close()
+        with self._fallback_lock:
+            fallback, self._fallback = self._fallback, None
+        if fallback is not None:
+            fallback.close()
+
     def name(self) -> str:
         return f"auto({self._car.name()} -> static)"
 
 
+# ============================================================================
+# Response cache
+# ============================================================================
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _llm_cache_enabled() -> bool:
+    """Whether ``NEO_LLM_CACHE`` opts this process into the response cache."""
+    return _env_flag("NEO_LLM_CACHE")
+
+
+def _semantic_cache_enabled() -> bool:
+    """Whether ``NEO_SEMANTIC_CACHE`` adds the near-duplicate prompt layer."""
+    return _env_flag("NEO_SEMANTIC_CACHE")
+
+
+class CachingAdapter(LMAdapter):
+    """Serve repeated deterministic requests from `neo.llm_cache.LLMCache`.
+
+    Only ``temperature == 0`` calls are cached: at any other temperature a
+    rerun is *supposed* to differ, and returning the first sample forever
+    would silently collapse the diversity callers ask for (the multi-agent
+    planner varies temperature across candidates for exactly that reason).
+    Everything else passes straight through to the wrapped adapter.
+
+    An optional `neo.llm_cache.SemanticCache` is consulted after an exact
+    miss, and only when ``stop`` is None too — stop sequences truncate the
+    answer, so a paraphrase with different stops is not the same request.
+
+    Identical misses that arrive concurrently share one provider call through
+    `neo.singleflight.SingleFlight`; without it every thread of a fan-out
+    misses the cold cache and pays for the same answer.
+    """
+
+    def __init__(self, inner: LMAdapter, cache=None, semantic=None):
+        from neo.llm_cache import LLMCache
+        from neo.singleflight import SingleFlight
+        self._inner = inner
+        self._cache = cache if cache is not None else LLMCache()
+        self._semantic = semantic
+        self._flight = SingleFlight()
+
+    def _lookup(self, messages, stop, max_tokens, temperature, reasoning_effort):
+        """Return ``(cached, key, split)``; ``key``/``split`` are None when
+        the exact/semantic layer does not apply to this request."""
+        if temperature != 0:
+            return None, None, None
+        key = self._cache.request_key(
+            self._inner.name(), messages, stop, max_tokens, temperature, reasoning_effort,
+        )
+        cached = self._cache.get(key)
+        split = None
+        if self._semantic is not None and stop is None:
+            split = self._semantic.split_request(
+                self._inner.name(), messages, max_tokens, reasoning_effort,
+            )
+        if cached is None and split is not None:
+            cached = self._semantic.get(*split)
+        return cached, key, split
+
+    def _store(self, key, split, response: str) -> None:
+        # An empty answer is as likely a transient failure as a real result;
+        # don't pin it for a week.
+        if not response:
+            return
+        if key is not None:
+            self._cache.set(key, response)
+        if split is not None:
+            self._semantic.set(*split, response)
+
+    def generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,
+    ) -> str:
+        cached, key, split = self._lookup(messages, stop, max_tokens, temperature, reasoning_effort)
+        if cached is not None:
+            return cached
+
+        def call() -> str:
+            return self._inner.generate(
+                messages, stop=stop, max_tokens=max_tokens,
+                temperature=temperature, reasoning_effort=reasoning_effort,
+            )
+
+        if key is None:
+            return call()
+        response, shared = self._flight.do(key, call)
+        if not shared:
+            self._store(key, split, response)
+        return response
+
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,
+    ) -> Iterator[str]:
+        cached, key, split = self._lookup(messages, stop, max_tokens, temperature, reasoning_effort)
+        if cached is not None:
+            yield cached
+            return
+        parts = []
+        for delta in self._inner.stream_generate(
+            messages, stop=stop, max_tokens=max_tokens,
+            temperature=temperature, reasoning_effort=reasoning_effort,
+        ):
+            parts.append(delta)
+            yield delta
+        # Reached only when the stream ran to completion — an abandoned or
+        # failed stream never stores a truncated answer.
+        self._store(key, split, "".join(parts))
+
+    def prewarm(self) -> None:
+        self._inner.prewarm()
+
+    def close(self) -> None:
+        self._inner.close()
+
+    def name(self) -> str:
+        return self._inner.name()
+
+
+# ============================================================================
+# Connection prewarm
+# ============================================================================
+
+def _prewarm_enabled() -> bool:
+    """Whether ``NEO_PREWARM`` opts this process into the connection prewarm.
+
+    Off by default: the prewarm is an extra request to a hosted API, which
+    only pays for itself when the process goes on to make several calls
+    (a long-lived host or daemon). A one-shot CLI run is better off without.
+    """
+    return _env_flag("NEO_PREWARM")
+
+
+def _start_prewarm(adapter: LMAdapter) -> None:
+    """Run ``adapter.prewarm()`` on a daemon thread.
+
+    The first `generate` otherwise pays DNS + TCP + TLS (100-300 ms to a
+    hosted API) after neo has spent its own startup assembling context; doing
+    it in the background overlaps the two and leaves a live socket in the
+    adapter's pool. Failures are logged at debug and otherwise ignored — an
+    unreachable host will surface, with a real error, on the real call.
+    """
+    def _worker():
+        try:
+            adapter.prewarm()
+        except Exception as e:
+            logger.debug("prewarm of %s failed: %s", adapter.name(), e)
+
+    threading.Thread(target=_worker, name="neo-prewarm", daemon=True).start()
+
+
 def _adapter_kwargs_for_config(config) -> dict:
     """Build provider-specific adapter kwargs from config."""
     provider = config.provider.lower()
@@ -1402,6 +2124,7 @@ def resolve_adapter(config) -> LMAdapter:
         logger.warning("unknown inference_mode %r; using 'auto'", mode)
         mode = "auto"
 
+    adapter: Optional[LMAdapter] = None
     if mode == "auto":
         # CAR-first: only build the CAR adapter when CAR is genuinely usable, so
         # we never pay an import/connect error just to fall back.
@@ -1410,7 +2133,17 @@ def resolve_adapter(config) -> LMAdapter:
             from neo.car_inference import is_available as car_available
             if car_available() and is_daemon_reachable():
                 car = create_adapter("car", model=None)  # model=None -> CAR routes dynamically
-                return AutoAdapter(car, build_static)
+                adapter = AutoAdapter(car, build_static)
         except Exception as e:
             logger.debug("CAR-first unavailable, using static provider: %s", e)
-    return build_static()
+    if adapter is None:
+        adapter = build_static()
+    if _llm_cache_enabled() or _semantic_cache_enabled():
+        semantic = None
+        if _semantic_cache_enabled():
+            from neo.llm_cache import SemanticCache
+            semantic = SemanticCache()
+        adapter = CachingAdapter(adapter, semantic=semantic)
+    if _prewarm_enabled():
+        _start_prewarm(adapter)
+    return adapter
@@ -1982,7 +1982,11 @@ CRITICAL: Start with <<<. NO text before, between, or after blocks. id format: "
             logger.debug("role model planning failed: %s", e)
             role_models = {}
         from neo.adapters import create_adapter
-        return build_role_factory(role_models, lambda m: create_adapter("car", model=m), fallback)
+        # Shared: every deliberation asks for the same few role models, so
+        # reuse one adapter per model rather than building one per call.
+        return build_role_factory(
+            role_models, lambda m: create_adapter("car", model=m, shared=True), fallback,
+        )
 
     def _deliberate(self, context: dict[str, Any], route_fn):
         """Run the multi-agent panel. Returns (plan, sims, code, DeliberationResult|None)."""
@@ -0,0 +1,102 @@
+"""
+JSON encode/decode on the provider hot path, using orjson when installed.
+
+orjson parses and serializes several times faster than the stdlib and works
+on ``bytes`` directly, so a response body goes from the socket buffer to a
+dict without an intermediate ``str`` decode. It is an optional speedup
+(``pip install neo-reasoner[speedups]``); without it these fall back to the
+stdlib with the same compact output.
+
+`loads` and `dumps` are for wire payloads — plain dicts of
+str/int/float/bool/None/list. orjson rejects non-str keys and writes NaN as
+null, so state files that may hold other shapes keep using ``json``
+directly. Fact state files are the exception: `dumps_arrays` writes them
+without losing non-finite floats, and `loads_state` reads them, along with
+the NaN/Infinity tokens the stdlib writes and orjson refuses.
+"""
+
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse a JSON document from bytes or str.
+
+    Malformed input raises ``json.JSONDecodeError`` with either backend
+    (orjson's error type subclasses it), so callers catch just that.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_state(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse a state file that the stdlib ``json`` module may have written.
+
+    Like `loads`, but a document orjson refuses is retried with ``json``,
+    which also accepts the NaN / Infinity tokens the stdlib emits for
+    non-finite floats. A document that is really malformed still raises
+    ``json.JSONDecodeError``.
+    """
+    try:
+        return loads(data)
+    except json.JSONDecodeError:
+        if orjson is None:
+            raise
+        return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _ndarray_default(obj: Any) -> Any:
+    tolist = getattr(obj, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return tolist()
+
+
+def _all_finite(obj: Any) -> bool:
+    """False if ``obj`` holds a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(_all_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return all(_all_finite(v) for v in obj)
+    if getattr(obj, "dtype", None) is not None and obj.dtype.kind in "fc":
+        import numpy as np
+        return bool(np.isfinite(obj).all())
+    return True
+
+
+def dumps_arrays(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes, writing numpy arrays.
+
+    For state files that embed numpy arrays (fact embeddings). orjson writes
+    an ndarray straight from its buffer; going through ``tolist()`` first
+    would box every element as a Python float. The stdlib fallback does
+    exactly that, via ``default``. Keys must be str.
+
+    orjson would write NaN and Infinity as null, so a fact would reload with
+    None for a score or a null inside its embedding. A payload holding
+    either goes through the stdlib instead, whose tokens `loads_state`
+    reads back.
+    """
+    if orjson is not None and _all_finite(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_ndarray_default,
+    ).encode("utf-8")
@@ -8,10 +8,10 @@ Supported languages:
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-import hashlib
+from typing import List, Dict, Optional, Tuple, Any, Union, Iterable
 import time
 
 # Deprecated re-export of the canonical extension → tree-sitter
@@ -20,6 +20,7 @@ import time
 # only so existing imports of `LANGUAGE_MAP` continue to work; it
 # will be removed once all consumers have migrated.
 from neo.languages import EXTENSION_TO_LANGUAGE as LANGUAGE_MAP  # noqa: F401
+from neo import fasthash
 
 from tree_sitter import Query, QueryCursor
 from tree_sitter_language_pack import get_parser, get_language
@@ -45,6 +46,9 @@ logger = logging.getLogger(__name__)
 # Constants
 MAX_CHUNK_LENGTH = 2000  # Characters per chunk
 
+# Capture names that mark a whole definition (the chunk) in QUERIES
+_CONSTRUCT_TAGS = frozenset({'function', 'class', 'method', 'interface', 'struct'})
+
 
 @dataclass
 class CodeEdge:
@@ -395,6 +399,61 @@ EDGE_QUERIES = {
 
 EDGE_QUERIES['tsx'] = EDGE_QUERIES['typescript']
 
+# Compiled queries shared by every TreeSitterParser in the process, keyed by
+# (table, language, query_name). A Query is immutable once compiled (matching
+# state lives in the per-run QueryCursor), so sharing is safe across threads;
+# compiling is the expensive part and the inputs are the constant tables above.
+# A failed compile is cached as None so it is attempted (and logged) once.
+_QUERY_CACHE: Dict[Tuple[str, str, str], Any] = {}
+_QUERY_CACHE_LOCK = threading.Lock()
+
+_QUERY_TABLES = {"chunks": QUERIES, "edges": EDGE_QUERIES}
+
+
+def _compiled_query(table: str, language: str, query_name: str):
+    """Return the compiled query, compiling it on first use."""
+    key = (table, language, query_name)
+    try:
+        return _QUERY_CACHE[key]
+    except KeyError:
+        pass
+    query_text = _QUERY_TABLES[table].get(language, {}).get(query_name)
+    if query_text is None:
+        return None
+    with _QUERY_CACHE_LOCK:
+        if key not in _QUERY_CACHE:
+            try:
+                # tree-sitter 0.23+: Query(language, text). Older
+                # Language.query(text) is deprecated and removed in
+                # newer versions.
+                _QUERY_CACHE[key] = Query(get_language(_resolve_parser_name(language)), query_text)
+                logger.debug(f"Compiled query {table}:{language}:{query_name}")
+            except Exception as e:
+                logger.warning(f"Failed to compile query {language}:{query_name}: {e}")
+                _QUERY_CACHE[key] = None
+        return _QUERY_CACHE[key]
+
+
+def precompile_all(languages: Optional[Iterable[str]] = None) -> None:
+    """Compile the chunk and edge queries up front.
+
+    For indexers that would rather pay the compile cost before fanning out
+    than have worker threads queue on the compile lock for the first file of
+    each language. ``languages`` limits it to those languages (all if None).
+    """
+    wanted = None if languages is None else set(languages)
+    for table, queries in _QUERY_TABLES.items():
+        for language, named in queries.items():
+            if wanted is not None and language not in wanted:
+                continue
+            for query_name in named:
+                _compiled_query(table, language, query_name)
+
+
+def _as_bytes(content: Union[str, bytes]) -> bytes:
+    """UTF-8 bytes of content; bytes (e.g. from read_bytes) pass through."""
+    return content.encode('utf8') if isinstance(content, str) else content
+
 
 class TreeSitterParser:
     """
@@ -406,9 +465,23 @@ class TreeSitterParser:
 
     def __init__(self):
         """Initialize parser with lazy loading."""
-        self.parsers: Dict[str, Any] = {}  # Lazy-loaded parsers per language
+        self._local = threading.local()  # Per-thread parsers (see `parsers`)
         self.languages: Dict[str, Any] = {}  # Language objects
-        self.compiled_queries: Dict[str, Dict[str, Any]] = {}  # Compiled queries
+        self.compiled_queries = _QUERY_CACHE  # Shared across instances
+
+    @property
+    def parsers(self) -> Dict[str, Any]:
+        """Lazy-loaded parsers per language, for the calling thread.
+
+        A tree-sitter Parser holds mutable parse state and must not be used
+        from two threads at once, so each thread gets its own; Language and
+        compiled Query objects are immutable and shared.
+        """
+        try:
+            return self._local.parsers
+        except AttributeError:
+            self._local.parsers = {}
+            return self._local.parsers
 
     def supports_extension(self, ext: str) -> bool:
         """Check if file extension is supported."""
@@ -433,30 +506,8 @@ class TreeSitterParser:
         return self.parsers[language]
 
     def _get_query(self, language: str, query_name: str):
-        """Get or compile query for language."""
-        cache_key = f"{language}:{query_name}"
-        if cache_key not in self.compiled_queries:
-            if language not in QUERIES or query_name not in QUERIES[language]:
-                return None
-
-            query_text = QUERIES[language][query_name]
-            lang_obj = self.languages.get(language)
-            if not lang_obj:
-                # Ensure language is loaded
-                self._get_parser(language)
-                lang_obj = self.languages[language]
-
-            try:
-                # tree-sitter 0.23+: Query(language, text). Older
-                # Language.query(text) is deprecated and removed in
-                # newer versions.
-                self.compiled_queries[cache_key] = Query(lang_obj, query_text)
-                logger.debug(f"Compiled query {cache_key}")
-            except Exception as e:
-                logger.warning(f"Failed to compile query {cache_key}: {e}")
-                return None
-
-        return self.compiled_queries.get(cache_key)
+        """Get the compiled chunk query for language (see `_compiled_query`)."""
+        return _compiled_query("chunks", language, query_name)
 
     @staticmethod
     def _run_query(query, root_node) -> List[Tuple[Any, str]]:
@@ -482,7 +533,7 @@ class TreeSitterParser:
     def parse_file(
         self,
         file_path: Path,
-        content: str,
+        content: Union[str, bytes],
         language: Optional[str] = None
     ) -> List[CodeChunk]:
         """
@@ -490,7 +541,7 @@ class TreeSitterParser:
 
         Args:
             file_path: Path to source file
-            content: File content as string
+            content: File content, as UTF-8 bytes or a string
             language: Language name (auto-detected if None)
 
         Returns:
@@ -508,16 +559,18 @@ class TreeSitterParser:
             return []
 
         try:
-            # Parse file
+            # Parse file. Encode once: the tree, the hash and every chunk
+            # slice work on the same UTF-8 buffer.
+            content_bytes = _as_bytes(content)
             parser = self._get_parser(language)
-            tree = parser.parse(bytes(content, 'utf8'))
+            tree = parser.parse(content_bytes)
 
             # Extract chunks
             chunks = []
-            file_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            file_hash = fasthash.digest(content_bytes)
 
             # Extract edges for import list
-            edges = self._extract_edges(tree, content, str(file_path), language)
+            edges = self._extract_edges(tree, content_bytes, str(file_path), language)
             import_symbols = [e.target_symbol for e in edges if e.edge_type == "imports"]
 
             # Extract each type of construct (functions, classes, etc.)
@@ -526,10 +579,10 @@ class TreeSitterParser:
                 if not query:
                     continue
 
-                captures = self._run_query(query, tree.root_node)
-                chunks.extend(self._process_captures(
-                    captures,
-                    content,
+                matches = QueryCursor(query).matches(tree.root_node)
+                chunks.extend(self._process_matches(
+                    matches,
+                    content_bytes,
                     str(file_path),
                     file_hash,
                     query_name,
@@ -545,7 +598,7 @@ class TreeSitterParser:
     def extract_edges(
         self,
         file_path: Path,
-        content: str,
+        content: Union[str, bytes],
         language: Optional[str] = None
     ) -> List[CodeEdge]:
         """
@@ -553,7 +606,7 @@ class TreeSitterParser:
 
         Args:
             file_path: Path to source file
-            content: File content as string
+            content: File content, as UTF-8 bytes or a string
             language: Language name (auto-detected if None)
 
         Returns:
@@ -566,9 +619,10 @@ class TreeSitterParser:
             return []
 
         try:
+            content_bytes = _as_bytes(content)
             parser = self._get_parser(language)
-            tree = parser.parse(bytes(content, 'utf8'))
-            return self._extract_edges(tree, content, str(file_path), language)
+            tree = parser.parse(content_bytes)
+            return self._extract_edges(tree, content_bytes, str(file_path), language)
         except Exception as e:
             logger.error(f"Failed to extract edges from {file_path}: {e}")
             return []
@@ -576,7 +630,7 @@ class TreeSitterParser:
     def _extract_edges(
         self,
         tree,
-        content: str,
+        content_bytes: bytes,
         file_path: str,
         language: str
     ) -> List[CodeEdge]:
@@ -585,16 +639,12 @@ class TreeSitterParser:
             return []
 
         edges = []
-        content_bytes = content.encode('utf8')
 
-        for query_name, query_text in EDGE_QUERIES[language].items():
+        for query_name in EDGE_QUERIES[language]:
+            query = _compiled_query("edges", language, query_name)
+            if query is None:
+                continue
             try:
-                lang_obj = self.languages.get(language)
-                if not lang_obj:
-                    self._get_parser(language)
-                    lang_obj = self.languages[language]
-
-                query = Query(lang_obj, query_text)
                 captures = self._run_query(query, tree.root_node)
             except Exception as e:
                 logger.debug(f"Edge query {query_name} failed for {language}: {e}")
@@ -628,7 +678,7 @@ class TreeSitterParser:
                 module_text = content_bytes[node.start_byte:node.end_byte].decode('utf8')
                 # Strip quotes from string literals (JS/TS/Go imports)
                 module_text = module_text.strip('\'"')
-                line = content_bytes[:node.start_byte].count(b'\n') + 1
+                line = node.start_point[0] + 1
                 edges.append(CodeEdge(
                     source_file=file_path,
                     source_symbol="",
@@ -654,7 +704,7 @@ class TreeSitterParser:
             if capture_name == 'class_name':
                 current_class = text
             elif capture_name in ('base', 'interface') and current_class:
-                line = content_bytes[:node.start_byte].count(b'\n') + 1
+                line = node.start_point[0] + 1
                 edges.append(CodeEdge(
                     source_file=file_path,
                     source_symbol=current_class,
@@ -664,77 +714,64 @@ class TreeSitterParser:
                 ))
         return edges
 
-    def _process_captures(
+    def _process_matches(
         self,
-        captures: List[Tuple],
-        content: str,
+        matches: List[Tuple[int, Dict[str, List[Any]]]],
+        content_bytes: bytes,
         file_path: str,
         file_hash: str,
         query_type: str,
         import_symbols: Optional[List[str]] = None
     ) -> List[CodeChunk]:
-        """Process tree-sitter query captures into CodeChunks."""
+        """Process tree-sitter query matches into CodeChunks.
+
+        Each match of a chunk query holds one construct capture (@function,
+        @class, ...) together with the @name captured inside that same
+        pattern, so a name never has to be searched for among the
+        constructs - nested definitions are separate matches.
+        """
         chunks = []
-        content_bytes = content.encode('utf8')
 
-        # Group captures by their parent construct
-        constructs = {}  # node_id -> {name, body, start, end}
+        # One construct per match: every chunk query is a single pattern, so
+        # a definition is matched once and needs no dedup by node.
+        constructs = []
 
-        for node, capture_name in captures:
+        for _pattern_index, match in matches:
             # Find the parent construct (the one with full definition)
-            if capture_name in ['function', 'class', 'method', 'interface', 'struct']:
-                node_id = id(node)
-                if node_id not in constructs:
-                    constructs[node_id] = {
-                        'node': node,
-                        'type': capture_name,
-                        'name': None,
-                        'symbols': []
-                    }
-            elif capture_name == 'name':
-                # Find which construct this name belongs to
-                name_text = content_bytes[node.start_byte:node.end_byte].decode('utf8')
-
-                # Find the smallest construct that contains this name
-                # (handles nested constructs correctly)
-                containing_construct = None
-                smallest_size = float('inf')
-
-                for construct_id, construct in constructs.items():
-                    construct_node = construct['node']
-                    # Check if name is within this construct
-                    if (node.start_byte >= construct_node.start_byte and
-                        node.end_byte <= construct_node.end_byte):
-                        # Track the smallest containing construct
-                        construct_size = construct_node.end_byte - construct_node.start_byte
-                        if construct_size < smallest_size:
-                            smallest_size = construct_size
-                            containing_construct = construct
-
-                if containing_construct is not None:
-                    if containing_construct['name'] is None:
-                        containing_construct['name'] = name_text
-                        containing_construct['symbols'].append(name_text)
-                    else:
-                        # Additional symbol (e.g., method in a class)
-                        if name_text not in containing_construct['symbols']:
-                            containing_construct['symbols'].append(name_text)
-
-        # Create chunks from constructs
-        for construct_id, construct in constructs.items():
+            capture_name = next((c for c in match if c in _CONSTRUCT_TAGS), None)
+            if capture_name is None:
+                continue
+            construct = {
+                'node': match[capture_name][0],
+                'type': capture_name,
+                'name': None,
+                'symbols': []
+            }
+            constructs.append(construct)
+            for name_node in match.get('name', ()):
+                name_text = content_bytes[name_node.start_byte:name_node.end_byte].decode('utf8')
+                if construct['name'] is None:
+                    construct['name'] = name_text
+                if name_text not in construct['symbols']:
+                    construct['symbols'].append(name_text)
+
+        # Create chunks from constructs, in document order (a match is
+        # reported when it completes, so an outer construct can come last)
+        constructs.sort(key=lambda c: c['node'].start_byte)
+        for construct in constructs:
             node = construct['node']
             name = construct.get('name', 'anonymous')
 
-            # Extract content
-            chunk_content = content_bytes[node.start_byte:node.end_byte].decode('utf8')
-
-            # Truncate if too long
-            if len(chunk_content) > MAX_CHUNK_LENGTH:
-                chunk_content = chunk_content[:MAX_CHUNK_LENGTH]
+            # Extract content, truncated to MAX_CHUNK_LENGTH characters.
+            # Cut the bytes first - a UTF-8 character is at most 4 bytes -
+            # so a huge body isn't decoded only to be thrown away; 'ignore'
+            # drops a character split by that cut.
+            raw = content_bytes[node.start_byte:min(node.end_byte, node.start_byte + 4 * MAX_CHUNK_LENGTH)]
+            chunk_content = raw.decode('utf8', errors='ignore')[:MAX_CHUNK_LENGTH]
 
-            # Calculate line numbers
-            start_line = content[:node.start_byte].count('\n') + 1
-            end_line = content[:node.end_byte].count('\n') + 1
+            # Line numbers come from the parse itself (0-based rows)
+            start_line = node.start_point[0] + 1
+            end_line = node.end_point[0] + 1
 
             # Create chunk
             chunk = CodeChunk(
@@ -18,18 +18,19 @@ Design philosophy:
 - Zero hidden CPU work (all indexing is explicit or budgeted)
 """
 
-import hashlib
 import json
 import logging
 import os
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple, Any
 import numpy as np
 
-from neo.index.language_parser import TreeSitterParser
+from neo import fasthash
+from neo.index.language_parser import TreeSitterParser, precompile_all
 
 # Import FAISS for fast similarity search
 try:
@@ -346,6 +347,7 @@ class ProjectIndex:
         # Extract chunks and edges from each file
         all_chunks = []
         all_edges = []
+        to_parse = []
         for file_path in files_to_index:
             # Security: Reject symlinks and paths outside repo
 
@@ -370,16 +372,21 @@ class ProjectIndex:
                 continue
 
             rel_path = file_path.relative_to(self.repo_root)
-            chunks = self._extract_chunks_from_file(file_path, str(rel_path))
-            all_chunks.extend(chunks)
-
-            # Extract edges
-            edges = self._extract_edges_from_file(file_path, str(rel_path))
-            all_edges.extend(edges)
-
-            # Track file hash
-            file_hash = self._compute_file_hash(file_path)
-            self.snapshot.file_hashes[str(rel_path)] = file_hash
+            to_parse.append((file_path, str(rel_path)))
+
+        # Compile this build's queries once here rather than having the
+        # workers queue on the compile lock for each language's first file.
+        precompile_all({self.parser.detect_language(path) for path, _ in to_parse})
+
+        # Parse on a thread pool (TreeSitterParser keeps a parser per thread
+        # and tree-sitter parses without the GIL); map keeps file order, so
+        # the chunk cap below still keeps the same chunks.
+        with ThreadPoolExecutor() as pool:
+            results = pool.map(lambda item: self._index_file(*item), to_parse)
+            for rel_path, chunks, edges, file_hash in results:
+                all_chunks.extend(chunks)
+                all_edges.extend(edges)
+                self.snapshot.file_hashes[rel_path] = file_hash
 
         # Limit total chunks (take top N by some scoring)
         if len(all_chunks) > MAX_CHUNKS_PER_REPO:
@@ -556,6 +563,17 @@ class ProjectIndex:
         elapsed_ms = (time.time() - start_time) * 1000
         logger.info(f"Refreshed {len(updated_chunks)} chunks in {elapsed_ms:.0f}ms")
 
+    def _index_file(
+        self, file_path: Path, rel_path: str
+    ) -> Tuple[str, List[CodeChunk], List[Dict[str, Any]], str]:
+        """Chunks, edges and content hash for one file (thread-safe)."""
+        return (
+            rel_path,
+            self._extract_chunks_from_file(file_path, rel_path),
+            self._extract_edges_from_file(file_path, rel_path),
+            self._compute_file_hash(file_path),
+        )
+
     def _extract_chunks_from_file(self, file_path: Path, rel_path: str) -> List[CodeChunk]:
         """
         Extract semantic chunks from a file using tree-sitter.
@@ -575,8 +593,8 @@ class ProjectIndex:
                 logger.debug(f"Unsupported file extension: {file_path.suffix}")
                 return []
 
-            # Read file content
-            content = file_path.read_text(encoding='utf-8')
+            # Read raw bytes; the parser works on UTF-8 bytes directly
+            content = file_path.read_bytes()
 
             # Parse using tree-sitter
             parser_chunks = self.parser.parse_file(file_path, content)
@@ -614,7 +632,7 @@ class ProjectIndex:
             if not self.parser.supports_extension(file_path.suffix):
                 return []
 
-            content = file_path.read_text(encoding='utf-8')
+            content = file_path.read_bytes()
             parser_edges = self.parser.extract_edges(file_path, content)
 
             return [
@@ -745,10 +763,9 @@ class ProjectIndex:
         logger.info(f"Built FAISS index with {self.faiss_index.ntotal} vectors (dim={dim})")
 
     def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA-256 hash of file contents."""
+        """Compute the content hash of a file (see `neo.fasthash`)."""
         try:
-            content = file_path.read_bytes()
-            return hashlib.sha256(content).hexdigest()
+            return fasthash.file_digest(file_path)
         except Exception as e:
             logger.error(f"Failed to hash {file_path}: {e}")
             return ""
@@ -0,0 +1,355 @@
+"""
+Deterministic on-disk cache for LM responses.
+
+A ``temperature == 0`` request to the same model with the same messages and
+parameters is a rerun — an eval, a retried tool prompt, the constraint and
+pattern-extraction calls neo makes at temperature 0 on every invocation. This
+cache answers those from disk instead of paying the round-trip again.
+
+Opt-in via ``NEO_LLM_CACHE=1`` (see ``adapters.resolve_adapter``): a cached
+answer is by definition stale with respect to any server-side model update,
+so it must never be the silent default.
+
+Backed by stdlib ``sqlite3`` at ``~/.neo/llm_cache.sqlite3``:
+- The path is resolved at call time so per-test ``Path.home()`` stubs apply
+  (mirrors ``adapters._ModelParamCompat``).
+- SQLite gives concurrent neo processes safe reads and serialized writes
+  without a separate lock file.
+- The cache is best-effort: any I/O or database failure degrades to a miss
+  and never breaks inference.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+#: Entries expire after a week. Long enough to cover an eval cycle or a day of
+#: development reruns; short enough that a provider-side model update is picked
+#: up without anyone remembering to clear the cache.
+DEFAULT_TTL_S = 7 * 24 * 3600.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS responses ("
+    " key TEXT PRIMARY KEY,"
+    " value TEXT NOT NULL,"
+    " expires_at REAL NOT NULL)"
+)
+
+
+class LLMCache:
+    """Key/value store of LM responses with per-entry expiry.
+
+    Hit/miss counters are process-wide (shared by every instance), so
+    `stats()` reports the cache's effect across all adapters in the process.
+    """
+
+    _hits = 0
+    _misses = 0
+    _stats_lock = threading.Lock()
+
+    def __init__(self, path: Optional[Path] = None, default_ttl: float = DEFAULT_TTL_S):
+        self._path = path
+        self.default_ttl = default_ttl
+
+    def _resolve(self) -> Path:
+        return self._path or Path.home() / ".neo" / "llm_cache.sqlite3"
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self._resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=5.0)
+        conn.execute(_SCHEMA)
+        return conn
+
+    @staticmethod
+    def request_key(
+        name: str,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]],
+        max_tokens: int,
+        temperature: float,
+        reasoning_effort: Optional[str],
+    ) -> str:
+        """Hash everything that can change the response.
+
+        ``name`` is the adapter's ``provider/model`` so two providers serving
+        a same-named model never share an entry.
+        """
+        blob = json.dumps(
+            {
+                "name": name,
+                "messages": messages,
+                "stop": stop,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "reasoning_effort": reasoning_effort,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        value = None
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            finally:
+                conn.close()
+            if row is not None:
+                value = row[0]
+        except (OSError, sqlite3.Error):
+            logger.debug("llm cache get() failed; treating as a miss", exc_info=True)
+        with LLMCache._stats_lock:
+            if value is None:
+                LLMCache._misses += 1
+            else:
+                LLMCache._hits += 1
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                        "VALUES (?, ?, ?)",
+                        (key, value, expires_at),
+                    )
+                    # Expired rows are dead weight; sweep them on write, the
+                    # rare path, rather than on every read.
+                    conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            finally:
+                conn.close()
+        except (OSError, sqlite3.Error):
+            logger.debug("llm cache set() failed; skipping", exc_info=True)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Process-wide hit/miss counters."""
+        with cls._stats_lock:
+            hits, misses = cls._hits, cls._misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        with cls._stats_lock:
+            cls._hits = 0
+            cls._misses = 0
+
+
+#: Cosine similarity at or above which a paraphrased prompt reuses a cached
+#: answer. Deliberately well above the 0.85 fact-supersession threshold: a
+#: wrong reuse here returns another prompt's answer verbatim, not a merged fact.
+SEMANTIC_THRESHOLD = 0.92
+
+#: Semantic entries live an hour, not a week — a near-miss is a weaker
+#: guarantee than an exact match, so it gets less time to go stale.
+SEMANTIC_TTL_S = 3600.0
+
+#: Rows kept per namespace; the oldest are dropped past this. A namespace is
+#: one conversation prefix, so this only bites on a long burst of distinct
+#: follow-ups, and it bounds the matmul each lookup pays.
+SEMANTIC_MAX_ROWS = 256
+
+#: Recent query embeddings kept in memory. `set` runs right after the `get`
+#: that missed on the same query; the memo saves embedding it a second time.
+#: A few entries cover concurrent requests interleaving between the two.
+_EMBED_MEMO_SIZE = 32
+
+_SEMANTIC_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS semantic ("
+    " namespace TEXT NOT NULL,"
+    " embedding BLOB NOT NULL,"
+    " value TEXT NOT NULL,"
+    " expires_at REAL NOT NULL)"
+)
+
+
+class SemanticCache:
+    """Reuse a response when only the final user message was paraphrased.
+
+    Everything except the last user message — adapter, system prompt, earlier
+    turns, parameters — must match exactly; it forms the ``namespace`` hash.
+    Within a namespace the last message is embedded and compared against the
+    stored ones. The candidate set per namespace is small (one conversation
+    prefix, an hour of entries), so a single numpy matmul over it is exact and
+    cheaper than maintaining an ANN index.
+
+    The embedder defaults to the same local Jina model the FactStore uses
+    (`memory.store.build_resilient_embedder`), built on first use. With no
+    embedder available every lookup is a miss.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        threshold: float = SEMANTIC_THRESHOLD,
+        ttl: float = SEMANTIC_TTL_S,
+        embed=None,
+    ):
+        self._path = path
+        self.threshold = threshold
+        self.ttl = ttl
+        self._embed_fn = embed
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+        self._memo: "OrderedDict[str, object]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def _resolve(self) -> Path:
+        return self._path or Path.home() / ".neo" / "llm_cache.sqlite3"
+
+    def _connect(self) -> sqlite3.Connection:
+        path = self._resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=5.0)
+        conn.execute(_SEMANTIC_SCHEMA)
+        return conn
+
+    def _embed(self, text: str):
+        with self._memo_lock:
+            if text in self._memo:
+                self._memo.move_to_end(text)
+                return self._memo[text]
+        vec = self._embed_uncached(text)
+        with self._memo_lock:
+            self._memo[text] = vec
+            if len(self._memo) > _EMBED_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return vec
+
+    def _embed_uncached(self, text: str):
+        import numpy as np
+
+        if self._embed_fn is not None:
+            vec = self._embed_fn(text)
+        else:
+            with self._embedder_lock:
+                if self._embedder is None:
+                    from neo.memory.store import build_resilient_embedder
+                    self._embedder = build_resilient_embedder(log_prefix="SemanticCache") or False
+            if not self._embedder:
+                return None
+            vec = next(iter(self._embedder.embed([text])), None)
+        if vec is None:
+            return None
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if not np.isfinite(norm) or norm == 0.0:
+            return None
+        return vec / norm
+
+    @staticmethod
+    def split_request(
+        name: str,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        reasoning_effort: Optional[str],
+    ) -> Optional[tuple[str, str]]:
+        """Return ``(namespace, query)`` or None when the request has no
+        trailing user message to compare on."""
+        if not messages or messages[-1].get("role") != "user":
+            return None
+        blob = json.dumps(
+            {
+                "name": name,
+                "prefix": messages[:-1],
+                "max_tokens": max_tokens,
+                "reasoning_effort": reasoning_effort,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest(), messages[-1]["content"]
+
+    @staticmethod
+    def _nearest(conn: sqlite3.Connection, namespace: str, vec) -> Optional[tuple]:
+        """``(rowid, value, similarity)`` of the closest live row, if any."""
+        import numpy as np
+
+        rows = conn.execute(
+            "SELECT rowid, embedding, value FROM semantic "
+            "WHERE namespace = ? AND expires_at > ?",
+            (namespace, time.time()),
+        ).fetchall()
+        rows = [r for r in rows if len(r[1]) == vec.nbytes]
+        if not rows:
+            return None
+        matrix = np.frombuffer(b"".join(r[1] for r in rows), dtype=np.float32)
+        sims = matrix.reshape(len(rows), -1) @ vec
+        best = int(np.argmax(sims))
+        return rows[best][0], rows[best][2], float(sims[best])
+
+    def get(self, namespace: str, query: str) -> Optional[str]:
+        try:
+            vec = self._embed(query)
+            if vec is None:
+                return None
+            conn = self._connect()
+            try:
+                nearest = self._nearest(conn, namespace, vec)
+            finally:
+                conn.close()
+            if nearest is not None and nearest[2] >= self.threshold:
+                return nearest[1]
+        except Exception:
+            logger.debug("semantic cache get() failed; treating as a miss", exc_info=True)
+        return None
+
+    def set(self, namespace: str, query: str, value: str) -> None:
+        """Store ``value`` for ``query``, replacing a near-duplicate row.
+
+        A query that would already hit an existing row overwrites it rather
+        than adding a second copy, and the namespace is trimmed to
+        `SEMANTIC_MAX_ROWS`, newest first.
+        """
+        try:
+            vec = self._embed(query)
+            if vec is None:
+                return
+            expires_at = time.time() + self.ttl
+            conn = self._connect()
+            try:
+                with conn:
+                    nearest = self._nearest(conn, namespace, vec)
+                    if nearest is not None and nearest[2] >= self.threshold:
+                        conn.execute(
+                            "UPDATE semantic SET embedding = ?, value = ?, expires_at = ? "
+                            "WHERE rowid = ?",
+                            (vec.tobytes(), value, expires_at, nearest[0]),
+                        )
+                    else:
+                        conn.execute(
+                            "INSERT INTO semantic (namespace, embedding, value, expires_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (namespace, vec.tobytes(), value, expires_at),
+                        )
+                    conn.execute(
+                        "DELETE FROM semantic WHERE namespace = ? AND rowid NOT IN ("
+                        " SELECT rowid FROM semantic WHERE namespace = ?"
+                        " ORDER BY expires_at DESC, rowid DESC LIMIT ?)",
+                        (namespace, namespace, SEMANTIC_MAX_ROWS),
+                    )
+                    conn.execute("DELETE FROM semantic WHERE expires_at <= ?", (time.time(),))
+            finally:
+                conn.close()
+        except Exception:
+            logger.debug("semantic cache set() failed; skipping", exc_info=True)
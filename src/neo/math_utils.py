@@ -9,23 +9,62 @@ import logging
 
 import numpy as np
 
+try:
+    import simsimd as _simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    _simsimd = None
+    SIMSIMD_AVAILABLE = False
+
 _logger = logging.getLogger(__name__)
 
 
+def _dot(a: np.ndarray, b: np.ndarray) -> float:
+    """Dot product of two vectors, through simsimd when it's installed.
+
+    For a single pair of 768-d vectors the numpy/BLAS call overhead dominates
+    the arithmetic; simsimd's SIMD kernels are a few times faster per call.
+    It only takes matching dtypes, so anything else (float64 against float32,
+    lists) goes to ``np.dot``, which also raises the usual errors.
+    """
+    if _simsimd is not None:
+        try:
+            return float(_simsimd.dot(a, b))
+        except (TypeError, ValueError):
+            pass
+    return float(np.dot(a, b))
+
+
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     """Compute cosine similarity between two vectors.
 
-    Returns 0.0 for zero-norm or non-finite vectors.
+    Returns 0.0 for zero-norm or non-finite vectors. A NaN or Inf anywhere in
+    a vector makes its squared norm non-finite, so checking the two norms
+    covers the inputs without scanning them separately.
     """
-    if not np.isfinite(a).all() or not np.isfinite(b).all():
+    sq_a = _dot(a, a)
+    sq_b = _dot(b, b)
+    if not (math.isfinite(sq_a) and math.isfinite(sq_b)):
         _logger.debug("cosine_similarity: NaN or Inf values in input vectors")
         return 0.0
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
-    if norm_a == 0 or norm_b == 0:
+    if sq_a == 0.0 or sq_b == 0.0:
         _logger.debug("cosine_similarity: zero-norm vector")
         return 0.0
-    return float(np.dot(a, b) / (norm_a * norm_b))
+    return _dot(a, b) / math.sqrt(sq_a * sq_b)
+
+
+def normalize(v: np.ndarray) -> np.ndarray:
+    """``v`` as a contiguous float32 vector of unit L2 norm.
+
+    Zero-norm and non-finite vectors are returned as float32 but otherwise
+    unchanged, so callers that treat them as "no signal" still see them. A
+    vector that is already unit length (a reloaded fact) is not copied.
+    """
+    v = np.ascontiguousarray(v, dtype=np.float32)
+    sq = float(np.dot(v, v))
+    if sq == 0.0 or not math.isfinite(sq) or abs(sq - 1.0) < 1e-6:
+        return v
+    return v / np.float32(math.sqrt(sq))
 
 
 _RECALL_NORMALIZER = 1.0 - math.exp(-1.0)  # ≈ 0.6321, so r=1,t=0 → p=1
@@ -57,6 +96,26 @@ def recall_probability(
     return max(0.0, min(1.0, p))
 
 
+def recall_probabilities(
+    cosine: np.ndarray,
+    *,
+    days_since_recall: np.ndarray,
+    g_n: np.ndarray,
+) -> np.ndarray:
+    """`recall_probability` elementwise over arrays, with the same edge cases."""
+    bad = g_n <= 0.0
+    if bad.any():
+        _logger.warning(
+            "recall_probability: %d invalid g_n values, falling back to 1.0", int(bad.sum())
+        )
+        g_n = np.where(bad, 1.0, g_n)
+    with np.errstate(all="ignore"):
+        inner = cosine * np.exp(-np.maximum(0.0, days_since_recall) / g_n)
+        p = (1.0 - np.exp(-inner)) / _RECALL_NORMALIZER
+    p = np.where(np.isfinite(p) & (cosine > 0.0), p, 0.0)
+    return np.clip(p, 0.0, 1.0)
+
+
 def g_n_update(g_n: float, days_since_last: float) -> float:
     """Spaced-repetition strengthening for g_n.
 
@@ -70,6 +129,157 @@ def g_n_update(g_n: float, days_since_last: float) -> float:
     return g_n + (1.0 - e) / (1.0 + e)
 
 
+def unit_rows(
+    embeddings: list[Optional[np.ndarray]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stack embeddings into one float32 matrix of unit-length rows.
+
+    Returns ``(matrix, indices)``: ``matrix[j]`` is ``embeddings[indices[j]]``
+    scaled to unit L2 norm. None, zero-norm and non-finite embeddings are left
+    out. Normalizing once up front means scoring a query against the rows is a
+    single matrix-vector product, so callers that score many queries against
+    the same embeddings can keep the result and skip the stacking and norms.
+    """
+    rows: list[np.ndarray] = []
+    row_indices: list[int] = []
+    for i, e in enumerate(embeddings):
+        if e is None:
+            continue
+        rows.append(e)
+        row_indices.append(i)
+    if not rows:
+        return np.empty((0, 0), dtype=np.float32), np.empty(0, dtype=np.intp)
+
+    matrix = np.asarray(rows, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    keep = np.isfinite(norms) & (norms > 0.0)
+    matrix = matrix[keep] / norms[keep, None]
+    return matrix, np.asarray(row_indices, dtype=np.intp)[keep]
+
+
+def quantize_rows(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: ``matrix ≈ q8 * scales[:, None]``.
+
+    Each row is scaled so its largest magnitude maps to 127. For unit rows the
+    reconstructed cosine is within about 1e-3 of the float32 value — enough to
+    rank by, at a quarter of the memory traffic.
+    """
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0.0] = 1.0
+    q8 = np.round(matrix / scales[:, None]).astype(np.int8)
+    return q8, scales.astype(np.float32)
+
+
+def _int8_dots(q8: np.ndarray, scales: np.ndarray, q_hat: np.ndarray) -> np.ndarray:
+    """Approximate ``dequantized(q8) @ q_hat`` with an int8 SIMD kernel."""
+    q_scale = float(np.abs(q_hat).max()) / 127.0
+    qq = np.round(q_hat / q_scale).astype(np.int8)
+    dots = np.asarray(_simsimd.cdist(q8, qq[None, :], metric="dot"))[:, 0]
+    # Dequantize in float: the int8 products are exact only in a wider
+    # accumulator, and the scales put them back on the cosine range.
+    return dots * scales * q_scale
+
+
+def cosine_against_rows(
+    matrix: np.ndarray,
+    indices: np.ndarray,
+    n: int,
+    query: Optional[np.ndarray],
+    *,
+    default: float = 0.5,
+    quantized: Optional[tuple[np.ndarray, np.ndarray]] = None,
+) -> list[float]:
+    """Cosine of ``query`` against a `unit_rows` matrix, as a length-``n`` list.
+
+    Positions not in ``indices`` — and every position when ``query`` is None
+    or zero-norm — get ``default``. ``quantized`` is `quantize_rows(matrix)`;
+    when given (simsimd required) the int8 copy is scored instead of the
+    float32 one.
+    """
+    sims = [default] * n
+    if query is None or len(indices) == 0:
+        return sims
+
+    q = np.asarray(query, dtype=np.float32)
+    q_norm = float(np.linalg.norm(q))
+    if q_norm == 0.0 or not np.isfinite(q_norm):
+        return sims
+
+    q_hat = q / q_norm
+    if quantized is not None:
+        cos = _int8_dots(*quantized, q_hat)
+    else:
+        cos = matrix @ q_hat
+    for idx, c in zip(indices.tolist(), cos.tolist()):
+        if math.isfinite(c):
+            sims[idx] = c
+    return sims
+
+
+#: Row count from which retrieval scores against an int8 copy of the
+#: embedding matrix (needs simsimd). Scoring is memory-bound once the matrix
+#: outgrows cache; below this the float32 GEMV is already fast and exact.
+Q8_MIN_ROWS = 2048
+
+
+class EmbeddingMatrix:
+    """`batched_cosine` that keeps its stacked, normalized matrix between calls.
+
+    Retrieval scores query after query against the same fact embeddings
+    until the store changes. This holds the `unit_rows` matrix — one
+    contiguous float32 block — for the last embedding list it saw and reuses
+    it while the list holds the same array objects, so a repeat query costs
+    one matrix-vector product. Matching is by identity, and the held
+    references keep ids from being recycled. An array edited in place is
+    still the same object, so it keeps its stale score until the list is
+    rebuilt; callers must replace embeddings, never mutate them.
+
+    With ``quantize_from`` set and simsimd installed, lists of at least that
+    many usable rows are scored against an int8 copy (`quantize_rows`), which
+    only approximates the float32 cosine.
+    """
+
+    def __init__(self, *, quantize_from: Optional[int] = None) -> None:
+        self._quantize_from = quantize_from if SIMSIMD_AVAILABLE else None
+        self._cached: Optional[tuple] = None
+
+    def cosines(
+        self,
+        embeddings: list[Optional[np.ndarray]],
+        query: Optional[np.ndarray],
+        *,
+        default: float = 0.5,
+    ) -> list[float]:
+        """``batched_cosine(embeddings, query, default=...)``, from the cache.
+
+        Exact on the float32 path. The int8 path quantizes both the rows and
+        the query, so each score is only within about 1e-2 of the float32
+        value: close enough to rank by, but not identical.
+        """
+        n = len(embeddings)
+        if n == 0:
+            return []
+        if query is None:
+            return [default] * n
+
+        cached = self._cached
+        if (
+            cached is not None
+            and len(cached[0]) == n
+            and all(a is b for a, b in zip(cached[0], embeddings))
+        ):
+            _, matrix, indices, quantized = cached
+        else:
+            matrix, indices = unit_rows(embeddings)
+            quantized = None
+            if self._quantize_from is not None and len(indices) >= self._quantize_from:
+                quantized = quantize_rows(matrix)
+            self._cached = (list(embeddings), matrix, indices, quantized)
+        return cosine_against_rows(
+            matrix, indices, n, query, default=default, quantized=quantized,
+        )
+
+
 def batched_cosine(
     embeddings: list[Optional[np.ndarray]],
     query: Optional[np.ndarray],
@@ -87,36 +297,8 @@ def batched_cosine(
         return []
     if query is None:
         return [default] * n
-
-    q = np.asarray(query, dtype=np.float32)
-    q_norm = float(np.linalg.norm(q))
-    if q_norm == 0.0 or not np.isfinite(q_norm):
-        return [default] * n
-
-    rows: list[np.ndarray] = []
-    row_indices: list[int] = []
-    for i, e in enumerate(embeddings):
-        if e is None:
-            continue
-        rows.append(e)
-        row_indices.append(i)
-
-    sims = [default] * n
-    if not rows:
-        return sims
-
-    matrix = np.asarray(rows, dtype=np.float32)
-    row_norms = np.linalg.norm(matrix, axis=1)
-    safe = row_norms.copy()
-    safe[safe == 0.0] = 1.0
-    dots = matrix @ q
-    cos = dots / (safe * q_norm)
-
-    for idx, c, rn in zip(row_indices, cos, row_norms):
-        if rn == 0.0 or not np.isfinite(c):
-            continue
-        sims[idx] = float(c)
-    return sims
+    matrix, indices = unit_rows(embeddings)
+    return cosine_against_rows(matrix, indices, n, query, default=default)
 
 def cluster_by_similarity(
     items: list,
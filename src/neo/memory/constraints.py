@@ -6,13 +6,13 @@ individual constraint facts. Tracks file checksums to avoid re-ingestion
 when files haven't changed.
 """
 
-import hashlib
 import json
 import logging
 import re
 from pathlib import Path
 from typing import Optional
 
+from neo import fasthash
 from neo.memory.io_utils import atomic_write_json
 from neo.memory.models import Fact, FactKind, FactMetadata, FactScope
 
@@ -32,6 +32,9 @@ CONSTRAINT_FILES = [
     ("{project}/.github/copilot-instructions.md", FactScope.PROJECT),
 ]
 
+# Section headings: #, ## or ### followed by whitespace and a title
+_HEADING_RE = re.compile(r"#{1,3}\s+(.+)$")
+
 CHECKSUM_DIR = Path.home() / ".neo" / "constraints"
 CHECKSUM_FILE = CHECKSUM_DIR / "checksums.json"
 
@@ -62,6 +65,14 @@ class ConstraintIngester:
         """
         new_facts: list[Fact] = []
         superseded_facts: list[Fact] = []
+        checksums_changed = False
+
+        # Live constraints by source file, built once rather than rescanning
+        # every fact for each changed file.
+        by_source: dict[str, list[Fact]] = {}
+        for fact in existing_facts:
+            if fact.kind == FactKind.CONSTRAINT and fact.is_valid:
+                by_source.setdefault(fact.metadata.source_file, []).append(fact)
 
         for file_template, scope in CONSTRAINT_FILES:
             file_path = self._resolve_path(file_template)
@@ -78,12 +89,9 @@ class ConstraintIngester:
             logger.info(f"Ingesting constraints from: {file_path}")
 
             # Supersede old constraints from this file
-            for fact in existing_facts:
-                if (fact.kind == FactKind.CONSTRAINT
-                        and fact.metadata.source_file == str(file_path)
-                        and fact.is_valid):
-                    fact.is_valid = False
-                    superseded_facts.append(fact)
+            for fact in by_source.pop(str(file_path), ()):
+                fact.is_valid = False
+                superseded_facts.append(fact)
 
             # Parse new constraints
             sections = self._split_markdown(file_path)
@@ -108,8 +116,11 @@ class ConstraintIngester:
 
             # Update checksum
             self._checksums[str(file_path)] = current_checksum
+            checksums_changed = True
 
-        self._save_checksums()
+        # Nothing changed is the common case on every run; skip the rewrite
+        if checksums_changed:
+            self._save_checksums()
         return new_facts, superseded_facts
 
     def _resolve_path(self, template: str) -> Optional[Path]:
@@ -119,36 +130,37 @@ class ConstraintIngester:
         return path
 
     def _file_checksum(self, path: Path) -> str:
-        """Compute SHA256 checksum of a file."""
-        h = hashlib.sha256()
+        """Compute the content checksum of a file (see `neo.fasthash`)."""
         try:
-            h.update(path.read_bytes())
+            return fasthash.file_digest(path)
         except (OSError, IOError):
             return ""
-        return h.hexdigest()
 
     def _split_markdown(self, path: Path) -> list[tuple[str, str]]:
         """Split a markdown file into (heading, body) sections by ## headings."""
-        try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to read {path}: {e}")
-            return []
-
         sections: list[tuple[str, str]] = []
         current_heading = path.name  # Default heading is file name
         current_body_lines: list[str] = []
 
-        for line in content.splitlines():
-            heading_match = re.match(r"^#{1,3}\s+(.+)$", line)
-            if heading_match:
-                # Save previous section
-                if current_body_lines:
-                    sections.append((current_heading, "\n".join(current_body_lines)))
-                current_heading = heading_match.group(1).strip()
-                current_body_lines = []
-            else:
-                current_body_lines.append(line)
+        # Read line by line rather than holding the whole file plus its
+        # splitlines() copy. Undecodable bytes are replaced, not fatal.
+        try:
+            with path.open("r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    line = line.rstrip("\n")
+                    # Most lines aren't headings; skip the regex for them
+                    heading_match = _HEADING_RE.match(line) if line.startswith("#") else None
+                    if heading_match:
+                        # Save previous section
+                        if current_body_lines:
+                            sections.append((current_heading, "\n".join(current_body_lines)))
+                        current_heading = heading_match.group(1).strip()
+                        current_body_lines = []
+                    else:
+                        current_body_lines.append(line)
+        except (OSError, IOError) as e:
+            logger.warning(f"Failed to read {path}: {e}")
+            return []
 
         # Save last section
         if current_body_lines:
@@ -5,17 +5,23 @@ Filters and ranks facts into StateBench's four-layer model,
 then renders them as a formatted string for prompt injection.
 """
 
+import heapq
 import logging
 import time
+from operator import itemgetter
 from typing import Optional
 
 import numpy as np
 
-from neo.math_utils import batched_cosine, cosine_similarity
-from neo.memory.models import ContextResult, Fact, FactKind, FactScope, rank_score
+from neo.math_utils import Q8_MIN_ROWS, EmbeddingMatrix, cosine_similarity
+from neo.memory.models import ContextResult, Fact, FactKind, FactScope, rank_scores
 
 logger = logging.getLogger(__name__)
 
+# Constraint layer order. FactScope stays string-valued (its value is the
+# persisted form), so the rank lives here rather than in the enum.
+_SCOPE_ORDER = {FactScope.GLOBAL: 0, FactScope.ORG: 1, FactScope.PROJECT: 2, FactScope.SESSION: 3}
+
 class ContextAssembler:
     """Assembles a ContextResult from facts and query context.
 
@@ -27,6 +33,11 @@ class ContextAssembler:
     5. Environment - passed through as-is
     """
 
+    def __init__(self) -> None:
+        # A store is queried many times between writes, so the same
+        # candidate embeddings come back call after call.
+        self._embeddings = EmbeddingMatrix(quantize_from=Q8_MIN_ROWS)
+
     def assemble(
         self,
         facts: list[Fact],
@@ -59,21 +70,28 @@ class ContextAssembler:
         session_facts: list[Fact] = []
         known_unknowns: list[Fact] = []
 
+        # Runs over the whole store on every query: test validity once, read
+        # each attribute once, and compare enum members by identity.
+        constraint_kind = FactKind.CONSTRAINT
+        unknown_kind = FactKind.KNOWN_UNKNOWN
+        session_scope = FactScope.SESSION
         for fact in facts:
-            if fact.kind == FactKind.CONSTRAINT and fact.is_valid:
+            if not fact.is_valid:
+                if fact.superseded_by:
+                    invalidated.append(fact)
+                continue
+            kind = fact.kind
+            if kind is constraint_kind:
                 constraints.append(fact)
-            elif fact.kind == FactKind.KNOWN_UNKNOWN and fact.is_valid:
+            elif kind is unknown_kind:
                 known_unknowns.append(fact)
-            elif fact.scope == FactScope.SESSION and fact.is_valid:
+            elif fact.scope is session_scope:
                 session_facts.append(fact)
-            elif fact.is_valid:
+            else:
                 valid_candidates.append(fact)
-            elif not fact.is_valid and fact.superseded_by:
-                invalidated.append(fact)
 
         # Sort constraints: global first, then org, then project
-        scope_order = {FactScope.GLOBAL: 0, FactScope.ORG: 1, FactScope.PROJECT: 2, FactScope.SESSION: 3}
-        constraints.sort(key=lambda f: scope_order.get(f.scope, 99))
+        constraints.sort(key=lambda f: _SCOPE_ORDER[f.scope])
 
         # Cap constraints so they don't starve other layers.
         # Reserve at least 1/3 of budget for non-constraint content.
@@ -94,8 +112,11 @@ class ContextAssembler:
         # Valid facts get "at least one" guarantee; subsequent layers
         # only get what's left (no guarantee if budget is exhausted).
         budget_remaining = max(0, max_tokens - constraint_tokens)
+        # Only k facts are consumed, so select them rather than sort all N;
+        # nlargest keeps sorted()'s stable tie order.
+        top_scored = heapq.nlargest(k, scored_valid, key=itemgetter(1))
         top_valid = self._accumulate_within_budget(
-            [f for f, _ in scored_valid[:k]], budget_remaining, at_least_one=True,
+            [f for f, _ in top_scored], budget_remaining, at_least_one=True,
         )
         budget_remaining = max(0, budget_remaining - sum(f.size_hint() for f in top_valid))
 
@@ -147,18 +168,30 @@ class ContextAssembler:
     ) -> list[tuple[Fact, float]]:
         """Score facts by sim * confidence + success_bonus + provenance_bonus.
 
-        Vectorized cosine in one numpy pass, then rank_score per fact.
-        Shares the ranking policy with FactStore.retrieve_relevant via
-        memory.models.rank_score so the two retrieval paths stay consistent.
+        Cosine against the cached unit-row matrix in one numpy pass, then
+        rank_scores over all of them. Returned in input order; callers pick
+        the top k. Shares the ranking policy with FactStore.retrieve_relevant
+        via memory.models.rank_scores so the two retrieval paths stay
+        consistent.
         """
         if not facts:
             return []
 
         now = time.time()
-        sims = batched_cosine([f.embedding for f in facts], query_embedding)
-        scored = [(f, rank_score(f, s, now)) for f, s in zip(facts, sims)]
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored
+        sims = self._similarities(facts, query_embedding)
+        return list(zip(facts, rank_scores(facts, sims, now).tolist()))
+
+    def _similarities(
+        self,
+        facts: list[Fact],
+        query_embedding: Optional[np.ndarray],
+    ) -> list[float]:
+        """Cosine of each fact's embedding against the query (0.5 if missing)."""
+        if query_embedding is None:
+            # No query vector (embedder unavailable): every fact gets the
+            # neutral similarity, so don't touch the embeddings at all.
+            return [0.5] * len(facts)
+        return self._embeddings.cosines([f.embedding for f in facts], query_embedding)
 
     @staticmethod
     def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
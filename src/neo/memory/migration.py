@@ -12,6 +12,7 @@ from typing import Optional
 
 import numpy as np
 
+from neo import fastjson
 from neo.memory.models import Fact, FactKind, FactMetadata, FactScope
 
 logger = logging.getLogger(__name__)
@@ -72,8 +73,7 @@ def _load_old_file(path: Path) -> list[dict]:
     if not path.exists():
         return []
     try:
-        with open(path) as f:
-            data = json.load(f)
+        data = fastjson.loads_state(path.read_bytes())
         return data.get("entries", [])
     except (json.JSONDecodeError, OSError) as e:
         logger.warning(f"Failed to read legacy file {path}: {e}")
@@ -93,7 +93,7 @@ def _convert_entry(
     - reasoning + suggestion + code_template + pitfalls -> body
     - algorithm_type -> tags
     - Infers kind from pattern prefix
-    - Preserves embeddings directly (same Jina model)
+    - Preserves embeddings (same Jina model); Fact stores them unit-length
     """
     pattern = entry.get("pattern", "")
     if not pattern:
@@ -10,11 +10,11 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
-from neo.math_utils import g_n_update, recall_probability
+from neo.math_utils import g_n_update, normalize, recall_probabilities, recall_probability
 
 
 # Ranking policy shared across retrieval paths (FactStore.retrieve_relevant
@@ -104,6 +104,7 @@ def rank_score(fact: "Fact", similarity: float, now: Optional[float] = None) ->
     semantics: frequently-recalled fluid facts decay slower, dormant ones
     decay faster, and the gap between two recalls shapes future decay.
     Curated/stable facts (see ``_decays``) bypass the transform entirely.
+    ``rank_scores`` is the vectorized form for scoring many facts at once.
     """
     if _decays(fact):
         ts = fact.metadata.last_recall_ts
@@ -127,6 +128,57 @@ def rank_score(fact: "Fact", similarity: float, now: Optional[float] = None) ->
     )
 
 
+def rank_scores(
+    facts: Sequence["Fact"],
+    similarities: Sequence[float],
+    now: Optional[float] = None,
+) -> np.ndarray:
+    """``rank_score`` for many facts at once, as a float64 array.
+
+    Same policy and same values as calling ``rank_score(f, s, now)`` per
+    pair; the per-fact fields are gathered in one pass and the decay and
+    bonus arithmetic runs as numpy array operations instead of per-fact
+    ``math`` calls. Retrieval paths score whole corpora through this.
+    """
+    n = len(facts)
+    if now is None:
+        now = time.time()
+    sim = np.asarray(similarities, dtype=np.float64)
+    meta = [f.metadata for f in facts]
+    decays = np.fromiter((_decays(f) for f in facts), dtype=bool, count=n)
+    confidence = np.fromiter((m.confidence for m in meta), dtype=np.float64, count=n)
+    successes = np.fromiter((m.success_count for m in meta), dtype=np.float64, count=n)
+    provenance = np.fromiter(
+        (provenance_bonus(m.provenance) for m in meta), dtype=np.float64, count=n,
+    )
+
+    recalled = sim.copy()
+    eff = np.ones(n)
+    if decays.any():
+        decaying = [m for m, d in zip(meta, decays) if d]
+        ts = np.fromiter(
+            (m.last_recall_ts if m.last_recall_ts is not None else m.created_at for m in decaying),
+            dtype=np.float64, count=len(decaying),
+        )
+        g_n = np.fromiter((m.g_n for m in decaying), dtype=np.float64, count=len(decaying))
+        recalled[decays] = recall_probabilities(
+            sim[decays],
+            days_since_recall=(now - ts) / SECONDS_PER_DAY,
+            g_n=g_n,
+        )
+        eff[decays] = np.fromiter(
+            (m.effectiveness_f for m in decaying), dtype=np.float64, count=len(decaying),
+        )
+
+    with np.errstate(divide="ignore"):
+        bonus = np.where(
+            successes > 0,
+            np.minimum(SUCCESS_BONUS_CAP, SUCCESS_BONUS_WEIGHT * np.log2(successes + 1)),
+            0.0,
+        )
+    return recalled * confidence + bonus * eff + provenance
+
+
 # LessonL ε for effectiveness adjustment. ε ∈ (0, 1); paper 2505.23946
 # uses 0.5 in the worked examples — small enough to not swing wildly,
 # large enough that several confirming reuses can lift f past 1.0.
@@ -230,7 +282,7 @@ SUGGESTED_DOMAINS = frozenset({
 })
 
 
-@dataclass
+@dataclass(slots=True)
 class FactMetadata:
     """Metadata attached to a fact."""
     created_at: float = field(default_factory=time.time)
@@ -365,7 +417,7 @@ class EpisodeContext:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Fact:
     """A single piece of knowledge in the fact store.
 
@@ -416,6 +468,13 @@ class Fact:
     # non-promoted facts.
     canonical_signature: str = ""
 
+    def __post_init__(self) -> None:
+        # Unit length once at construction (which from_dict goes through) so
+        # the stored and persisted form is already normalized; cosine against
+        # a fact then needs no per-query norm of the fact side.
+        if self.embedding is not None:
+            self.embedding = normalize(self.embedding)
+
     def size_hint(self) -> int:
         """Approximate token count. Uses len//4 heuristic — not precise, just monotonic."""
         return len(self.context_text or (self.subject + self.body)) // 4
@@ -432,7 +491,10 @@ class Fact:
             return self.context_text
         return f"{self.subject}: {self.body}"
 
-    def to_dict(self) -> dict:
+    def to_dict(self, *, embedding_as_array: bool = False) -> dict:
+        """JSON-ready dict. ``embedding_as_array`` leaves the embedding as
+        its ndarray for serializers that write arrays directly
+        (``fastjson.dumps_arrays``); otherwise it is a list of floats."""
         data = {
             "id": self.id,
             "subject": self.subject,
@@ -456,7 +518,7 @@ class Fact:
             "canonical_signature": self.canonical_signature,
         }
         if self.embedding is not None:
-            data["embedding"] = self.embedding.tolist()
+            data["embedding"] = self.embedding if embedding_as_array else self.embedding.tolist()
         if self.episode_context is not None:
             data["episode_context"] = self.episode_context.to_dict()
         if self.retrieval_text is not None:
@@ -499,7 +561,7 @@ class Fact:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResult:
     """Assembled context for LLM injection, following StateBench's four-layer model."""
     constraints: list[Fact] = field(default_factory=list)          # Layer 1
@@ -27,6 +27,13 @@ logger = logging.getLogger(__name__)
 # intra-sweep redundancy — the actual waste — is gone.
 _REMOTE_URL_CACHE: dict[str, str] = {}
 
+# Remote-URL shapes for ``_normalize_remote_url``, compiled once.
+_SCP_LIKE_RE = re.compile(r"^[^@/:]+@[^:]+:")
+_CREDENTIALS_RE = re.compile(r"://[^@]+@")
+_SCHEME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+_SCP_HOST_RE = re.compile(r"^([^@/:]+)@([^:/]+):")
+_GIT_SUFFIX_RE = re.compile(r"\.git/?$")
+
 
 def clear_remote_url_cache() -> None:
     """Drop memoized git remotes. Called once per observer cycle."""
@@ -117,29 +124,42 @@ def _parse_org_from_url(url: str) -> str:
     """
     url = url.strip()
 
-    # Azure DevOps SSH: git@ssh.dev.azure.com:v3/{org}/{project}/repo
-    # Must be checked before generic SSH to avoid matching "v3" as org
-    azure_ssh_match = re.match(r"git@ssh\.dev\.azure\.com:v3/([^/]+)/", url)
-    if azure_ssh_match:
-        return azure_ssh_match.group(1)
+    # Plain prefix/partition dispatch rather than a cascade of regexes; the
+    # shapes are the ones the comments name, and each needs "<org>/" to
+    # follow, so a bare "host:org" or "host/org" stays "unknown".
+    if url.startswith("git@"):
+        # SSH format: git@github.com:org/repo.git
+        host, colon, path = url[4:].partition(":")
+        if host and colon:
+            # Azure DevOps SSH: git@ssh.dev.azure.com:v3/{org}/{project}/repo
+            # Must be checked before generic SSH to avoid matching "v3" as org
+            if host == "ssh.dev.azure.com" and path.startswith("v3/"):
+                org = _leading_segment(path[3:])
+                if org:
+                    return org
+            org = _leading_segment(path)
+            if org:
+                return org
+        return "unknown"
 
-    # SSH format: git@github.com:org/repo.git
-    ssh_match = re.match(r"git@([^:]+):([^/]+)/", url)
-    if ssh_match:
-        return ssh_match.group(2)
+    # HTTPS: https://github.com/{org}/repo — also gitlab.com, bitbucket.org,
+    # and Azure DevOps https://dev.azure.com/{org}/{project}/_git/repo
+    for scheme in ("https://", "http://"):
+        if url.startswith(scheme):
+            host, slash, path = url[len(scheme):].partition("/")
+            if host and slash:
+                org = _leading_segment(path)
+                if org:
+                    return org
+            break
 
-    # Azure DevOps HTTPS: https://dev.azure.com/{org}/{project}/_git/repo
-    azure_match = re.match(r"https?://dev\.azure\.com/([^/]+)/", url)
-    if azure_match:
-        return azure_match.group(1)
+    return "unknown"
 
-    # Generic HTTPS: https://github.com/{org}/repo
-    # Also handles gitlab.com, bitbucket.org, etc.
-    https_match = re.match(r"https?://[^/]+/([^/]+)/", url)
-    if https_match:
-        return https_match.group(1)
 
-    return "unknown"
+def _leading_segment(path: str) -> str:
+    """First ``/``-separated segment of ``path`` if a ``/`` follows it, else ""."""
+    segment, slash, _ = path.partition("/")
+    return segment if slash else ""
 
 
 def _normalize_remote_url(url: str) -> str:
@@ -162,13 +182,13 @@ def _normalize_remote_url(url: str) -> str:
     is_network = False
     if "://" in url and not url.startswith("file://"):
         is_network = True
-    elif re.match(r"^[^@/:]+@[^:]+:", url):  # git@host:org/repo
+    elif _SCP_LIKE_RE.match(url):  # git@host:org/repo
         is_network = True
 
-    url = re.sub(r"://[^@]+@", "://", url)
-    url = re.sub(r"^[A-Za-z][A-Za-z0-9+.-]*://", "", url)
-    url = re.sub(r"^([^@/:]+)@([^:/]+):", r"\2/", url)
-    url = re.sub(r"\.git/?$", "", url)
+    url = _CREDENTIALS_RE.sub("://", url)
+    url = _SCHEME_RE.sub("", url)
+    url = _SCP_HOST_RE.sub(r"\2/", url)
+    url = _GIT_SUFFIX_RE.sub("", url)
     url = url.rstrip("/")
 
     if is_network:
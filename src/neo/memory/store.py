@@ -7,7 +7,7 @@ and supersession chains.
 """
 
 import contextlib
-import hashlib
+import heapq
 import json
 import logging
 import os
@@ -16,7 +16,7 @@ import shutil
 import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 try:
     import fcntl  # POSIX (macOS/Linux); used to serialize cross-process saves
@@ -25,7 +25,14 @@ except ImportError:  # pragma: no cover - non-POSIX fallback
 
 import numpy as np
 
-from neo.math_utils import batched_cosine, cosine_similarity
+from neo import fasthash, fastjson
+from neo.math_utils import (
+    Q8_MIN_ROWS,
+    EmbeddingMatrix,
+    batched_cosine,
+    cosine_similarity,
+    normalize,
+)
 from neo.memory.bm25 import BM25, tokenize
 from neo.memory.query_routing import QueryShape, decompose as _decompose_query
 from neo.memory.claude_memory import ClaudeMemoryIngester
@@ -44,6 +51,7 @@ from neo.memory.models import (
     FactScope,
     Provenance,
     rank_score,
+    rank_scores,
     update_effectiveness,
     update_recall,
 )
@@ -339,8 +347,12 @@ class FactStore:
         # _scope_mtimes: last mtime_ns we observed per scope file, so the merge
         #   skips its re-read+parse when nothing else has written since (the
         #   common single-process case; avoids re-parsing a multi-MB file per add).
+        # _scope_digests: digest of the payload we last wrote per scope file, so
+        #   a save whose scope is byte-identical (and untouched since) skips the
+        #   write — an add touches one scope, not all three.
         self._deleted_ids: set[str] = set()
         self._scope_mtimes: dict[str, int] = {}
+        self._scope_digests: dict[str, str] = {}
 
         # Embedding model (lazy-initialized on first use to avoid slow startup)
         self._embedder = None
@@ -349,6 +361,9 @@ class FactStore:
 
         # Context assembler
         self._assembler = ContextAssembler()
+        # Stacked embeddings for retrieve_relevant, reused across queries;
+        # large corpora are scored against an int8 copy.
+        self._retrieval_embeddings = EmbeddingMatrix(quantize_from=Q8_MIN_ROWS)
 
         # Outcome tracker for learning from actual code changes
         self._outcome_tracker = OutcomeTracker(
@@ -684,7 +699,12 @@ class FactStore:
                 return []
 
             now = time.time()
-            sims = batched_cosine([f.embedding for f in valid_facts], query_embedding)
+            if query_embedding is None:
+                sims = [0.5] * len(valid_facts)
+            else:
+                sims = self._retrieval_embeddings.cosines(
+                    [f.embedding for f in valid_facts], query_embedding,
+                )
 
             # Hybrid dense + sparse (paper 2603.19935 Memori §3.3). BM25
             # over the same corpus catches keyword matches the dense
@@ -694,7 +714,8 @@ class FactStore:
             # downstream Ebbinghaus decay and confidence multiplier still
             # apply the same way.
             fused_sims = self._fuse_dense_sparse(query, valid_facts, sims)
-            scored = [(f, fs, rank_score(f, fs, now)) for f, fs in zip(valid_facts, fused_sims)]
+            scores = rank_scores(valid_facts, fused_sims, now).tolist()
+            scored = list(zip(valid_facts, fused_sims, scores))
 
             # Half-by-rank-score / half-by-cosine policy (paper 2505.23946
             # LessonL Algorithm 1): top ⌈k/2⌉ by full rank_score (which
@@ -707,16 +728,16 @@ class FactStore:
             half_score = (k + 1) // 2
             half_cos = k - half_score
 
-            by_score = sorted(scored, key=lambda x: x[2], reverse=True)
-            score_pick = by_score[:half_score]
+            # nlargest selects without sorting the whole corpus and keeps
+            # sorted()'s stable tie order.
+            score_pick = heapq.nlargest(half_score, scored, key=lambda x: x[2])
             score_pick_ids = {f.id for f, _, _ in score_pick}
 
-            by_cos = sorted(
+            cos_pick = heapq.nlargest(
+                half_cos,
                 (s for s in scored if s[0].id not in score_pick_ids),
                 key=lambda x: x[1],
-                reverse=True,
             )
-            cos_pick = by_cos[:half_cos]
 
             chosen = score_pick + cos_pick
             chosen.sort(key=lambda x: x[2], reverse=True)
@@ -2593,12 +2614,21 @@ class FactStore:
             # entirely. Locks are taken one scope at a time and released before
             # the next, so there is no lock-ordering / deadlock concern.
             with self._scope_file_lock(path):
-                self._save_file(path, self._merge_on_save(path, scoped))
+                key = str(path)
+                mt = self._file_mtime(path)
+                unchanged = self._scope_digests.get(key) if (
+                    mt is not None and mt == self._scope_mtimes.get(key)
+                ) else None
+                digest = self._save_file(
+                    path, self._merge_on_save(path, scoped), unchanged=unchanged,
+                )
+                if digest is not None:
+                    self._scope_digests[key] = digest
                 # Record the mtime we just wrote, so the next save can detect
                 # whether another process wrote since (and skip the re-read).
                 mt = self._file_mtime(path)
                 if mt is not None:
-                    self._scope_mtimes[str(path)] = mt
+                    self._scope_mtimes[key] = mt
 
     def _scope_file_lock(self, path: "Path"):
         """Exclusive cross-process lock for a scope file's read-modify-write.
@@ -2830,7 +2860,7 @@ class FactStore:
         default_stale_age = STALE_MIN_AGE_DAYS * 86400
         independent_stale_age = 7 * 86400
         probation_stale_age = PROBATION_AGE_DAYS * 86400
-        pruned = 0
+        pruned_ids: list[str] = []
 
         for fact in self._facts:
             if not fact.is_valid:
@@ -2865,9 +2895,12 @@ class FactStore:
             if (now - fact.metadata.created_at) < stale_age:
                 continue
 
-            self._invalidate(fact)
-            pruned += 1
+            # Dependents are flagged in one pass after the sweep.
+            self._invalidate(fact, cascade=False)
+            pruned_ids.append(fact.id)
 
+        self._cascade_needs_review(pruned_ids)
+        pruned = len(pruned_ids)
         if pruned:
             if save:
                 self.save()
@@ -2888,6 +2921,7 @@ class FactStore:
         now = time.time()
         min_age = DEMOTION_MIN_AGE_DAYS * 86400
         affected = 0
+        pruned_ids: list[str] = []
 
         for fact in self._facts:
             if not fact.is_valid:
@@ -2907,8 +2941,10 @@ class FactStore:
 
             if success == 0:
                 if access >= DEMOTION_PRUNE_ACCESS:
-                    # Hard prune: accessed 10+ times, never helpful
-                    self._invalidate(fact)
+                    # Hard prune: accessed 10+ times, never helpful.
+                    # Dependents are flagged in one pass after the sweep.
+                    self._invalidate(fact, cascade=False)
+                    pruned_ids.append(fact.id)
                     affected += 1
                 else:
                     # Soft demotion: reduce confidence
@@ -2924,6 +2960,7 @@ class FactStore:
                     fact.metadata.confidence = new_conf
                     affected += 1
 
+        self._cascade_needs_review(pruned_ids)
         if affected:
             if save:
                 self.save()
@@ -2937,6 +2974,7 @@ class FactStore:
         # and re-baseline the per-file mtimes we compare against on save.
         self._deleted_ids = set()
         self._scope_mtimes = {}
+        self._scope_digests = {}
         for path in (self._global_path, self._org_path, self._project_path):
             if not path:
                 continue
@@ -3072,11 +3110,17 @@ class FactStore:
                 continue  # vanished or not ours — either way, not our problem
         return reclaimed
 
-    def _save_file(self, path: Path, facts: list[Fact]) -> None:
+    def _save_file(
+        self, path: Path, facts: list[Fact], *, unchanged: Optional[str] = None,
+    ) -> Optional[str]:
         """Save a list of facts to a JSON file atomically.
 
         Writes to a temp file in the same directory, then renames.
         Uses mkstemp to avoid collisions with concurrent processes.
+
+        Returns the digest of the payload, or None if the save failed. If it
+        equals ``unchanged`` (the digest of what the file is known to hold),
+        the write is skipped.
         """
         import os
         import tempfile
@@ -3084,28 +3128,36 @@ class FactStore:
         try:
             data = {
                 "version": "2.0",
-                "facts": [f.to_dict() for f in facts],
+                "facts": [f.to_dict(embedding_as_array=True) for f in facts],
             }
+            payload = fastjson.dumps_arrays(data)
+            digest = fasthash.digest(payload)
+            if digest == unchanged:
+                logger.debug(f"Facts in {path} unchanged; skipped write")
+                return digest
             path.parent.mkdir(parents=True, exist_ok=True)
             fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
             try:
-                with os.fdopen(fd, "w") as fh:
-                    json.dump(data, fh, indent=2)
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(payload)
                 os.replace(tmp_name, str(path))
             except BaseException:
                 os.unlink(tmp_name)
                 raise
             logger.debug(f"Saved {len(facts)} facts to {path}")
+            return digest
         except Exception as e:
             logger.error(f"Failed to save facts to {path}: {e}")
+            return None
 
     def _load_file(self, path: Optional[Path]) -> list[Fact]:
         """Load facts from a JSON file."""
         if path is None or not path.exists():
             return []
         try:
-            with open(path) as fh:
-                data = json.load(fh)
+            # Bytes, not text: save() writes UTF-8 (orjson doesn't escape to
+            # ASCII), and both parsers detect that regardless of locale.
+            data = fastjson.loads_state(path.read_bytes())
             return [Fact.from_dict(d) for d in data.get("facts", [])]
         except json.JSONDecodeError as e:
             logger.error(f"Failed to load facts from {path}: {e}")
@@ -3179,17 +3231,19 @@ class FactStore:
         if new_fact.embedding is None:
             return None
 
-        candidates: list[tuple[Fact, float]] = []
-        for fact in self._facts:
-            if not fact.is_valid:
-                continue
-            if fact.scope != new_fact.scope or fact.kind != new_fact.kind:
-                continue
-            if fact.embedding is None:
-                continue
-            sim = self._cosine_similarity(new_fact.embedding, fact.embedding)
-            if sim > SUPERSESSION_THRESHOLD:
-                candidates.append((fact, sim))
+        peers = [
+            fact for fact in self._facts
+            if fact.is_valid
+            and fact.scope == new_fact.scope
+            and fact.kind == new_fact.kind
+            and fact.embedding is not None
+        ]
+        # One matrix-vector product over the peers instead of a cosine call
+        # per fact; degenerate vectors score 0.0 as cosine_similarity does.
+        sims = batched_cosine([f.embedding for f in peers], new_fact.embedding, default=0.0)
+        candidates: list[tuple[Fact, float]] = [
+            (fact, sim) for fact, sim in zip(peers, sims) if sim > SUPERSESSION_THRESHOLD
+        ]
 
         if not candidates:
             return None
@@ -3259,7 +3313,7 @@ class FactStore:
         fact.embedding = None
         _strip_tombstone_text(fact)
         if cascade:
-            self._cascade_needs_review(fact.id)
+            self._cascade_needs_review((fact.id,))
 
     @staticmethod
     def _strip_ingester_tombstones(superseded_facts: list) -> None:
@@ -3276,10 +3330,17 @@ class FactStore:
         for fact in superseded_facts:
             fact.embedding = None
 
-    def _cascade_needs_review(self, superseded_id: str) -> None:
-        """Mark facts that depend on a superseded fact as needing review."""
+    def _cascade_needs_review(self, superseded_ids: Iterable[str]) -> None:
+        """Mark facts that depend on any of ``superseded_ids`` as needing review.
+
+        Takes a batch so a sweep that invalidates many facts scans the store
+        once instead of once per fact.
+        """
+        ids = set(superseded_ids)
+        if not ids:
+            return
         for fact in self._facts:
-            if superseded_id in fact.depends_on and fact.is_valid:
+            if fact.depends_on and fact.is_valid and not ids.isdisjoint(fact.depends_on):
                 fact.needs_review = True
                 logger.debug(f"Marked fact '{fact.subject[:40]}' as needs_review (dependency superseded)")
 
@@ -3289,35 +3350,71 @@ class FactStore:
 
     def _embed_text(self, text: str) -> Optional[np.ndarray]:
         """Generate embedding for text using local Jina model."""
-        if not text or not text.strip():
-            return None
+        return self._embed_texts([text])[0]
+
+    def _embed_texts(self, texts: list[str]) -> list[Optional[np.ndarray]]:
+        """Embed several texts in one model call; None where a text is blank
+        or its embedding failed.
+
+        The model has a fixed per-call cost, so ingesters that add a batch of
+        facts embed them together. Cached texts are served from the cache and
+        repeated texts are embedded once.
+        """
+        results: list[Optional[np.ndarray]] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}
+        to_embed: list[str] = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            # Only the truncated text reaches the model, so only it is keyed.
+            # Short texts key as themselves: a str under 64 chars can't collide
+            # with a 64-char hex digest, and skipping the hash is cheaper.
+            truncated = text[:MAX_TEXT_LENGTH]
+            cache_key = (
+                truncated if len(truncated) < 64
+                else fasthash.digest(truncated.encode())
+            )
+            if cache_key in self._embedding_cache:
+                self._embedding_cache.move_to_end(cache_key)
+                results[i] = self._embedding_cache[cache_key]
+            elif cache_key in pending:
+                pending[cache_key].append(i)
+            else:
+                pending[cache_key] = [i]
+                to_embed.append(truncated)
 
+        if not pending:
+            return results
         self._ensure_embedder()
+        if not self._embedder:
+            return results
 
-        cache_key = hashlib.sha256(text.encode()).hexdigest()
-        if cache_key in self._embedding_cache:
-            self._embedding_cache.move_to_end(cache_key)
-            return self._embedding_cache[cache_key]
+        try:
+            embeddings = list(self._embedder.embed(to_embed))
+        except Exception as e:
+            logger.warning(f"Embedding failed: {e}")
+            return results
 
-        embedding = None
-        if self._embedder:
-            try:
-                truncated = text[:MAX_TEXT_LENGTH]
-                embeddings = list(self._embedder.embed([truncated]))
-                if embeddings:
-                    embedding = np.array(embeddings[0], dtype=np.float32)
-                    if not np.isfinite(embedding).all():
-                        logger.error("Embedding contains NaN or Inf values")
-                        embedding = None
-            except Exception as e:
-                logger.warning(f"Embedding failed: {e}")
-
-        if embedding is not None:
+        for (cache_key, indices), raw in zip(pending.items(), embeddings):
+            embedding = np.array(raw, dtype=np.float32)
+            if not np.isfinite(embedding).all():
+                logger.error("Embedding contains NaN or Inf values")
+                continue
+            embedding = normalize(embedding)
+            for i in indices:
+                results[i] = embedding
             self._embedding_cache[cache_key] = embedding
             if len(self._embedding_cache) > EMBEDDING_CACHE_MAX_SIZE:
                 self._embedding_cache.popitem(last=False)
 
-        return embedding
+        return results
+
+    def _embed_new_facts(self, facts: list[Fact]) -> None:
+        """Embed ingested facts that arrived without an embedding, in one batch."""
+        missing = [f for f in facts if f.embedding is None]
+        embeddings = self._embed_texts([f"{f.subject} {f.body}" for f in missing])
+        for fact, embedding in zip(missing, embeddings):
+            fact.embedding = embedding
 
     @staticmethod
     def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
@@ -3342,10 +3439,7 @@ class FactStore:
         new_facts, superseded_facts = ingester.ingest(self._facts)
 
         if new_facts or superseded_facts:
-            for fact in new_facts:
-                if fact.embedding is None:
-                    embed_text = f"{fact.subject} {fact.body}"
-                    fact.embedding = self._embed_text(embed_text)
+            self._embed_new_facts(new_facts)
 
             self._strip_ingester_tombstones(superseded_facts)
             self._facts.extend(new_facts)
@@ -3369,10 +3463,7 @@ class FactStore:
             new_facts, superseded_facts = ingester.ingest(self._facts)
 
             if new_facts or superseded_facts:
-                for fact in new_facts:
-                    if fact.embedding is None:
-                        embed_text = f"{fact.subject} {fact.body}"
-                        fact.embedding = self._embed_text(embed_text)
+                self._embed_new_facts(new_facts)
 
                 self._strip_ingester_tombstones(superseded_facts)
                 self._facts.extend(new_facts)
@@ -3404,10 +3495,7 @@ class FactStore:
 
         if new_facts or superseded_facts:
             # Generate embeddings for new constraint facts
-            for fact in new_facts:
-                if fact.embedding is None:
-                    embed_text = f"{fact.subject} {fact.body}"
-                    fact.embedding = self._embed_text(embed_text)
+            self._embed_new_facts(new_facts)
 
             self._strip_ingester_tombstones(superseded_facts)
             self._facts.extend(new_facts)
@@ -3431,10 +3519,7 @@ class FactStore:
         new_facts, superseded_facts = ingester.ingest(self._facts)
 
         if new_facts or superseded_facts:
-            for fact in new_facts:
-                if fact.embedding is None:
-                    embed_text = f"{fact.subject} {fact.body}"
-                    fact.embedding = self._embed_text(embed_text)
+            self._embed_new_facts(new_facts)
 
             self._strip_ingester_tombstones(superseded_facts)
             self._facts.extend(new_facts)
@@ -7,12 +7,13 @@ and the LMAdapter abstract base class.
 Split from cli.py for modularity.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 import re
 import uuid
-from typing import Any, Literal, Optional, TypedDict
+from typing import Any, Iterator, Literal, Optional, TypedDict
 
 from neo.execution_context import (
     FAILURE_SIGNAL_KEYWORDS,
@@ -360,7 +361,78 @@ class LMAdapter(ABC):
         """
         pass
 
+    def stream_generate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the response as text deltas, in order, as they arrive.
+
+        Joining the deltas gives what `generate` would have returned. The
+        default yields the whole `generate` result as a single chunk, so every
+        adapter supports the call; adapters whose provider streams natively
+        override it so the first token reaches the caller before the last one
+        has been generated.
+        """
+        yield self.generate(
+            messages,
+            stop=stop,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            reasoning_effort=reasoning_effort,
+        )
+
+    async def agenerate(
+        self,
+        messages: list[dict[str, str]],
+        stop: Optional[list[str]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        reasoning_effort: Optional[str] = None,
+    ) -> str:
+        """Async counterpart of `generate`, for overlapping several calls.
+
+        The default runs `generate` on a worker thread. Every provider client
+        neo uses blocks in socket I/O with the GIL released, so
+        `asyncio.gather` over N calls overlaps their network latency without
+        each adapter carrying a second, async-only request path that would have
+        to mirror the sync one (param-compat learning, usage metrics, failure
+        capture). An adapter with a native async client may override this.
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            messages,
+            stop=stop,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            reasoning_effort=reasoning_effort,
+        )
+
     @abstractmethod
     def name(self) -> str:
         """Return the name of this adapter."""
         pass
+
+    def prewarm(self) -> None:
+        """Open a connection to the provider ahead of the first `generate`.
+
+        Best-effort and blocking; `adapters.resolve_adapter` runs it on a
+        daemon thread so the TCP + TLS handshake overlaps context assembly
+        instead of landing on the first call. A no-op here; adapters with a
+        pooled HTTP client override it with a cheap metadata request.
+        """
+
+    def close(self) -> None:
+        """Release pooled connections. Safe to call more than once.
+
+        A no-op here; adapters that hold a long-lived HTTP client override it.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
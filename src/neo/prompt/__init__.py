@@ -14,6 +14,7 @@ The PromptSystem class is the main facade that ties together all components:
 """
 
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -43,6 +44,16 @@ from neo.prompt.enhancer import PromptEnhancer, PromptEnhancement
 
 logger = logging.getLogger(__name__)
 
+# Signals reported as common issues by analyze().
+_NEGATIVE_SIGNALS = frozenset({
+    "immediate_clarification", "claude_confused", "multiple_retries",
+    "error_in_response", "abandoned_task",
+})
+
+# ChangeDetector source recording the newest score update that pattern
+# extraction has already seen.
+_PATTERN_EXTRACTION_SOURCE = "pattern_extraction"
+
 
 class PromptSystem:
     """
@@ -57,55 +68,52 @@ class PromptSystem:
     """
 
     def __init__(self):
-        """Initialize all prompt system components."""
-        self._scanner: Optional[Scanner] = None
-        self._change_detector: Optional[ChangeDetector] = None
-        self._analyzer: Optional[EffectivenessAnalyzer] = None
-        self._evolution_tracker: Optional[EvolutionTracker] = None
-        self._knowledge_base: Optional[PromptKnowledgeBase] = None
-        self._enhancer: Optional[PromptEnhancer] = None
-        self._initialized = False
-
-    def _ensure_initialized(self) -> None:
-        """Lazily initialize components on first use."""
-        if self._initialized:
-            return
-
-        try:
-            self._scanner = Scanner()
-        except Exception as e:
-            logger.warning(f"Scanner initialization failed: {e}")
-
-        try:
-            self._change_detector = ChangeDetector()
-        except Exception as e:
-            logger.warning(f"ChangeDetector initialization failed: {e}")
-
-        try:
-            self._analyzer = EffectivenessAnalyzer()
-        except Exception as e:
-            logger.warning(f"EffectivenessAnalyzer initialization failed: {e}")
-
-        try:
-            self._evolution_tracker = EvolutionTracker()
-        except Exception as e:
-            logger.warning(f"EvolutionTracker initialization failed: {e}")
-
-        try:
-            self._knowledge_base = PromptKnowledgeBase()
-        except Exception as e:
-            logger.warning(f"PromptKnowledgeBase initialization failed: {e}")
-
-        try:
-            # PromptEnhancer can work with or without LM adapter
-            self._enhancer = PromptEnhancer(
+        """Set up the facade; components are built on first use."""
+        # Component name -> instance, or None if its construction failed.
+        # Each public method touches only the components it needs, so e.g.
+        # enhance() builds the knowledge base and enhancer and nothing else.
+        self._components: dict[str, object] = {}
+
+    def _component(self, name: str, factory):
+        """Build a component on first access; a failed build is cached as None."""
+        if name not in self._components:
+            try:
+                self._components[name] = factory()
+            except Exception as e:
+                logger.warning(f"{name} initialization failed: {e}")
+                self._components[name] = None
+        return self._components[name]
+
+    @property
+    def _scanner(self) -> Optional[Scanner]:
+        return self._component("Scanner", Scanner)
+
+    @property
+    def _change_detector(self) -> Optional[ChangeDetector]:
+        return self._component("ChangeDetector", ChangeDetector)
+
+    @property
+    def _analyzer(self) -> Optional[EffectivenessAnalyzer]:
+        return self._component("EffectivenessAnalyzer", EffectivenessAnalyzer)
+
+    @property
+    def _evolution_tracker(self) -> Optional[EvolutionTracker]:
+        return self._component("EvolutionTracker", EvolutionTracker)
+
+    @property
+    def _knowledge_base(self) -> Optional[PromptKnowledgeBase]:
+        return self._component("PromptKnowledgeBase", PromptKnowledgeBase)
+
+    @property
+    def _enhancer(self) -> Optional[PromptEnhancer]:
+        # PromptEnhancer can work with or without LM adapter
+        return self._component(
+            "PromptEnhancer",
+            lambda: PromptEnhancer(
                 knowledge_base=self._knowledge_base,
                 lm_adapter=None,  # Use rule-based enhancement by default
-            )
-        except Exception as e:
-            logger.warning(f"PromptEnhancer initialization failed: {e}")
-
-        self._initialized = True
+            ),
+        )
 
     def incremental_scan(self) -> dict:
         """
@@ -122,8 +130,6 @@ class PromptSystem:
             - patterns_extracted: Number of new patterns added
             - errors: List of any errors encountered
         """
-        self._ensure_initialized()
-
         stats = {
             "new_prompts": 0,
             "new_sessions": 0,
@@ -151,8 +157,7 @@ class PromptSystem:
                     try:
                         scores = self._analyzer.analyze_session(session)
                         if self._knowledge_base:
-                            for score in scores:
-                                self._knowledge_base.update_effectiveness_score(score)
+                            self._knowledge_base.update_effectiveness_scores(scores)
                         stats["new_sessions"] += 1
                     except Exception as e:
                         stats["errors"].append(f"Session analysis failed: {e}")
@@ -168,43 +173,31 @@ class PromptSystem:
                     except Exception as e:
                         stats["errors"].append(f"Evolution tracking failed: {e}")
 
-            # Extract patterns from highly effective prompts
+            # Extract patterns from highly effective prompts. Extraction
+            # clusters every effective score, so its output only changes when
+            # a score entry was added or re-aggregated since the last run;
+            # otherwise it would just re-add the same patterns.
             if self._analyzer and self._knowledge_base:
                 try:
-                    effective_entries = [
-                        e for e in self._knowledge_base.entries
-                        if e.entry_type == "score"
-                        and e.data.get("score", 0) > 0.7
-                    ]
+                    effective_entries = list(self._knowledge_base.iter_scores_above(0.7))
+                    latest_update = self._knowledge_base.last_score_update()
+                    extracted = self._change_detector.get_watermark(_PATTERN_EXTRACTION_SOURCE)
+                    scores_changed = latest_update is not None and (
+                        extracted is None or latest_update > extracted.timestamp
+                    )
                     # Only extract patterns if we have enough samples
-                    if len(effective_entries) >= 5:
-                        # Convert entries to PromptEffectivenessScore objects
-                        effective_scores = []
-                        for entry in effective_entries:
-                            # Build signals list with logging for invalid values
-                            signals_list = []
-                            valid_signal_values = [e.value for e in EffectivenessSignal]
-                            for s in entry.data.get("signals", []):
-                                if s in valid_signal_values:
-                                    signals_list.append(EffectivenessSignal(s))
-                                else:
-                                    logger.debug(f"Skipping invalid signal value: {s}")
-                            score = PromptEffectivenessScore(
-                                prompt_hash=entry.data.get("prompt_hash", ""),
-                                prompt_text=entry.data.get("prompt_text", ""),
-                                score=entry.data.get("score", 0.0),
-                                signals=signals_list,
-                                iterations_to_complete=entry.data.get("iterations_to_complete", 0),
-                                tool_calls=entry.data.get("tool_calls", 0),
-                                sample_count=entry.data.get("sample_count", 1),
-                                confidence=entry.data.get("confidence", 0.5),
-                            )
-                            effective_scores.append(score)
+                    if scores_changed and len(effective_entries) >= 5:
+                        effective_scores = [
+                            PromptEffectivenessScore.from_entry(entry)
+                            for entry in effective_entries
+                        ]
 
                         patterns = self._analyzer.extract_patterns(effective_scores)
-                        for pattern in patterns:
-                            self._knowledge_base.add_pattern(pattern)
-                            stats["patterns_extracted"] += 1
+                        self._knowledge_base.add_patterns(patterns)
+                        stats["patterns_extracted"] += len(patterns)
+                        self._change_detector.update_watermark(
+                            _PATTERN_EXTRACTION_SOURCE, latest_update
+                        )
                 except Exception as e:
                     stats["errors"].append(f"Pattern extraction failed: {e}")
 
@@ -234,8 +227,6 @@ class PromptSystem:
             - common_issues: Most common negative signals
             - recommendations: Suggested improvements
         """
-        self._ensure_initialized()
-
         result = {
             "total_sessions": 0,
             "total_prompts": 0,
@@ -258,39 +249,37 @@ class PromptSystem:
                 except ValueError:
                     logger.warning(f"Invalid date format: {since}, using all data")
 
-            # Scan sessions
-            sessions = self._scanner.scan_sessions(project=project, since=since_dt)
-            result["total_sessions"] = len(sessions)
+            # Stream sessions so only one session's messages are held at a
+            # time; the totals below are all running counts.
+            total_sessions = 0
+            total_prompts = 0
+            score_sum = 0.0
+            signal_counts: Counter[str] = Counter()
 
-            # Analyze each session
-            all_scores: list[PromptEffectivenessScore] = []
-            signal_counts: dict[str, int] = {}
-
-            for session in sessions:
+            for session in self._scanner.iter_sessions(project=project, since=since_dt):
+                total_sessions += 1
                 scores = self._analyzer.analyze_session(session)
-                all_scores.extend(scores)
+                total_prompts += len(scores)
 
-                # Count signals
+                # Sum scores and count signals
                 for score in scores:
-                    for signal in score.signals:
-                        signal_name = signal.value if hasattr(signal, "value") else str(signal)
-                        signal_counts[signal_name] = signal_counts.get(signal_name, 0) + 1
+                    score_sum += score.score
+                    signal_counts.update(
+                        s.value if hasattr(s, "value") else str(s) for s in score.signals
+                    )
 
-            result["total_prompts"] = len(all_scores)
+            result["total_sessions"] = total_sessions
+            result["total_prompts"] = total_prompts
 
             # Calculate average effectiveness
-            if all_scores:
-                result["avg_effectiveness"] = sum(s.score for s in all_scores) / len(all_scores)
+            if total_prompts:
+                result["avg_effectiveness"] = score_sum / total_prompts
 
             # Identify common issues (negative signals)
-            negative_signals = [
-                "immediate_clarification", "claude_confused", "multiple_retries",
-                "error_in_response", "abandoned_task"
-            ]
             result["common_issues"] = [
                 {"signal": sig, "count": count}
-                for sig, count in sorted(signal_counts.items(), key=lambda x: -x[1])
-                if sig in negative_signals
+                for sig, count in signal_counts.most_common()
+                if sig in _NEGATIVE_SIGNALS
             ][:5]
 
             # Get top patterns if knowledge base available
@@ -333,8 +322,6 @@ class PromptSystem:
         Returns:
             PromptEnhancement with original, enhanced version, and metadata
         """
-        self._ensure_initialized()
-
         # Default response if enhancer not available
         default = PromptEnhancement(
             original=prompt,
@@ -365,8 +352,6 @@ class PromptSystem:
         Returns:
             List of PromptPattern objects
         """
-        self._ensure_initialized()
-
         if not self._knowledge_base:
             logger.warning("PromptKnowledgeBase not available")
             return []
@@ -375,20 +360,10 @@ class PromptSystem:
             if search:
                 return self._knowledge_base.search_patterns(search, k=limit)
             else:
-                # Return all patterns sorted by effectiveness
-                pattern_entries = [
-                    e for e in self._knowledge_base.entries
-                    if e.entry_type == "pattern"
-                ]
-                # Sort by effectiveness score descending
-                sorted_entries = sorted(
-                    pattern_entries,
-                    key=lambda e: e.data.get("effectiveness_score", 0),
-                    reverse=True
-                )
-                # Convert to PromptPattern objects
+                # Top patterns by effectiveness score, descending, converted
+                # to PromptPattern objects
                 patterns = []
-                for entry in sorted_entries[:limit]:
+                for entry in self._knowledge_base.top_patterns(limit):
                     data = entry.data
                     pattern = PromptPattern(
                         pattern_id=data.get("pattern_id", entry.id),
@@ -421,8 +396,6 @@ class PromptSystem:
             - reason: Why this is suggested
             - confidence: How confident we are in this suggestion
         """
-        self._ensure_initialized()
-
         if not self._evolution_tracker or not self._scanner:
             logger.warning("EvolutionTracker or Scanner not available")
             return []
@@ -449,8 +422,6 @@ class PromptSystem:
         Returns:
             List of ClaudeMdEvolution objects
         """
-        self._ensure_initialized()
-
         if not self._evolution_tracker:
             logger.warning("EvolutionTracker not available")
             return []
@@ -474,10 +445,10 @@ class PromptSystem:
             - evolutions: Number of evolution records
             - pending_suggestions: Number of unresolved suggestions
             - projects_tracked: Number of distinct projects
-            - components_available: Which components are initialized
+            - components_available: Which components could be built
         """
-        self._ensure_initialized()
-
+        # Reporting availability builds every component; this is the one
+        # diagnostic call that needs all of them.
         stats = {
             "total_entries": 0,
             "patterns": 0,
@@ -14,6 +14,7 @@ from enum import Enum
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from neo.prompt.knowledge_base import PromptEntry
     from neo.prompt.scanner import ScannedSession
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,11 @@ class EffectivenessSignal(Enum):
     ABANDONED_TASK = "abandoned_task"           # User gave up / changed topic abruptly
 
 
-@dataclass
+# Stored signal strings that still name an EffectivenessSignal member.
+_EFFECTIVENESS_SIGNAL_VALUES = frozenset(s.value for s in EffectivenessSignal)
+
+
+@dataclass(slots=True)
 class PromptEffectivenessScore:
     """Effectiveness score for a prompt."""
 
@@ -50,6 +55,30 @@ class PromptEffectivenessScore:
     sample_count: int  # How many times we've seen similar prompts
     confidence: float  # How confident we are in this score (0.0 to 1.0)
 
+    @classmethod
+    def from_entry(cls, entry: "PromptEntry") -> "PromptEffectivenessScore":
+        """Rebuild a score from its knowledge-base entry.
+
+        Stored signal strings that no longer name a signal are skipped.
+        """
+        data = entry.data
+        signals = []
+        for s in data.get("signals", []):
+            if s in _EFFECTIVENESS_SIGNAL_VALUES:
+                signals.append(EffectivenessSignal(s))
+            else:
+                logger.debug(f"Skipping invalid signal value: {s}")
+        return cls(
+            prompt_hash=data.get("prompt_hash", ""),
+            prompt_text=data.get("prompt_text", ""),
+            score=data.get("score", 0.0),
+            signals=signals,
+            iterations_to_complete=data.get("iterations_to_complete", 0),
+            tool_calls=data.get("tool_calls", 0),
+            sample_count=data.get("sample_count", 1),
+            confidence=data.get("confidence", 0.5),
+        )
+
 
 @dataclass
 class PromptPattern:
@@ -5,6 +5,7 @@ Stores prompt patterns, effectiveness scores, evolutions, and suggestions.
 Uses JSON file storage in ~/.neo directory.
 """
 
+import heapq
 import json
 import logging
 import os
@@ -13,7 +14,7 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional, TYPE_CHECKING
+from typing import Iterable, Iterator, Literal, Optional, TYPE_CHECKING
 
 # Import canonical dataclasses from their home modules to avoid duplication
 # NOTE: These are imported at runtime to avoid circular imports
@@ -44,8 +45,24 @@ class PromptKnowledgeBase:
     def __init__(self):
         """Initialize the prompt knowledge base."""
         self.entries: list[PromptEntry] = []
+        # Secondary indexes over `entries`, kept in step by `_append`, so
+        # lookups by type or by prompt hash don't scan every entry.
+        self._by_type: dict[str, list[PromptEntry]] = {}
+        self._scores_by_hash: dict[str, PromptEntry] = {}
         self._load()
 
+    def _append(self, entry: PromptEntry) -> None:
+        """Add an entry to `entries` and to the indexes."""
+        self.entries.append(entry)
+        self._by_type.setdefault(entry.entry_type, []).append(entry)
+        if entry.entry_type == "score":
+            # First entry wins, as the old front-to-back scan did.
+            self._scores_by_hash.setdefault(entry.data.get("prompt_hash"), entry)
+
+    def _of_type(self, entry_type: str) -> list[PromptEntry]:
+        """Entries of one type, in insertion order. Do not mutate."""
+        return self._by_type.get(entry_type, [])
+
     def _load(self) -> None:
         """Load entries from JSON file."""
         try:
@@ -58,6 +75,8 @@ class PromptKnowledgeBase:
 
             raw_entries = data.get("entries", [])
             self.entries = []
+            self._by_type = {}
+            self._scores_by_hash = {}
             for entry_dict in raw_entries:
                 entry = PromptEntry(
                     id=entry_dict["id"],
@@ -68,7 +87,7 @@ class PromptKnowledgeBase:
                     updated_at=datetime.fromisoformat(entry_dict["updated_at"]),
                     project=entry_dict.get("project"),
                 )
-                self.entries.append(entry)
+                self._append(entry)
 
             logger.debug(f"Loaded {len(self.entries)} entries from {self.STORAGE_FILE}")
         except FileNotFoundError:
@@ -131,6 +150,18 @@ class PromptKnowledgeBase:
         Args:
             pattern: A PromptPattern from neo.prompt.analyzer
         """
+        self.add_patterns([pattern])
+
+    def add_patterns(self, patterns: Iterable["PromptPattern"]) -> None:
+        """Add several patterns with a single write of the storage file."""
+        added = False
+        for pattern in patterns:
+            self._add_pattern_entry(pattern)
+            added = True
+        if added:
+            self._save()
+
+    def _add_pattern_entry(self, pattern: "PromptPattern") -> None:
         now = datetime.now()
         entry = PromptEntry(
             id=self._generate_id("pattern"),
@@ -150,8 +181,7 @@ class PromptKnowledgeBase:
             updated_at=now,
             project=None,
         )
-        self.entries.append(entry)
-        self._save()
+        self._append(entry)
 
     def search_patterns(self, query: str, k: int = 5) -> list["PromptPattern"]:
         """
@@ -169,18 +199,12 @@ class PromptKnowledgeBase:
         query_lower = query.lower()
         query_terms = query_lower.split()
 
-        pattern_entries = [e for e in self.entries if e.entry_type == "pattern"]
-
         # If no query, return all patterns sorted by effectiveness
         if not query_terms:
-            pattern_entries.sort(
-                key=lambda e: e.data.get("effectiveness_score", 0.0),
-                reverse=True
-            )
-            scored_entries = [(0, e) for e in pattern_entries[:k]]
+            scored_entries = [(0, e) for e in self.top_patterns(k)]
         else:
             scored_entries: list[tuple[int, PromptEntry]] = []
-            for entry in pattern_entries:
+            for entry in self._of_type("pattern"):
                 data = entry.data
                 searchable_text = " ".join([
                     data.get("name", ""),
@@ -213,6 +237,25 @@ class PromptKnowledgeBase:
 
         return results
 
+    def top_patterns(self, limit: int) -> list[PromptEntry]:
+        """The ``limit`` pattern entries with the highest effectiveness score.
+
+        Same order as a stable descending sort, without sorting every pattern.
+        """
+        return heapq.nlargest(
+            limit,
+            self._of_type("pattern"),
+            key=lambda e: e.data.get("effectiveness_score", 0.0),
+        )
+
+    def iter_scores_above(self, threshold: float) -> Iterator[PromptEntry]:
+        """Score entries whose aggregated score exceeds ``threshold``."""
+        return (e for e in self._of_type("score") if e.data.get("score", 0) > threshold)
+
+    def last_score_update(self) -> Optional[datetime]:
+        """When a score entry was last added or re-aggregated, if ever."""
+        return max((e.updated_at for e in self._of_type("score")), default=None)
+
     def update_effectiveness_score(self, score: "PromptEffectivenessScore") -> None:
         """
         Update effectiveness score, aggregating with existing data.
@@ -223,16 +266,29 @@ class PromptKnowledgeBase:
         Args:
             score: A PromptEffectivenessScore from neo.prompt.analyzer
         """
+        self.update_effectiveness_scores([score])
+
+    def update_effectiveness_scores(
+        self, scores: Iterable["PromptEffectivenessScore"]
+    ) -> None:
+        """Aggregate several scores, then write the storage file once.
+
+        The file holds every entry, so one write per score would rewrite the
+        whole knowledge base for each prompt in a session.
+        """
+        updated = False
+        for score in scores:
+            self._aggregate_score(score)
+            updated = True
+        if updated:
+            self._save()
+
+    def _aggregate_score(self, score: "PromptEffectivenessScore") -> None:
         # Convert EffectivenessSignal enums to string values for JSON storage
         def serialize_signals(signals: list) -> list[str]:
             return [s.value if hasattr(s, 'value') else str(s) for s in signals]
 
-        existing_entry = None
-        for entry in self.entries:
-            if entry.entry_type == "score":
-                if entry.data.get("prompt_hash") == score.prompt_hash:
-                    existing_entry = entry
-                    break
+        existing_entry = self._scores_by_hash.get(score.prompt_hash)
 
         if existing_entry:
             existing_data = existing_entry.data
@@ -276,9 +332,7 @@ class PromptKnowledgeBase:
                 updated_at=now,
                 project=None,
             )
-            self.entries.append(entry)
-
-        self._save()
+            self._append(entry)
 
     def add_evolution(self, evolution: "ClaudeMdEvolution") -> None:
         """Record a CLAUDE.md evolution.
@@ -304,7 +358,7 @@ class PromptKnowledgeBase:
             updated_at=now,
             project=str(Path(evolution.path).parent) if evolution.path else None,
         )
-        self.entries.append(entry)
+        self._append(entry)
         self._save()
 
     def get_evolutions(self, path: Optional[Path] = None) -> list["ClaudeMdEvolution"]:
@@ -319,7 +373,7 @@ class PromptKnowledgeBase:
         """
         from neo.prompt.evolution import ClaudeMdEvolution
 
-        evolution_entries = [e for e in self.entries if e.entry_type == "evolution"]
+        evolution_entries = list(self._of_type("evolution"))
 
         if path:
             path_str = str(path)
@@ -361,7 +415,7 @@ class PromptKnowledgeBase:
             updated_at=now,
             project=suggestion.get("target") or suggestion.get("project"),
         )
-        self.entries.append(entry)
+        self._append(entry)
         self._save()
 
     def get_pending_suggestions(self, project: Optional[str] = None) -> list[dict]:
@@ -375,8 +429,8 @@ class PromptKnowledgeBase:
             List of suggestion dictionaries with status "pending".
         """
         suggestion_entries = [
-            e for e in self.entries
-            if e.entry_type == "suggestion" and e.data.get("status") == "pending"
+            e for e in self._of_type("suggestion")
+            if e.data.get("status") == "pending"
         ]
 
         if project:
@@ -386,9 +440,9 @@ class PromptKnowledgeBase:
 
     def get_stats(self) -> dict:
         """Get knowledge base statistics."""
-        pattern_count = len([e for e in self.entries if e.entry_type == "pattern"])
-        score_count = len([e for e in self.entries if e.entry_type == "score"])
-        evolution_count = len([e for e in self.entries if e.entry_type == "evolution"])
+        pattern_count = len(self._of_type("pattern"))
+        score_count = len(self._of_type("score"))
+        evolution_count = len(self._of_type("evolution"))
         pending_suggestions = len(self.get_pending_suggestions())
         projects = set(e.project for e in self.entries if e.project)
 
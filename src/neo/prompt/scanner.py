@@ -14,7 +14,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Iterator, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -294,14 +294,34 @@ class Scanner:
             since: Only return sessions modified after this datetime
 
         Returns:
-            List of ScannedSession objects
+            List of ScannedSession objects, sorted by start time
+        """
+        sessions = list(self.iter_sessions(project=project, since=since))
+        sessions.sort(key=lambda s: s.start_time)
+        return sessions
+
+    def iter_sessions(
+        self, project: Optional[str] = None, since: Optional[datetime] = None
+    ) -> Iterator[ScannedSession]:
+        """
+        Yield sessions one at a time, in directory order.
+
+        Same filtering as `scan_sessions`, but only one parsed session (and
+        its messages) is alive at a time. Use this when each session is
+        consumed once and order doesn't matter.
+
+        Args:
+            project: Filter to specific project path (None for all projects)
+            since: Only yield sessions modified after this datetime
+
+        Yields:
+            ScannedSession objects
         """
-        sessions = []
         projects_dir = self.sources.projects_dir
 
         if not projects_dir.exists():
             logger.debug(f"Projects directory not found: {projects_dir}")
-            return sessions
+            return
 
         # Find project directories to scan
         project_dirs = []
@@ -330,11 +350,7 @@ class Scanner:
 
                 session = self._parse_session_file(session_file, project_path)
                 if session:
-                    sessions.append(session)
-
-        # Sort by start time
-        sessions.sort(key=lambda s: s.start_time)
-        return sessions
+                    yield session
 
     def _parse_session_file(
         self, session_file: Path, project: str
@@ -0,0 +1,122 @@
+"""
+Bounded retry with jittered backoff for transient provider failures.
+
+A 429 or a 5xx from a provider usually clears within seconds. Failing the
+whole neo run on one is wasteful; hammering the provider again immediately
+makes the rate limit worse for every client behind the same key. This helper
+retries a call with decorrelated-jitter backoff, sleeps at least as long as
+the server's ``Retry-After`` asks, and gives up once the total time spent
+sleeping would exceed ``max_wait``.
+
+Only used for calls that bypass an SDK retry loop — the raw ``/v1/responses``
+client, Ollama and google-genai. The ``openai`` and ``anthropic`` SDKs already
+retry 429/5xx with the same header handling, and stacking a second loop on
+top would multiply their attempts.
+"""
+
+import email.utils
+import logging
+import random
+import time
+from typing import Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Statuses worth retrying: rate limited, or a server/gateway hiccup. Every
+#: other 4xx is the request's fault and will fail the same way again.
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def status_of(obj: object) -> Optional[int]:
+    """HTTP status of a response or of an SDK/httpx error, if it carries one."""
+    for attr in ("status_code", "code"):
+        value = getattr(obj, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(obj, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after_seconds(obj: object) -> Optional[float]:
+    """Server-requested delay from ``retry-after-ms`` / ``retry-after``.
+
+    ``obj`` is a response or an error with a ``.response``. ``Retry-After``
+    may be delta-seconds or an HTTP-date; anything unparseable is ignored.
+    """
+    headers = getattr(obj, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(obj, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        raw_ms = headers.get("retry-after-ms")
+        if raw_ms is not None:
+            return max(0.0, float(raw_ms) / 1000.0)
+        raw = headers.get("retry-after")
+        if raw is None:
+            return None
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            when = email.utils.parsedate_to_datetime(raw)
+            return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    *,
+    max_attempts: int = 5,
+    base: float = 0.25,
+    cap: float = 8.0,
+    max_wait: float = 60.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """Call ``fn``, retrying while it fails with a retryable status.
+
+    ``fn`` may signal a retryable failure either by raising an error that
+    carries a status (``openai``/``httpx``/``google-genai`` errors all do) or
+    by returning a response whose ``status_code`` is retryable — raw HTTP
+    calls check the status themselves. On the last attempt, or once the sleep
+    budget ``max_wait`` is spent, the final error is raised or the final
+    response returned as-is, so the caller's own error handling still applies.
+    """
+    delay = base
+    waited = 0.0
+    for attempt in range(1, max_attempts + 1):
+        try:
+            outcome = fn()
+            failure = outcome if status_of(outcome) in RETRYABLE_STATUS else None
+        except Exception as e:
+            if status_of(e) not in RETRYABLE_STATUS:
+                raise
+            outcome, failure = e, e
+
+        if failure is None:
+            return outcome
+
+        # Decorrelated jitter: spreads concurrent retries apart while still
+        # growing roughly geometrically. A server-requested delay is a floor.
+        delay = min(cap, random.uniform(base, delay * 3))
+        pause = max(delay, retry_after_seconds(failure) or 0.0)
+        if attempt == max_attempts or waited + pause > max_wait:
+            break
+        logger.debug(
+            "retryable status %s (attempt %d/%d); sleeping %.2fs",
+            status_of(failure), attempt, max_attempts, pause,
+        )
+        if not isinstance(outcome, Exception):
+            # A discarded streamed response still holds its connection.
+            close = getattr(outcome, "close", None)
+            if close is not None:
+                close()
+        sleep(pause)
+        waited += pause
+
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
@@ -0,0 +1,69 @@
+"""
+In-process coalescing of identical concurrent calls.
+
+When `generate_batch` or several agent threads fire the same deterministic
+request at once, only one of them needs to reach the provider; the rest can
+wait for its answer. `SingleFlight` runs the first caller's function and
+hands its result (or exception) to every caller that arrived with the same key
+while it was in flight. Once the call finishes the key is forgotten — this is
+deduplication of concurrent work, not a cache (see `neo.llm_cache` for that).
+
+Thread-based rather than asyncio-based because `LMAdapter.agenerate` runs the
+blocking `generate` on worker threads, so sync and async callers meet here.
+"""
+
+import threading
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key onto one execution."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Return ``(fn(), shared)``.
+
+        ``shared`` is True for callers that received another caller's result
+        instead of running ``fn`` themselves. An exception raised by the
+        running call is re-raised in every waiter.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.value, False
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -254,8 +254,10 @@ def _compact_fact_file(path: Path, *, max_invalid_age_days: int = 30, dry_run: b
 
 
 def _compact_fact_file_locked(path: Path, *, max_invalid_age_days: int, dry_run: bool) -> dict:
+    from neo import fastjson
+
     try:
-        data = json.loads(path.read_text())
+        data = fastjson.loads_state(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         return {"status": "error", "path": str(path), "error": str(exc)}
 
@@ -300,7 +302,7 @@ def _compact_fact_file_locked(path: Path, *, max_invalid_age_days: int, dry_run:
         updated = dict(data)
         updated["facts"] = kept
         tmp = path.with_suffix(path.suffix + ".tmp")
-        tmp.write_text(json.dumps(updated, indent=2))
+        tmp.write_bytes(fastjson.dumps_arrays(updated))
         tmp.replace(path)
 
     return {
@@ -134,3 +134,10 @@ def clear_remote_url_cache():
     scope.clear_remote_url_cache()
     yield
     scope.clear_remote_url_cache()
+
+
+@pytest.fixture(autouse=True)
+def no_adapter_prewarm(monkeypatch):
+    """Keep `resolve_adapter` from opening background connections to real
+    provider hosts with the fake keys tests configure."""
+    monkeypatch.setenv("NEO_PREWARM", "0")
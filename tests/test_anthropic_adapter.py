@@ -116,3 +116,37 @@ def test_unrelated_400_reraises(_fake_anthropic):
 
     assert adapter.client.messages.create.call_count == 1
     assert not adapters._PARAM_COMPAT.has("anthropic", "claude-opus-4-8", "drop_temperature")
+
+
+def test_stream_yields_text_deltas(_fake_anthropic):
+    adapter = _fake_anthropic(model="claude-sonnet-4-5-20250929", api_key="k")
+    adapter.client = MagicMock()
+    stream = adapter.client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = iter(["Hel", "lo"])
+    stream.get_final_message.return_value = _ok_response("Hello")
+
+    chunks = list(adapter.stream_generate([{"role": "user", "content": "hi"}]))
+
+    assert chunks == ["Hel", "lo"]
+    assert adapter.client.messages.stream.call_args.kwargs["messages"] == [
+        {"role": "user", "content": "hi"}
+    ]
+
+
+def test_stream_drops_temperature_and_retries_on_400(_fake_anthropic):
+    """The temperature 400 arrives when the stream opens, so the stream path
+    recovers exactly like `generate`."""
+    adapter = _fake_anthropic(model="claude-opus-4-8", api_key="k")
+    adapter.client = MagicMock()
+    ok = MagicMock()
+    ok.__enter__.return_value.text_stream = iter(["recovered"])
+    ok.__enter__.return_value.get_final_message.return_value = _ok_response()
+    rejected = MagicMock()
+    rejected.__enter__.side_effect = _BadRequestError("`temperature` is deprecated.")
+    adapter.client.messages.stream.side_effect = [rejected, ok]
+
+    chunks = list(adapter.stream_generate([{"role": "user", "content": "hi"}]))
+
+    assert chunks == ["recovered"]
+    assert "temperature" not in adapter.client.messages.stream.call_args_list[1].kwargs
+    assert adapters._PARAM_COMPAT.has("anthropic", "claude-opus-4-8", "drop_temperature")
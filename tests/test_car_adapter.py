@@ -268,6 +268,38 @@ def test_create_adapter_factory_returns_car_adapter():
     assert adapter2.model == "qwen3-32b"
 
 
+def test_create_adapter_shared_returns_one_instance_per_key():
+    from neo.adapters import clear_adapter_cache
+
+    car_inference.set_runtime(FakeRuntime())
+    try:
+        first = create_adapter("car", model="qwen3-32b", shared=True)
+        assert create_adapter("car", model="qwen3-32b", shared=True) is first
+        assert create_adapter("car", model="gpt-5", shared=True) is not first
+        assert create_adapter("car", model="qwen3-32b") is not first  # unshared by default
+    finally:
+        clear_adapter_cache()
+    assert create_adapter("car", model="qwen3-32b", shared=True) is not first
+    clear_adapter_cache()
+
+
+def test_create_adapter_shared_accepts_unhashable_kwargs():
+    from neo.adapters import clear_adapter_cache
+
+    car_inference.set_runtime(FakeRuntime())
+    try:
+        first = create_adapter("car", model="qwen3-32b", shared=True,
+                               intent_hint={"task": "code", "prefer": "fast"})
+        again = create_adapter("car", model="qwen3-32b", shared=True,
+                               intent_hint={"prefer": "fast", "task": "code"})
+        other = create_adapter("car", model="qwen3-32b", shared=True,
+                               intent_hint={"task": "chat"})
+        assert again is first
+        assert other is not first
+    finally:
+        clear_adapter_cache()
+
+
 def test_get_runtime_raises_clear_error_when_car_runtime_missing():
     with patch.object(car_inference, "is_available", return_value=False):
         # Force import path to fail by clearing the singleton and patching importlib
@@ -94,6 +94,21 @@ def test_auto_does_not_build_static_when_car_available(monkeypatch):
     assert isinstance(a, AutoAdapter) and a.generate([]) == "car"  # no static build needed
 
 
+def test_resolve_adapter_prewarms_only_when_opted_in(monkeypatch):
+    _stub_create(monkeypatch)
+    started = []
+    monkeypatch.setattr(A, "_start_prewarm", started.append)
+    config = NeoConfig(provider="openai", inference_mode="static")
+
+    monkeypatch.delenv("NEO_PREWARM", raising=False)
+    resolve_adapter(config)
+    assert started == []
+
+    monkeypatch.setenv("NEO_PREWARM", "1")
+    resolve_adapter(config)
+    assert len(started) == 1
+
+
 # --- AutoAdapter runtime fallback + circuit breaker -----------------------
 
 def test_autoadapter_prefers_car():
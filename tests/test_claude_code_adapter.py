@@ -0,0 +1,114 @@
+"""
+Unit tests for ClaudeCodeAdapter.
+
+The adapter shells out to the `claude` CLI; these tests point it at a small
+Python script standing in for the CLI, which echoes back what it received.
+"""
+
+import sys
+import textwrap
+
+import pytest
+
+from neo.adapters import ClaudeCodeAdapter
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="fake CLI is a shebang script")
+
+# Replies with how the system prompt arrived and its length.
+FAKE_CLI = textwrap.dedent("""\
+    #!{python}
+    import json, sys
+    if "--version" in sys.argv:
+        print("1.0")
+        sys.exit(0)
+    sys.stdin.read()
+    if "--system-prompt" in sys.argv:
+        how, prompt = "inline", sys.argv[sys.argv.index("--system-prompt") + 1]
+    else:
+        how, prompt = "file", open(sys.argv[sys.argv.index("--system-prompt-file") + 1]).read()
+    text = f"{{how}}:{{len(prompt)}}"
+    print(json.dumps({{"type": "assistant", "message": {{
+        "content": [{{"type": "text", "text": text}}], "stop_reason": "end_turn"}}}}))
+""")
+
+
+@pytest.fixture
+def adapter(tmp_path):
+    cli = tmp_path / "claude"
+    cli.write_text(FAKE_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+    return ClaudeCodeAdapter(cli_path=str(cli))
+
+
+def _ask(adapter, system_prompt):
+    return adapter.generate([
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": "hi"},
+    ])
+
+
+def test_system_prompt_passed_inline(adapter):
+    assert _ask(adapter, "be brief") == "inline:8"
+
+
+def test_oversized_system_prompt_goes_through_a_file(adapter, tmp_path, monkeypatch):
+    from neo import adapters
+
+    monkeypatch.setattr(adapters, "_CLI_INLINE_PROMPT_MAX", 16)
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    monkeypatch.setattr(adapters.tempfile, "tempdir", str(scratch))
+    assert _ask(adapter, "x" * 100) == "file:100"
+    # The temp file is removed after the call
+    assert list(scratch.iterdir()) == []
+
+
+# Floods stderr well past the OS pipe buffer before answering, then fails.
+NOISY_CLI = textwrap.dedent("""\
+    #!{python}
+    import sys
+    if "--version" in sys.argv:
+        print("1.0")
+        sys.exit(0)
+    sys.stdin.read()
+    sys.stderr.write("warn\\n" * 200_000)
+    sys.stderr.write("fatal: boom\\n")
+    sys.exit(3)
+""")
+
+
+def test_heavy_stderr_does_not_deadlock(tmp_path):
+    cli = tmp_path / "claude"
+    cli.write_text(NOISY_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+    adapter = ClaudeCodeAdapter(cli_path=str(cli), timeout=30)
+
+    with pytest.raises(RuntimeError, match="exited with code 3") as exc:
+        _ask(adapter, "be brief")
+    assert str(exc.value).rstrip().endswith("fatal: boom")
+
+
+# Answers in whichever output format it was asked for.
+FORMAT_CLI = textwrap.dedent("""\
+    #!{python}
+    import json, sys
+    if "--version" in sys.argv:
+        print("1.0")
+        sys.exit(0)
+    question = json.loads(sys.stdin.read())[-1]["content"]
+    if sys.argv[sys.argv.index("--output-format") + 1] == "text":
+        print("  plain: " + question)
+    else:
+        print(json.dumps({{"type": "assistant", "message": {{
+            "content": [{{"type": "text", "text": "json: " + question}}],
+            "stop_reason": "end_turn"}}}}))
+""")
+
+
+def test_plain_text_output_mode(tmp_path):
+    cli = tmp_path / "claude"
+    cli.write_text(FORMAT_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+
+    assert _ask(ClaudeCodeAdapter(cli_path=str(cli)), "s") == "json: hi"
+    assert _ask(ClaudeCodeAdapter(cli_path=str(cli), stream_json=False), "s") == "plain: hi"
@@ -0,0 +1,55 @@
+"""Tests for neo.memory.constraints - project doc constraint ingestion."""
+
+from neo.memory.constraints import ConstraintIngester
+
+
+def test_split_markdown_by_headings(tmp_path):
+    doc = tmp_path / "CLAUDE.md"
+    doc.write_text("intro\n# Style\nuse tabs\n#### not a heading\n## Tests\nrun pytest\n")
+
+    sections = ConstraintIngester(str(tmp_path))._split_markdown(doc)
+
+    assert sections == [
+        ("CLAUDE.md", "intro"),
+        ("Style", "use tabs\n#### not a heading"),
+        ("Tests", "run pytest"),
+    ]
+
+
+def test_split_markdown_tolerates_crlf_and_bad_bytes(tmp_path):
+    doc = tmp_path / "CLAUDE.md"
+    doc.write_bytes(b"# Rules\r\nno \xff tabs\r\n")
+
+    sections = ConstraintIngester(str(tmp_path))._split_markdown(doc)
+
+    assert sections == [("Rules", "no � tabs")]
+
+
+def test_split_markdown_unreadable_path_is_empty(tmp_path):
+    assert ConstraintIngester(str(tmp_path))._split_markdown(tmp_path / "missing.md") == []
+
+
+def test_changed_file_supersedes_only_its_own_constraints(tmp_path, monkeypatch):
+    from neo.memory.models import Fact, FactKind, FactMetadata, FactScope
+
+    doc = tmp_path / "CLAUDE.md"
+    doc.write_text("# Style\nuse tabs\n")
+
+    def constraint(source):
+        return Fact(subject="old", body="old", kind=FactKind.CONSTRAINT,
+                    scope=FactScope.PROJECT,
+                    metadata=FactMetadata(source_file=source))
+
+    own, other = constraint(str(doc)), constraint(str(tmp_path / "AGENTS.md"))
+
+    new, superseded = ConstraintIngester(str(tmp_path)).ingest([own, other])
+
+    assert [f.subject for f in new] == ["Style"]
+    assert superseded == [own]
+    assert not own.is_valid and other.is_valid
+
+    # Unchanged on the next run: nothing new, nothing superseded, no rewrite
+    saves = []
+    monkeypatch.setattr(ConstraintIngester, "_save_checksums", lambda self: saves.append(1))
+    assert ConstraintIngester(str(tmp_path)).ingest(new) == ([], [])
+    assert saves == []
@@ -105,6 +105,51 @@ class TestContextAssemblerScoring:
         result = assembler.assemble([far, close], "query", query_embedding=query_emb, k=2)
         assert result.valid_facts[0].subject == "close"
 
+    def test_replaced_embedding_is_rescored(self, assembler):
+        query_emb = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        a = _make_fact(subject="a", embedding=np.array([1.0, 0.0, 0.0], dtype=np.float32))
+        b = _make_fact(subject="b", embedding=np.array([0.0, 1.0, 0.0], dtype=np.float32))
+        first = assembler.assemble([a, b], "query", query_embedding=query_emb, k=2)
+        assert first.valid_facts[0].subject == "a"
+
+        b.embedding = np.array([2.0, 0.0, 0.0], dtype=np.float32)
+        a.embedding = None
+        second = assembler.assemble([a, b], "query", query_embedding=query_emb, k=2)
+        assert second.valid_facts[0].subject == "b"
+        assert second.retrieval_scores[b.id] > second.retrieval_scores[a.id]
+
+    def test_int8_scoring_matches_float_ranking(self, assembler, monkeypatch):
+        pytest.importorskip("simsimd")
+        from neo.memory import context
+
+        rng = np.random.default_rng(0)
+        facts = [
+            _make_fact(subject=f"f{i}", embedding=rng.standard_normal(64).astype(np.float32))
+            for i in range(50)
+        ]
+        query_emb = facts[7].embedding + 0.05 * rng.standard_normal(64).astype(np.float32)
+        exact = assembler._similarities(facts, query_emb)
+
+        monkeypatch.setattr(context, "Q8_MIN_ROWS", 1)
+        approx = ContextAssembler()._similarities(facts, query_emb)
+        np.testing.assert_allclose(approx, exact, atol=1e-2)
+        assert int(np.argmax(approx)) == 7
+
+    def test_embedding_matrix_int8_path_approximates_batched_cosine(self):
+        pytest.importorskip("simsimd")
+        from neo.math_utils import EmbeddingMatrix, batched_cosine
+
+        rng = np.random.default_rng(1)
+        embeddings = [rng.standard_normal(64).astype(np.float32) for _ in range(40)]
+        embeddings[3] = None
+        query = rng.standard_normal(64).astype(np.float32)
+
+        exact = batched_cosine(embeddings, query)
+        approx = EmbeddingMatrix(quantize_from=1).cosines(embeddings, query)
+        np.testing.assert_allclose(approx, exact, atol=1e-2)
+        assert approx[3] == exact[3] == 0.5
+        assert EmbeddingMatrix().cosines(embeddings, query) == exact
+
     def test_k_limits_results(self, assembler):
         facts = [_make_fact(subject=f"fact_{i}") for i in range(10)]
         result = assembler.assemble(facts, "query", k=3)
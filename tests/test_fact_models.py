@@ -8,6 +8,8 @@ from neo.memory.models import (
     FactKind,
     FactMetadata,
     FactScope,
+    rank_score,
+    rank_scores,
 )
 
 
@@ -105,7 +107,16 @@ class TestFact:
         assert restored.contradicting_episode_ids == ["conflict-1"]
         assert restored.source_candidate_id == "candidate-1"
         assert restored.invalidation_reason == "repeated_attributed_contradiction"
-        np.testing.assert_array_almost_equal(restored.embedding, embedding, decimal=5)
+        np.testing.assert_array_almost_equal(
+            restored.embedding, embedding / np.linalg.norm(embedding), decimal=5,
+        )
+
+    def test_embedding_normalized_at_construction(self):
+        fact = Fact(subject="s", body="b", embedding=np.array([3.0, 4.0]))
+        assert fact.embedding.dtype == np.float32
+        np.testing.assert_allclose(fact.embedding, [0.6, 0.8], rtol=1e-6)
+        zero = Fact(subject="s", body="b", embedding=np.zeros(3, dtype=np.float32))
+        assert not zero.embedding.any()
 
     def test_to_dict_no_embedding(self):
         fact = Fact(subject="No embedding")
@@ -176,3 +187,28 @@ class TestContextResult:
         assert len(ctx.valid_facts) == 1
         assert len(ctx.known_unknowns) == 1
         assert ctx.environment["branch"] == "main"
+
+
+class TestRankScores:
+    def test_matches_rank_score_per_fact(self):
+        now = 1_700_000_000.0
+        day = 86400.0
+        facts = [
+            Fact(kind=FactKind.PATTERN, metadata=FactMetadata(
+                confidence=0.8, created_at=now - 40 * day)),
+            Fact(kind=FactKind.PATTERN, metadata=FactMetadata(
+                confidence=0.6, created_at=now - 90 * day, last_recall_ts=now - 2 * day,
+                g_n=2.5, success_count=3, effectiveness_c=1.5, effectiveness_n=2)),
+            Fact(kind=FactKind.DECISION, metadata=FactMetadata(
+                confidence=0.9, success_count=1, provenance="structural")),
+            Fact(kind=FactKind.REVIEW, tags=["seed"], metadata=FactMetadata(
+                confidence=0.5, provenance="observed")),
+            Fact(kind=FactKind.FAILURE, metadata=FactMetadata(
+                confidence=0.7, created_at=now - day, g_n=0.0)),
+        ]
+        sims = [0.9, 0.4, 0.7, -0.2, 0.0]
+        expected = [rank_score(f, s, now) for f, s in zip(facts, sims)]
+        np.testing.assert_allclose(rank_scores(facts, sims, now), expected, rtol=1e-12)
+
+    def test_empty(self):
+        assert rank_scores([], []).shape == (0,)
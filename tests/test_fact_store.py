@@ -1,5 +1,8 @@
 """Tests for neo.memory.store - FactStore integration tests."""
 
+import json
+import math
+import os
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -288,6 +291,60 @@ class TestPersistence:
         assert len(found) == 1
         assert found[0].body == "Important content"
 
+    def test_save_file_round_trips_embeddings_and_unicode(self, store, tmp_path):
+        path = tmp_path / "facts_roundtrip.json"
+        fact = Fact(
+            subject="Préférer les dates UTC", body="→ always",
+            embedding=np.array([0.6, 0.8, 0.0], dtype=np.float32),
+        )
+        store._save_file(path, [fact])
+
+        assert json.loads(path.read_bytes())["facts"][0]["subject"] == fact.subject
+        [loaded] = store._load_file(path)
+        assert loaded.subject == fact.subject and loaded.body == fact.body
+        np.testing.assert_array_equal(loaded.embedding, fact.embedding)
+
+    def test_load_file_accepts_stdlib_nan_tokens(self, store, tmp_path):
+        path = tmp_path / "facts_legacy.json"
+        fact = Fact(subject="Legacy", body="written by stdlib json")
+        data = {"version": "2.0", "facts": [fact.to_dict()]}
+        data["facts"][0]["embedding"] = [float("nan"), 1.0]
+        path.write_text(json.dumps(data, indent=2))
+
+        [loaded] = store._load_file(path)
+        assert loaded.subject == "Legacy"
+        assert not list(tmp_path.glob("facts_legacy.json.corrupt-*"))
+
+    def test_save_file_round_trips_non_finite_floats(self, store, tmp_path):
+        path = tmp_path / "facts_nan.json"
+        fact = Fact(subject="NaN", body="non-finite values survive a save")
+        fact.metadata.confidence = float("nan")
+        fact.metadata.g_n = float("inf")
+        fact.embedding = np.array([float("nan"), 1.0, float("-inf")], dtype=np.float32)
+
+        assert store._save_file(path, [fact]) is not None
+        [loaded] = store._load_file(path)
+
+        assert math.isnan(loaded.metadata.confidence)
+        assert loaded.metadata.g_n == float("inf")
+        assert np.isnan(loaded.embedding[0])
+        assert loaded.embedding[1] == 1.0
+        assert loaded.embedding[2] == float("-inf")
+
+    def test_save_skips_unchanged_scope_files(self, store):
+        store.add_fact(subject="Global", body="b", kind=FactKind.PATTERN,
+                       scope=FactScope.GLOBAL)
+        store.add_fact(subject="Project", body="b", kind=FactKind.PATTERN,
+                       scope=FactScope.PROJECT)
+        global_mtime = store._global_path.stat().st_mtime_ns
+
+        with patch("os.replace", wraps=os.replace) as replace:
+            store.add_fact(subject="Project 2", body="b", kind=FactKind.PATTERN,
+                           scope=FactScope.PROJECT)
+
+        assert [c.args[1] for c in replace.call_args_list] == [str(store._project_path)]
+        assert store._global_path.stat().st_mtime_ns == global_mtime
+
     def test_corrupt_fact_file_is_backed_up_before_empty_load(self, tmp_facts_dir, tmp_path):
         corrupt_path = tmp_facts_dir / "facts_global.json"
         corrupt_path.write_text('{"facts": [')
@@ -2666,6 +2723,26 @@ class TestDemoteUnhelpfulFacts:
         assert store.demote_unhelpful_facts() == 1
         assert fact.is_valid is False
 
+    def test_prune_cascades_needs_review(self, store):
+        old_time = time.time() - 10 * 86400
+        parents = [
+            Fact(
+                id=f"bad_{i}", subject=f"actively bad {i}", body="never helped",
+                kind=FactKind.PATTERN, scope=FactScope.PROJECT,
+                metadata=FactMetadata(
+                    confidence=0.6, access_count=12, success_count=0, created_at=old_time,
+                ),
+            )
+            for i in range(2)
+        ]
+        child = Fact(
+            subject="child", body="depends on the second", kind=FactKind.PATTERN,
+            scope=FactScope.PROJECT, depends_on=["unrelated", "bad_1"],
+        )
+        store._facts.extend([*parents, child])
+        assert store.demote_unhelpful_facts() == 2
+        assert child.needs_review is True
+
     def test_protects_successful_facts(self, store):
         """Facts with good hit rate should get a confidence boost."""
         old_time = time.time() - 10 * 86400
@@ -2743,7 +2820,7 @@ class TestConstraintEmbeddings:
              patch.object(FactStore, "_ingest_seed_facts"), \
              patch.object(FactStore, "_ingest_community_feed"), \
              patch.object(FactStore, "_ingest_claude_memory"), \
-             patch.object(FactStore, "_embed_text", return_value=fake_emb), \
+             patch.object(FactStore, "_embed_texts", side_effect=lambda texts: [fake_emb] * len(texts)), \
              patch("neo.memory.constraints.CHECKSUM_DIR", tmp_checksum_dir), \
              patch("neo.memory.constraints.CHECKSUM_FILE", tmp_checksum_dir / "checksums.json"):
             s = FactStore(codebase_root=str(tmp_path))
@@ -2764,7 +2841,7 @@ class TestConstraintEmbeddings:
              patch.object(FactStore, "_ingest_seed_facts"), \
              patch.object(FactStore, "_ingest_community_feed"), \
              patch.object(FactStore, "_ingest_claude_memory"), \
-             patch.object(FactStore, "_embed_text", return_value=fake_emb), \
+             patch.object(FactStore, "_embed_texts", side_effect=lambda texts: [fake_emb] * len(texts)), \
              patch("neo.memory.constraints.CHECKSUM_DIR", tmp_checksum_dir), \
              patch("neo.memory.constraints.CHECKSUM_FILE", tmp_checksum_dir / "checksums.json"):
             s = FactStore(codebase_root=str(tmp_path))
@@ -2773,6 +2850,43 @@ class TestConstraintEmbeddings:
         assert any(f.metadata.source_file == str(agents_md) for f in constraints)
 
 
+class TestEmbedTextCache:
+    def test_texts_sharing_the_embedded_prefix_share_a_cache_entry(self, store):
+        from unittest.mock import MagicMock
+        from neo.memory.store import MAX_TEXT_LENGTH
+
+        store._embedder_initialized = True
+        store._embedder = MagicMock()
+        store._embedder.embed.return_value = [np.ones(8, dtype=np.float32)]
+
+        prefix = "x" * MAX_TEXT_LENGTH
+        first = store._embed_text(prefix + "tail one")
+        second = store._embed_text(prefix + "tail two")
+        store._embed_text("short")
+        store._embed_text("short")
+
+        assert first is second
+        assert store._embedder.embed.call_count == 2
+
+    def test_batch_embeds_uncached_texts_in_one_call(self, store):
+        from unittest.mock import MagicMock
+
+        store._embedder_initialized = True
+        store._embedder = MagicMock()
+        store._embedder.embed.side_effect = lambda texts: [
+            np.eye(8, dtype=np.float32)[len(t)] for t in texts
+        ]
+        cached = store._embed_text("cached")
+
+        out = store._embed_texts(["a", "", "cached", "bb", "a"])
+
+        assert store._embedder.embed.call_args_list[-1].args == (["a", "bb"],)
+        assert out[1] is None
+        assert out[2] is cached
+        assert out[0] is out[4]
+        assert not np.array_equal(out[0], out[3])
+
+
 class TestConcurrentSaveMerge:
     """save() must not let one process clobber facts another just added —
     the observer-vs-request-path clobber that erased linked reasoning facts."""
@@ -0,0 +1,115 @@
+"""Tests for concurrent generation (`LMAdapter.agenerate`, `generate_batch`).
+
+Every provider call blocks on network I/O, so a caller needing several
+completions used to pay their round-trips back to back. The batch helpers must
+overlap them while keeping results in request order.
+"""
+
+import threading
+import time
+
+import pytest
+
+from neo.adapters import generate_batch
+from neo.models import LMAdapter
+
+
+class _SlowAdapter(LMAdapter):
+    """Sleeps like a network call and echoes the last message back."""
+
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.peak = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def generate(self, messages, stop=None, max_tokens=4096, temperature=0.7,
+                 reasoning_effort=None):
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+            self.calls.append({"max_tokens": max_tokens, "temperature": temperature})
+        try:
+            time.sleep(self.delay)
+            content = messages[-1]["content"]
+            if content == "boom":
+                raise RuntimeError("provider failed")
+            return content.upper()
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def name(self) -> str:
+        return "fake/slow"
+
+
+def _batch(*texts):
+    return [[{"role": "user", "content": t}] for t in texts]
+
+
+def test_results_come_back_in_request_order():
+    adapter = _SlowAdapter(delay=0.01)
+    assert generate_batch(adapter, _batch("a", "b", "c")) == ["A", "B", "C"]
+
+
+def test_calls_overlap_instead_of_serializing():
+    adapter = _SlowAdapter(delay=0.2)
+    generate_batch(adapter, _batch("a", "b", "c", "d"))
+    # Peak concurrency, not wall-clock time: a timing bound flakes on loaded CI.
+    assert adapter.peak == 4
+
+
+def test_max_concurrency_bounds_in_flight_calls():
+    adapter = _SlowAdapter(delay=0.05)
+    generate_batch(adapter, _batch(*"abcdef"), max_concurrency=2)
+    assert adapter.peak <= 2
+
+
+def test_params_reach_every_call():
+    adapter = _SlowAdapter(delay=0.0)
+    generate_batch(adapter, _batch("a", "b"), max_tokens=123, temperature=0.0)
+    assert adapter.calls == [
+        {"max_tokens": 123, "temperature": 0.0},
+        {"max_tokens": 123, "temperature": 0.0},
+    ]
+
+
+def test_a_failed_call_propagates():
+    adapter = _SlowAdapter(delay=0.0)
+    with pytest.raises(RuntimeError, match="provider failed"):
+        generate_batch(adapter, _batch("a", "boom"))
+
+
+def test_concurrent_fallback_builds_once():
+    """A CAR failure under `generate_batch` sends every worker to the fallback
+    at once; they must share one, not each build their own."""
+    from neo.adapters import AutoAdapter
+
+    class _FailingCar(_SlowAdapter):
+        def generate(self, *args, **kwargs):
+            raise RuntimeError("car down")
+
+    built = []
+
+    def factory():
+        time.sleep(0.05)  # widen the race window
+        adapter = _SlowAdapter(delay=0.0)
+        built.append(adapter)
+        return adapter
+
+    auto = AutoAdapter(_FailingCar(), factory, car_timeout=5.0)
+    assert generate_batch(auto, _batch(*"abcdef")) == list("ABCDEF")
+    assert len(built) == 1
+
+
+def test_deterministic_duplicates_are_sent_once():
+    adapter = _SlowAdapter(delay=0.0)
+    assert generate_batch(adapter, _batch("a", "b", "a"), temperature=0.0) == ["A", "B", "A"]
+    assert len(adapter.calls) == 2
+
+
+def test_sampled_duplicates_are_all_sent():
+    adapter = _SlowAdapter(delay=0.0)
+    generate_batch(adapter, _batch("a", "a"), temperature=0.7)
+    assert len(adapter.calls) == 2
@@ -283,3 +283,40 @@ class TestGoogleAdapterGenerate:
         mock_client.models.generate_content.side_effect = Exception("Network connection failed")
         with pytest.raises(ValueError, match="Network error"):
             adapter.generate(messages=[{"role": "user", "content": "Test"}])
+
+    def test_google_adapter_classifies_by_status_code(self, mock_google_genai):
+        """SDK errors carry the status as ``code``; classification must not
+        depend on the number also appearing in the message text."""
+        mock_google_genai['types'].GenerateContentConfig.return_value = Mock()
+        mock_client = Mock()
+        mock_google_genai['genai'].Client.return_value = mock_client
+
+        from neo.adapters import GoogleAdapter
+
+        adapter = GoogleAdapter(api_key="test-key", model="gemini-2.0-flash")
+
+        class _APIError(Exception):
+            def __init__(self, code, message):
+                super().__init__(message)
+                self.code = code
+
+        mock_client.models.generate_content.side_effect = _APIError(403, "PERMISSION_DENIED")
+        with pytest.raises(ValueError, match="Invalid API key"):
+            adapter.generate(messages=[{"role": "user", "content": "Test"}])
+
+        mock_client.models.generate_content.side_effect = _APIError(404, "NOT_FOUND")
+        with pytest.raises(ValueError, match="Invalid model 'gemini-2.0-flash'"):
+            adapter.generate(messages=[{"role": "user", "content": "Test"}])
+
+    def test_google_adapter_prewarm_is_bounded(self, mock_google_genai):
+        """Prewarm runs on a daemon thread; it must not wait on the SDK's
+        default timeout when the host is unreachable."""
+        mock_client = Mock()
+        mock_google_genai['genai'].Client.return_value = mock_client
+
+        from neo.adapters import GoogleAdapter, _PREWARM_TIMEOUT_S
+
+        GoogleAdapter(api_key="test-key", model="gemini-2.0-flash").prewarm()
+
+        config = mock_client.models.list.call_args.kwargs["config"]
+        assert config["http_options"]["timeout"] == int(_PREWARM_TIMEOUT_S * 1000)
@@ -328,3 +328,79 @@ def test_line_numbers(parser):
         if chunk.end_line <= len(lines):
             # Content should span from start to end line
             assert chunk.start_line <= chunk.end_line
+
+
+def test_compiled_queries_are_shared_across_parsers():
+    """A second parser reuses the queries the first one compiled."""
+    from neo.index.language_parser import precompile_all
+
+    first, second = TreeSitterParser(), TreeSitterParser()
+    first.parse_file(Path('test.py'), SAMPLE_PYTHON, 'python')
+    assert second._get_query('python', 'functions') is first._get_query('python', 'functions')
+
+    precompile_all()
+    assert ('edges', 'rust', 'imports') in second.compiled_queries
+
+
+def test_precompile_limited_to_languages(monkeypatch):
+    """precompile_all(languages) compiles only those languages' queries."""
+    from neo.index import language_parser
+
+    monkeypatch.setattr(language_parser, "_QUERY_CACHE", {})
+    language_parser.precompile_all(["go"])
+    compiled = {language for _, language, _ in language_parser._QUERY_CACHE}
+    assert compiled == {"go"}
+
+
+def test_line_numbers_count_bytes_not_characters(parser):
+    """Non-ASCII text before a construct must not shift its line numbers."""
+    source = '# héllo wörld — ünïcode\n\n\ndef after():\n    return 1\n'
+    chunks = parser.parse_file(Path('test.py'), source, 'python')
+    func = next(c for c in chunks if c.chunk_type == 'function')
+    assert (func.start_line, func.end_line) == (4, 5)
+
+
+def test_names_attach_to_innermost_construct(parser):
+    """A nested class's name belongs to it, not to the enclosing class."""
+    source = 'class Outer:\n    class Inner:\n        pass\n\nclass After:\n    pass\n'
+    chunks = parser.parse_file(Path('test.py'), source, 'python')
+    symbols = {c.chunk_id: c.symbols for c in chunks if c.chunk_type == 'class'}
+    assert symbols == {
+        'class:Outer': ['Outer'],
+        'class:Inner': ['Inner'],
+        'class:After': ['After'],
+    }
+
+
+def test_parse_file_accepts_bytes(parser):
+    """Raw file bytes parse the same as the decoded string."""
+    from_str = parser.parse_file(Path('test.py'), SAMPLE_PYTHON, 'python')
+    from_bytes = parser.parse_file(Path('test.py'), SAMPLE_PYTHON.encode('utf-8'), 'python')
+    assert [(c.chunk_id, c.start_line, c.content, c.file_hash) for c in from_bytes] == \
+        [(c.chunk_id, c.start_line, c.content, c.file_hash) for c in from_str]
+
+
+def test_concurrent_parse_matches_sequential_parse(parser):
+    """One parser shared by a thread pool (as in build_index) yields the
+    same chunks as parsing each file on its own."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = [SAMPLE_PYTHON.replace('hello_world', f'hello_{i}') for i in range(8)]
+    paths = [Path(f'mod{i}.py') for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(parser.parse_file, paths, sources))
+
+    for path, source, chunks in zip(paths, sources, results):
+        expected = parser.parse_file(path, source)
+        assert [c.chunk_id for c in chunks] == [c.chunk_id for c in expected]
+
+
+def test_long_chunk_truncated_to_max_characters(parser):
+    """Truncation counts characters, even when they are multi-byte."""
+    from neo.index.language_parser import MAX_CHUNK_LENGTH
+
+    body = "\n".join(f"    x{i} = 'ü€😀'" for i in range(MAX_CHUNK_LENGTH))
+    source = f"def big():\n{body}\n"
+    func = parser.parse_file(Path('test.py'), source, 'python')[0]
+    assert func.content == source[:MAX_CHUNK_LENGTH]
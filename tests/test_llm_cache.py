@@ -0,0 +1,224 @@
+"""Tests for the deterministic LM response cache (`neo.llm_cache`).
+
+Only temperature-0 requests may be served from the cache — anything else is
+supposed to vary between runs — and a cache failure must never break
+inference.
+"""
+
+import pytest
+
+from neo.adapters import CachingAdapter
+from neo.llm_cache import LLMCache
+from neo.models import LMAdapter
+
+
+class _CountingAdapter(LMAdapter):
+    def __init__(self, reply="answer"):
+        self.reply = reply
+        self.calls = 0
+
+    def generate(self, messages, stop=None, max_tokens=4096, temperature=0.7,
+                 reasoning_effort=None):
+        self.calls += 1
+        return self.reply
+
+    def name(self) -> str:
+        return "fake/model"
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    LLMCache.reset_stats()
+    yield
+    LLMCache.reset_stats()
+
+
+def test_round_trip_and_stats(isolate_neo_home):
+    cache = LLMCache()
+    assert cache.get("k") is None
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert (isolate_neo_home / ".neo" / "llm_cache.sqlite3").exists()
+    assert LLMCache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_expired_entries_are_misses():
+    cache = LLMCache()
+    cache.set("k", "v", ttl=-1)
+    assert cache.get("k") is None
+
+
+def test_key_covers_every_parameter():
+    base = LLMCache.request_key("openai/gpt-4", MESSAGES, None, 100, 0.0, None)
+    assert base == LLMCache.request_key("openai/gpt-4", MESSAGES, None, 100, 0.0, None)
+    assert base != LLMCache.request_key("azure/gpt-4", MESSAGES, None, 100, 0.0, None)
+    assert base != LLMCache.request_key("openai/gpt-4", MESSAGES, ["\n"], 100, 0.0, None)
+    assert base != LLMCache.request_key("openai/gpt-4", MESSAGES, None, 200, 0.0, None)
+    assert base != LLMCache.request_key("openai/gpt-4", MESSAGES, None, 100, 0.0, "high")
+
+
+def test_deterministic_requests_are_served_from_cache():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner)
+    assert adapter.generate(MESSAGES, temperature=0.0) == "answer"
+    assert adapter.generate(MESSAGES, temperature=0.0) == "answer"
+    assert inner.calls == 1
+
+
+def test_sampled_requests_always_reach_the_provider():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner)
+    adapter.generate(MESSAGES, temperature=0.7)
+    adapter.generate(MESSAGES, temperature=0.7)
+    assert inner.calls == 2
+
+
+def test_empty_responses_are_not_cached():
+    inner = _CountingAdapter(reply="")
+    adapter = CachingAdapter(inner)
+    adapter.generate(MESSAGES, temperature=0.0)
+    adapter.generate(MESSAGES, temperature=0.0)
+    assert inner.calls == 2
+
+
+def test_unwritable_cache_degrades_to_passthrough(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner, cache=LLMCache(path=blocker / "cache.sqlite3"))
+    assert adapter.generate(MESSAGES, temperature=0.0) == "answer"
+    assert adapter.generate(MESSAGES, temperature=0.0) == "answer"
+    assert inner.calls == 2
+
+
+def test_resolve_adapter_wraps_only_when_opted_in(monkeypatch):
+    from types import SimpleNamespace
+
+    from neo import adapters
+
+    monkeypatch.setattr(adapters, "create_adapter", lambda *a, **k: _CountingAdapter())
+    config = SimpleNamespace(provider="openai", model="gpt-4", api_key="k",
+                             base_url=None, inference_mode="static")
+
+    monkeypatch.delenv("NEO_LLM_CACHE", raising=False)
+    assert isinstance(adapters.resolve_adapter(config), _CountingAdapter)
+
+    monkeypatch.setenv("NEO_LLM_CACHE", "1")
+    assert isinstance(adapters.resolve_adapter(config), CachingAdapter)
+
+
+class _FakeEmbed:
+    """Maps known texts to fixed vectors; 'hi' and 'hello' are near-identical."""
+
+    VECTORS = {"hi": [1.0, 0.0], "hello": [0.99, 0.05], "bye": [0.0, 1.0]}
+
+    def __call__(self, text):
+        return self.VECTORS.get(text)
+
+
+def _semantic():
+    from neo.llm_cache import SemanticCache
+    return SemanticCache(embed=_FakeEmbed())
+
+
+def _ask(adapter, text, **kwargs):
+    return adapter.generate([{"role": "user", "content": text}], temperature=0.0, **kwargs)
+
+
+def test_paraphrased_prompt_hits_semantic_cache():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner, semantic=_semantic())
+    _ask(adapter, "hi")
+    assert _ask(adapter, "hello") == "answer"
+    assert inner.calls == 1
+
+
+def test_dissimilar_prompt_misses_semantic_cache():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner, semantic=_semantic())
+    _ask(adapter, "hi")
+    _ask(adapter, "bye")
+    assert inner.calls == 2
+
+
+def test_semantic_cache_requires_identical_prefix():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner, semantic=_semantic())
+    adapter.generate([{"role": "system", "content": "a"}, {"role": "user", "content": "hi"}],
+                     temperature=0.0)
+    adapter.generate([{"role": "system", "content": "b"}, {"role": "user", "content": "hello"}],
+                     temperature=0.0)
+    assert inner.calls == 2
+
+
+def test_semantic_cache_skipped_with_stop_sequences():
+    inner = _CountingAdapter()
+    adapter = CachingAdapter(inner, semantic=_semantic())
+    _ask(adapter, "hi", stop=["\n"])
+    _ask(adapter, "hello", stop=["\n"])
+    assert inner.calls == 2
+
+
+def test_semantic_cache_without_embedder_is_a_miss():
+    from neo.llm_cache import SemanticCache
+
+    cache = SemanticCache(embed=lambda text: None)
+    cache.set("ns", "hi", "v")
+    assert cache.get("ns", "hi") is None
+
+
+class _CountingEmbed(_FakeEmbed):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return super().__call__(text)
+
+
+def _semantic_rows(cache, namespace="ns"):
+    conn = cache._connect()
+    try:
+        return conn.execute(
+            "SELECT COUNT(*) FROM semantic WHERE namespace = ?", (namespace,)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_semantic_set_reuses_embedding_from_get():
+    from neo.llm_cache import SemanticCache
+
+    embed = _CountingEmbed()
+    cache = SemanticCache(embed=embed)
+    assert cache.get("ns", "hi") is None
+    cache.set("ns", "hi", "v")
+    assert embed.calls == 1
+
+
+def test_semantic_set_replaces_near_duplicate_row():
+    cache = _semantic()
+    cache.set("ns", "hi", "first")
+    cache.set("ns", "hello", "second")
+    cache.set("ns", "bye", "other")
+    assert _semantic_rows(cache) == 2
+    assert cache.get("ns", "hi") == "second"
+
+
+def test_semantic_rows_capped_per_namespace(monkeypatch):
+    from neo import llm_cache
+    from neo.llm_cache import SemanticCache
+
+    monkeypatch.setattr(llm_cache, "SEMANTIC_MAX_ROWS", 3)
+    vectors = {f"q{i}": [1.0 if j == i else 0.0 for j in range(5)] for i in range(5)}
+    cache = SemanticCache(embed=vectors.get)
+    for text in vectors:
+        cache.set("ns", text, text)
+    cache.set("other", "q0", "kept")
+    assert _semantic_rows(cache) == 3
+    assert cache.get("ns", "q4") == "q4"
+    assert cache.get("ns", "q0") is None
+    assert cache.get("other", "q0") == "kept"
@@ -108,7 +108,8 @@ class TestConvertEntry:
         entry = {"pattern": "test", "reasoning": "R", "suggestion": "S", "embedding": emb}
         fact = _convert_entry(entry, FactScope.GLOBAL, "org", "proj")
         assert fact.embedding is not None
-        np.testing.assert_array_almost_equal(fact.embedding, np.array(emb, dtype=np.float32))
+        expected = np.array(emb, dtype=np.float32)
+        np.testing.assert_array_almost_equal(fact.embedding, expected / np.linalg.norm(expected))
 
     def test_body_combines_fields(self):
         entry = {
@@ -192,3 +193,14 @@ class TestMigrateFromLegacy:
         corrupt.write_text("not valid json{{{")
         facts = migrate_from_legacy(corrupt, org_id="org", project_id="proj")
         assert facts == []
+
+    def test_non_finite_embedding_does_not_drop_file(self, tmp_path):
+        legacy = tmp_path / "global_memory.json"
+        legacy.write_text(json.dumps({"entries": [
+            {"pattern": "feature: a", "reasoning": "R", "embedding": [float("nan"), 1.0]},
+            {"pattern": "bugfix: b", "reasoning": "R", "embedding": [0.6, 0.8]},
+        ]}))
+        facts = migrate_from_legacy(legacy, org_id="org", project_id="proj")
+        assert len(facts) == 2
+        assert facts[0].embedding is None
+        np.testing.assert_allclose(facts[1].embedding, [0.6, 0.8], rtol=1e-6)
@@ -1,5 +1,6 @@
 """Tests for OpenAIAdapter request shaping."""
 
+import json
 import sys
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -14,7 +15,7 @@ import neo.memory.metrics  # noqa: E402,F401
 def _make_mock_response():
     return SimpleNamespace(
         status_code=200,
-        json=lambda: {
+        content=json.dumps({
             "output": [
                 {
                     "type": "message",
@@ -23,10 +24,14 @@ def _make_mock_response():
                 }
             ],
             "usage": {"input_tokens": 10, "output_tokens": 2},
-        },
+        }).encode(),
     )
 
 
+def _sent_payload(call) -> dict:
+    return json.loads(call.call_args.kwargs["content"])
+
+
 def test_gpt5_responses_payload_includes_output_controls_but_omits_temperature():
     """gpt-5*/o-series/codex on /v1/responses reject `temperature` with a 400
     ("Unsupported parameter"). Their reasoning behavior is steered by
@@ -34,7 +39,7 @@ def test_gpt5_responses_payload_includes_output_controls_but_omits_temperature()
     for these model families, even when the caller passes one."""
     mock_openai = MagicMock()
     mock_httpx = MagicMock()
-    mock_httpx.post.return_value = _make_mock_response()
+    mock_httpx.Client.return_value.post.return_value = _make_mock_response()
 
     with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
         from neo.adapters import OpenAIAdapter
@@ -48,7 +53,7 @@ def test_gpt5_responses_payload_includes_output_controls_but_omits_temperature()
         )
 
     assert result == "ok"
-    payload = mock_httpx.post.call_args.kwargs["json"]
+    payload = _sent_payload(mock_httpx.Client.return_value.post)
     assert payload["max_output_tokens"] == 1234
     assert payload["reasoning"] == {"effort": "low"}
     assert "temperature" not in payload, (
@@ -61,7 +66,7 @@ def test_responses_payload_omits_temperature_for_codex_models():
     """Same constraint applies to codex models on /v1/responses."""
     mock_openai = MagicMock()
     mock_httpx = MagicMock()
-    mock_httpx.post.return_value = _make_mock_response()
+    mock_httpx.Client.return_value.post.return_value = _make_mock_response()
 
     with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
         from neo.adapters import OpenAIAdapter
@@ -69,5 +74,134 @@ def test_responses_payload_omits_temperature_for_codex_models():
         adapter = OpenAIAdapter(model="gpt-5.3-codex", api_key="test-key")
         adapter.generate([{"role": "user", "content": "hi"}], temperature=0.7)
 
-    payload = mock_httpx.post.call_args.kwargs["json"]
+    payload = _sent_payload(mock_httpx.Client.return_value.post)
     assert "temperature" not in payload
+
+
+def test_responses_calls_reuse_one_pooled_client():
+    """Each bare `httpx.post` paid its own TCP + TLS handshake. The adapter
+    must build one keep-alive client and route every /v1/responses call
+    through it."""
+    mock_openai = MagicMock()
+    mock_httpx = MagicMock()
+    mock_httpx.Client.return_value.post.return_value = _make_mock_response()
+
+    with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
+        from neo.adapters import OpenAIAdapter
+
+        adapter = OpenAIAdapter(model="gpt-5.5", api_key="test-key")
+        adapter.generate([{"role": "user", "content": "one"}])
+        adapter.generate([{"role": "user", "content": "two"}])
+
+    mock_httpx.Client.assert_called_once()
+    assert mock_httpx.Client.call_args.kwargs["headers"]["Authorization"] == "Bearer test-key"
+    client = mock_httpx.Client.return_value
+    assert client.post.call_count == 2
+    assert client.post.call_args.args == ("/v1/responses",)
+    mock_httpx.post.assert_not_called()
+
+
+def test_responses_stream_yields_output_text_deltas():
+    """The /v1/responses SSE stream carries text in `response.output_text.delta`
+    frames; every other frame is bookkeeping and must not leak into the text."""
+    mock_openai = MagicMock()
+    mock_httpx = MagicMock()
+    response = mock_httpx.Client.return_value.stream.return_value.__enter__.return_value
+    response.status_code = 200
+    response.iter_lines.return_value = iter([
+        "event: response.created",
+        'data: {"type": "response.created"}',
+        "",
+        'data: {"type": "response.output_text.delta", "delta": "Hel"}',
+        'data: {"type": "response.output_text.delta", "delta": "lo"}',
+        'data: {"type": "response.completed", "response": {"usage": {"input_tokens": 3}}}',
+    ])
+
+    with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
+        from neo.adapters import OpenAIAdapter
+
+        adapter = OpenAIAdapter(model="gpt-5.5", api_key="test-key")
+        chunks = list(adapter.stream_generate([{"role": "user", "content": "hi"}]))
+
+    assert chunks == ["Hel", "lo"]
+    payload = _sent_payload(mock_httpx.Client.return_value.stream)
+    assert payload["stream"] is True
+    assert "temperature" not in payload
+
+
+def test_chat_stream_skips_empty_deltas():
+    mock_openai = MagicMock()
+
+    def _chunk(content):
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+    with patch.dict(sys.modules, {"openai": mock_openai}):
+        from neo.adapters import OpenAIAdapter
+
+        adapter = OpenAIAdapter(model="gpt-4o", api_key="test-key")
+        adapter.client.chat.completions.create.return_value = iter([
+            _chunk(None), _chunk("a"), _chunk(""), _chunk("b"), SimpleNamespace(choices=[]),
+        ])
+        chunks = list(adapter.stream_generate([{"role": "user", "content": "hi"}]))
+
+    assert chunks == ["a", "b"]
+    assert adapter.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+def test_chat_stream_records_usage_from_final_chunk():
+    """`generate` records token usage; a streamed call must too, from the
+    usage-only chunk `include_usage` appends."""
+    mock_openai = MagicMock()
+    usage = SimpleNamespace(prompt_tokens=7, completion_tokens=2)
+
+    with patch.dict(sys.modules, {"openai": mock_openai}):
+        from neo.adapters import OpenAIAdapter
+
+        adapter = OpenAIAdapter(model="gpt-4o", api_key="test-key")
+        adapter.client.chat.completions.create.return_value = iter([
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content="a"))], usage=None,
+            ),
+            SimpleNamespace(choices=[], usage=usage),
+        ])
+        with patch.object(adapter, "_emit_usage_metric") as emit:
+            assert list(adapter.stream_generate([{"role": "user", "content": "hi"}])) == ["a"]
+
+    kwargs = adapter.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream_options"] == {"include_usage": True}
+    emit.assert_called_once_with(usage)
+
+
+def test_close_releases_pooled_client():
+    """Throwaway adapters (e.g. an AutoAdapter fallback) must not leak their
+    keep-alive sockets until garbage collection."""
+    mock_openai = MagicMock()
+    mock_httpx = MagicMock()
+    mock_httpx.Client.return_value.post.return_value = _make_mock_response()
+
+    with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
+        from neo.adapters import OpenAIAdapter
+
+        with OpenAIAdapter(model="gpt-5.5", api_key="test-key") as adapter:
+            adapter.generate([{"role": "user", "content": "hi"}])
+        adapter.close()  # idempotent
+
+    mock_httpx.Client.return_value.close.assert_called_once()
+    assert adapter._http is None
+
+
+def test_prewarm_opens_the_pooled_responses_client():
+    """The warmed socket must live in the same pool `generate` posts through."""
+    mock_openai = MagicMock()
+    mock_httpx = MagicMock()
+    mock_httpx.Client.return_value.post.return_value = _make_mock_response()
+
+    with patch.dict(sys.modules, {"openai": mock_openai, "httpx": mock_httpx}):
+        from neo.adapters import OpenAIAdapter
+
+        adapter = OpenAIAdapter(model="gpt-5.5", api_key="test-key")
+        adapter.prewarm()
+        adapter.generate([{"role": "user", "content": "hi"}])
+
+    assert mock_httpx.Client.call_count == 1
+    mock_httpx.Client.return_value.head.assert_called_once()
@@ -0,0 +1,272 @@
+"""Tests for the prompt knowledge base and the PromptSystem facade."""
+
+import json
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from neo.prompt import _PATTERN_EXTRACTION_SOURCE, PromptSystem
+from neo.prompt.analyzer import PromptEffectivenessScore, PromptPattern
+from neo.prompt.change_detector import ChangeDetector
+from neo.prompt.knowledge_base import PromptKnowledgeBase
+from neo.prompt.scanner import _encode_project_path
+
+
+def _score(prompt_hash: str, score: float, text: str = "") -> PromptEffectivenessScore:
+    return PromptEffectivenessScore(
+        prompt_hash=prompt_hash,
+        prompt_text=text or f"prompt {prompt_hash}",
+        score=score,
+        signals=[],
+        iterations_to_complete=1,
+        tool_calls=0,
+        sample_count=1,
+        confidence=0.5,
+    )
+
+
+def _pattern(pattern_id: str, effectiveness: float) -> PromptPattern:
+    return PromptPattern(
+        pattern_id=pattern_id,
+        name=pattern_id,
+        description="",
+        template="fix {thing}",
+        effectiveness_score=effectiveness,
+    )
+
+
+def _assert_indexes_match_scan(kb: PromptKnowledgeBase) -> None:
+    """Every index lookup agrees with a linear scan of `entries`."""
+    for entry_type in ("pattern", "score", "evolution", "suggestion"):
+        scanned = [e.id for e in kb.entries if e.entry_type == entry_type]
+        assert [e.id for e in kb._of_type(entry_type)] == scanned
+
+    first_by_hash = {}
+    for e in kb.entries:
+        if e.entry_type == "score":
+            first_by_hash.setdefault(e.data["prompt_hash"], e)
+    assert {h: e.id for h, e in kb._scores_by_hash.items()} == {
+        h: e.id for h, e in first_by_hash.items()
+    }
+    for entry in kb._scores_by_hash.values():
+        assert any(entry is e for e in kb.entries)
+
+    scores = [e for e in kb.entries if e.entry_type == "score"]
+    assert [e.id for e in kb.iter_scores_above(0.7)] == [
+        e.id for e in scores if e.data["score"] > 0.7
+    ]
+    assert kb.last_score_update() == max((e.updated_at for e in scores), default=None)
+
+
+class TestKnowledgeBaseIndexes:
+    def test_empty_knowledge_base(self):
+        kb = PromptKnowledgeBase()
+        _assert_indexes_match_scan(kb)
+        assert kb.last_score_update() is None
+
+    def test_indexes_match_scan_after_adds_and_aggregation(self):
+        kb = PromptKnowledgeBase()
+        kb.update_effectiveness_scores([_score("a", 0.9), _score("b", 0.2), _score("c", 0.8)])
+        kb.add_patterns([_pattern("p1", 0.4), _pattern("p2", 0.9)])
+        kb.add_suggestion({"target": "/repo", "text": "be specific"})
+        _assert_indexes_match_scan(kb)
+
+        # Re-aggregating "a" pulls it below the threshold and bumps updated_at.
+        before = kb.last_score_update()
+        kb.update_effectiveness_score(_score("a", 0.1))
+        _assert_indexes_match_scan(kb)
+        assert kb._scores_by_hash["a"].data["score"] == 0.5
+        assert kb.last_score_update() >= before
+        assert kb.last_score_update() == kb._scores_by_hash["a"].updated_at
+
+    def test_indexes_match_scan_after_save_load_round_trip(self):
+        kb = PromptKnowledgeBase()
+        kb.update_effectiveness_scores([_score("a", 0.9), _score("b", 0.75)])
+        kb.add_patterns([_pattern("p1", 0.4), _pattern("p2", 0.9)])
+        kb.update_effectiveness_score(_score("b", 0.95))
+
+        reloaded = PromptKnowledgeBase()
+        assert [e.id for e in reloaded.entries] == [e.id for e in kb.entries]
+        _assert_indexes_match_scan(reloaded)
+        assert reloaded._scores_by_hash["b"].data["sample_count"] == 2
+        assert [e.id for e in reloaded.top_patterns(1)] == [
+            e.id for e in kb.entries if e.data.get("pattern_id") == "p2"
+        ]
+
+
+class TestKnowledgeBaseBatches:
+    def test_score_batch_aggregates_duplicates_with_one_write(self):
+        kb = PromptKnowledgeBase()
+        batch = [_score("dup", 0.9), _score("dup", 0.3), _score("solo", 0.7),
+                 _score("dup", 0.3)]
+
+        with patch("os.rename", wraps=os.rename) as rename:
+            kb.update_effectiveness_scores(batch)
+
+        assert rename.call_count == 1
+        dup = kb._scores_by_hash["dup"].data
+        # Weighted running average, as the single-score path computes it:
+        # 0.9 -> (0.9 + 0.3) / 2 = 0.6 -> (0.6 * 2 + 0.3) / 3 = 0.5
+        assert dup["score"] == pytest.approx(0.5)
+        assert dup["sample_count"] == 3
+        assert dup["confidence"] == pytest.approx(0.7)
+        assert len(kb._of_type("score")) == 2
+
+        reloaded = PromptKnowledgeBase()._scores_by_hash["dup"].data
+        assert reloaded["score"] == pytest.approx(0.5)
+        assert reloaded["sample_count"] == 3
+
+    def test_batch_matches_one_score_at_a_time(self, tmp_path, monkeypatch):
+        batch = [_score("dup", 0.9), _score("dup", 0.3), _score("dup", -0.2)]
+
+        monkeypatch.setattr(PromptKnowledgeBase, "STORAGE_FILE", tmp_path / "batched.json")
+        batched = PromptKnowledgeBase()
+        batched.update_effectiveness_scores(batch)
+
+        monkeypatch.setattr(PromptKnowledgeBase, "STORAGE_FILE", tmp_path / "single.json")
+        single = PromptKnowledgeBase()
+        for score in batch:
+            single.update_effectiveness_score(score)
+
+        assert batched._scores_by_hash["dup"].data == single._scores_by_hash["dup"].data
+
+    def test_pattern_batch_writes_once(self):
+        kb = PromptKnowledgeBase()
+        with patch("os.rename", wraps=os.rename) as rename:
+            kb.add_patterns([_pattern("p1", 0.4), _pattern("p2", 0.9), _pattern("p3", 0.6)])
+            kb.add_patterns([])
+
+        assert rename.call_count == 1
+        assert len(PromptKnowledgeBase()._of_type("pattern")) == 3
+
+
+def _seed_effective_scores(kb: PromptKnowledgeBase, n: int = 5) -> None:
+    kb.update_effectiveness_scores(
+        [_score(f"h{i}", 0.9, f"fix the bug in module {i}") for i in range(n)]
+    )
+
+
+class TestPatternExtractionWatermark:
+    @pytest.fixture
+    def system(self, monkeypatch):
+        system = PromptSystem()
+        calls = []
+
+        def extract(scores):
+            calls.append(len(scores))
+            return [_pattern(f"p{len(calls)}", 0.9)]
+
+        monkeypatch.setattr(system._analyzer, "extract_patterns", extract)
+        system.extract_calls = calls
+        return system
+
+    def test_rescan_without_score_updates_skips_extraction(self, system):
+        _seed_effective_scores(system._knowledge_base)
+
+        first = system.incremental_scan()
+        second = system.incremental_scan()
+
+        assert first["patterns_extracted"] == 1
+        assert second["patterns_extracted"] == 0
+        assert system.extract_calls == [5]
+        assert second["errors"] == []
+
+    def test_score_update_reruns_extraction(self, system):
+        kb = system._knowledge_base
+        _seed_effective_scores(kb)
+        system.incremental_scan()
+
+        kb.update_effectiveness_score(_score("h0", 0.8))
+        rerun = system.incremental_scan()
+
+        assert rerun["patterns_extracted"] == 1
+        assert system.extract_calls == [5, 5]
+        watermark = system._change_detector.get_watermark(_PATTERN_EXTRACTION_SOURCE)
+        assert watermark.timestamp == kb.last_score_update()
+
+    def test_watermark_not_advanced_when_add_patterns_fails(self, system, monkeypatch):
+        kb = system._knowledge_base
+        _seed_effective_scores(kb)
+
+        def fail(patterns):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(kb, "add_patterns", fail)
+        failed = system.incremental_scan()
+
+        assert failed["patterns_extracted"] == 0
+        assert any("disk full" in e for e in failed["errors"])
+        assert system._change_detector.get_watermark(_PATTERN_EXTRACTION_SOURCE) is None
+        # The watermark is persisted, so a fresh detector agrees.
+        assert ChangeDetector().get_watermark(_PATTERN_EXTRACTION_SOURCE) is None
+
+        monkeypatch.delattr(kb, "add_patterns")
+        retried = system.incremental_scan()
+        assert retried["patterns_extracted"] == 1
+
+
+def _write_session(project_dir, name: str, prompts: list[str], mtime: float) -> None:
+    lines = []
+    for i, prompt in enumerate(prompts):
+        lines.append({"role": "user", "content": prompt,
+                      "timestamp": f"2026-01-01T10:{i:02d}:00Z"})
+        reply = "I'm not sure what you mean" if "vague" in prompt else "Done, tests pass."
+        lines.append({"role": "assistant", "content": reply,
+                      "timestamp": f"2026-01-01T10:{i:02d}:30Z"})
+    path = project_dir / f"{name}.jsonl"
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    os.utime(path, (mtime, mtime))
+
+
+def _analyze_from_list(system: PromptSystem, project: str, since: str) -> dict:
+    """analyze()'s counts computed the old way, from the materialized list."""
+    sessions = system._scanner.scan_sessions(project=project, since=datetime.fromisoformat(since))
+    scores = [s for session in sessions for s in system._analyzer.analyze_session(session)]
+    return {
+        "total_sessions": len(sessions),
+        "total_prompts": len(scores),
+        "avg_effectiveness": sum(s.score for s in scores) / len(scores) if scores else 0.0,
+    }
+
+
+class TestAnalyzeStreaming:
+    SINCE = "2025-01-01"
+
+    @pytest.fixture
+    def project(self, isolate_neo_home):
+        project = "/work/repo"
+        project_dir = isolate_neo_home / ".claude" / "projects" / _encode_project_path(project)
+        project_dir.mkdir(parents=True)
+        old = datetime(2024, 6, 1).timestamp()
+        new = datetime(2026, 1, 1).timestamp()
+        _write_session(project_dir, "old", ["fix the login bug"], old)
+        _write_session(project_dir, "a", ["add a retry to the client", "vague thing"], new)
+        _write_session(project_dir, "b", ["vague request", "rename the config loader"], new)
+        _write_session(project_dir, "c", ["write tests for the parser"], new)
+        return project
+
+    def test_counts_match_list_based_analysis(self, project):
+        system = PromptSystem()
+        result = system.analyze(project=project, since=self.SINCE)
+        expected = _analyze_from_list(system, project, self.SINCE)
+
+        assert expected["total_sessions"] == 3
+        assert expected["total_prompts"] == 5
+        assert result["total_sessions"] == expected["total_sessions"]
+        assert result["total_prompts"] == expected["total_prompts"]
+        assert result["avg_effectiveness"] == pytest.approx(expected["avg_effectiveness"])
+        assert {"signal": "claude_confused", "count": 2} in result["common_issues"]
+
+    def test_empty_project(self, project, isolate_neo_home):
+        empty = "/work/empty"
+        (isolate_neo_home / ".claude" / "projects" / _encode_project_path(empty)).mkdir()
+        system = PromptSystem()
+
+        for name in (empty, "/work/missing"):
+            result = system.analyze(project=name, since=self.SINCE)
+            assert result["total_sessions"] == 0
+            assert result["total_prompts"] == 0
+            assert result["avg_effectiveness"] == 0.0
+            assert result["common_issues"] == []
@@ -0,0 +1,79 @@
+"""Tests for bounded provider retries (`neo.retry`)."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from neo.retry import call_with_retry, retry_after_seconds
+
+
+class _StatusError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"status {status}")
+        self.status_code = status
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _response(status, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _sequence(*outcomes):
+    it = iter(outcomes)
+
+    def fn():
+        outcome = next(it)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return fn
+
+
+def test_retries_transient_errors_until_success():
+    sleeps = []
+    fn = _sequence(_StatusError(503), _StatusError(429), "ok")
+    assert call_with_retry(fn, sleep=sleeps.append) == "ok"
+    assert len(sleeps) == 2
+
+
+def test_retries_retryable_responses_and_returns_the_last_one():
+    sleeps = []
+    fn = _sequence(*[_response(502)] * 3)
+    assert call_with_retry(fn, max_attempts=3, sleep=sleeps.append).status_code == 502
+    assert len(sleeps) == 2
+
+
+def test_client_errors_are_not_retried():
+    sleeps = []
+    with pytest.raises(_StatusError):
+        call_with_retry(_sequence(_StatusError(400), "ok"), sleep=sleeps.append)
+    assert sleeps == []
+
+
+def test_errors_without_a_status_are_not_retried():
+    with pytest.raises(ValueError):
+        call_with_retry(_sequence(ValueError("bad"), "ok"), sleep=lambda s: None)
+
+
+def test_retry_after_is_a_floor_on_the_delay():
+    sleeps = []
+    fn = _sequence(_StatusError(429, {"retry-after": "3"}), "ok")
+    call_with_retry(fn, base=0.01, cap=0.02, sleep=sleeps.append)
+    assert sleeps == [3.0]
+
+
+def test_gives_up_when_the_wait_budget_is_spent():
+    sleeps = []
+    fn = _sequence(_StatusError(429, {"retry-after": "30"}), "ok")
+    with pytest.raises(_StatusError):
+        call_with_retry(fn, max_wait=10.0, sleep=sleeps.append)
+    assert sleeps == []
+
+
+def test_retry_after_formats():
+    assert retry_after_seconds(_response(429, {"retry-after-ms": "1500"})) == 1.5
+    assert retry_after_seconds(_response(429, {"retry-after": "2"})) == 2.0
+    assert retry_after_seconds(_response(429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(_response(429, {"retry-after": "soon"})) is None
+    assert retry_after_seconds(_response(429)) is None
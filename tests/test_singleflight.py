@@ -0,0 +1,82 @@
+"""Tests for in-flight deduplication (`neo.singleflight`)."""
+
+import threading
+
+import pytest
+
+from neo.adapters import CachingAdapter
+from neo.llm_cache import LLMCache
+from neo.models import LMAdapter
+from neo.singleflight import SingleFlight
+
+
+def _run_concurrently(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    threading.Timer(0.2, release.set).start()
+    _run_concurrently(4, lambda: results.append(flight.do("k", work)))
+
+    assert len(calls) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 3
+    assert flight.in_flight() == 0
+
+
+def test_key_is_forgotten_after_the_call():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == (1, False)
+    assert flight.do("k", lambda: 2) == (2, False)
+
+
+def test_errors_reach_the_caller():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("provider failed")
+
+    with pytest.raises(RuntimeError, match="provider failed"):
+        flight.do("k", boom)
+    assert flight.in_flight() == 0
+
+
+class _GatedAdapter(LMAdapter):
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    def generate(self, messages, stop=None, max_tokens=4096, temperature=0.7,
+                 reasoning_effort=None):
+        self.calls += 1
+        self.release.wait(5)
+        return "answer"
+
+    def name(self) -> str:
+        return "fake/gated"
+
+
+def test_caching_adapter_collapses_concurrent_misses(tmp_path):
+    inner = _GatedAdapter()
+    adapter = CachingAdapter(inner, cache=LLMCache(path=tmp_path / "c.sqlite3"))
+    messages = [{"role": "user", "content": "hi"}]
+    results = []
+
+    threading.Timer(0.2, inner.release.set).start()
+    _run_concurrently(4, lambda: results.append(adapter.generate(messages, temperature=0.0)))
+
+    assert results == ["answer"] * 4
+    assert inner.calls == 1